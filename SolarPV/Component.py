@@ -3,6 +3,7 @@
 """
 Created on Tue Sep 18 19:06:23 2018
 Modified on 02/22/2019 for version 0.1.0
+Modified on 10/17/2026 to report attribute changes to the master
 
 @author: Bob Hentz
 
@@ -20,6 +21,14 @@ Modified on 02/22/2019 for version 0.1.0
  -------------------------------------------------------------------------------
 """
 
+def same_value(old, new):
+    """ Test if an attribute value is unchanged """
+    try:
+        return bool(old == new)
+    except (TypeError, ValueError):
+        return False
+
+
 class Component():
     
     def __init__(self, master, Component_Name, **kargs):
@@ -124,12 +133,22 @@ class Component():
         """ Set Contents of Attribute defined by attr to val
             Return True if value set, else False   """
         if attr in self.args:
+            old = self.read_attrb(attr)
             self.args[attr].write_data(val)
+            if not same_value(old, self.read_attrb(attr)):
+                self.attribute_changed(attr)
             return True
         em = '{0} does not support attribute {1}'.format(self.name, attr)
         raise AttributeError(em)
         return False
 
+    def attribute_changed(self, attr):
+        """ Notify the master (if it tracks changes) that attr has a new
+            value """
+        notify = getattr(self.master, 'component_changed', None)
+        if notify is not None:
+            notify(self, attr)
+
     def check_arg_definition(self):
         """ Unique to each Component """
         """ Verifies the component has been properly defined """
@@ -7,6 +7,8 @@ Modified   Tue Dec  4 2018 (fix Load Import Error Issue #11)
 Modified on 02/22/2019 for version 0.1.0
 Modified on 04/11/2021 to address Issues #10, 12, & 13 related to improving 
             Site Load Definition performance and ease of use
+Modified on 10/17/2026 to track changes to the frame contents
+Modified on 10/17/2026 to hold the contents in column lists
 
 @author: Bob Hentz
 
@@ -28,45 +30,74 @@ import pandas as pd
 
 
 class DataFrame:
-    """ Methods for manipulating Pandas dataFrame structures """
+    """ Methods for manipulating table structures, the contents are held
+        column by column in lists and a Pandas DataFrame view is built
+        only when requested """
     def __init__(self, col_hds, col_typs):
         assert len(col_hds) == len(col_typs)
         self.col_hds = col_hds
         self.col_typs = col_typs
-        self.df = pd.DataFrame(None, None, self.col_hds)
+        self.cols = {hd: list() for hd in self.col_hds}
+        self.version = 0    # incremented whenever the frame contents change
+        self.view = None    # DataFrame view of the contents
+        self.view_version = None
+
+    def mark_changed(self):
+        """ Record a change to the frame contents """
+        self.version += 1
+
+    def get_version(self):
+        """ Return the change count of the frame contents, used by
+            derived classes to recognize stale cached results """
+        return self.version
+
+    def coerce_row(self, rw_vals):
+        """ Return rw_vals with entries coerced to the correct type """
+        assert len(rw_vals) == len(self.col_hds), 'Len rw_vals = {0}, Len Col Hds = {1}'.format(len(rw_vals), len(self.col_hds))
+        ar = []
+        for itm in enumerate(self.col_typs):
+            if rw_vals[itm[0]] is None or rw_vals[itm[0]] == "":
+                ar.append("")
+            else:
+                ar.append(itm[1](rw_vals[itm[0]]))
+        return ar
 
     def add_new_row(self, rw_vals):
         """ Add new row to DataFrame and coerce entries to correct type """
-        assert len(rw_vals) == len(self.col_hds), 'Len rw_vals = {0}, Len Col Hds = {1}'.format(len(rw_vals), len(self.col_hds))
-        ind = dict()
-        for itm in enumerate(self.col_hds):
-            if rw_vals[itm[0]] == None or rw_vals[itm[0]] == "":
-                ind[itm[1]] = ""
-            else:
-                ind[itm[1]] = self.col_typs[itm[0]](rw_vals[itm[0]])
-        self.df = self.df.append(ind, True)
+        self.add_rows([rw_vals])
+
+    def add_rows(self, rows):
+        """ Add a list of new rows to the DataFrame, coercing entries
+            to the correct type """
+        for rw in rows:
+            for hd, val in zip(self.col_hds, self.coerce_row(rw)):
+                self.cols[hd].append(val)
+        self.mark_changed()
 
     def delete_row(self, rwid):
         """ Delete a row from the dataframe """
-        assert rwid < self.df.shape[0]
-        self.df.drop(self.df.index[rwid], inplace=True)
-        
+        assert rwid < self.get_row_count()
+        for hd in self.col_hds:
+            del self.cols[hd][rwid]
+        self.mark_changed()
+
     def set_cell_value(self, pos, val):
         """ Update a DataFrame cell value pos = [row,col]  """
-        sh = self.df.shape
+        sh = self.get_shape()
         row = pos[0]
         col = pos[1]
         if row < sh[0] and pos[1] < sh[1]:
             if val == "":
-                self.df.at[row, self.col_hds[col]] = val
+                self.cols[self.col_hds[col]][row] = val
             else:
-                self.df.at[row, self.col_hds[col]] = self.col_typs[col](val)
+                self.cols[self.col_hds[col]][row] = self.col_typs[col](val)
+            self.mark_changed()
             return True
         return False
 
     def update_row_values(self, rwid, val_list):
         """ Update the contents of the frame row  """
-        assert rwid < self.df.shape[0]
+        assert rwid < self.get_row_count()
         for colid, val in enumerate(val_list):
             self.set_cell_value([rwid, colid], val)
         
@@ -74,25 +105,32 @@ class DataFrame:
 
     def get_row_count(self):
         """ Return the row size of the DataFrame """
-        return self.df.shape[0]
+        return len(self.cols[self.col_hds[0]])
 
     def get_shape(self):
         """ Returns tuple of (Rows, Columns) in data frame"""
-        return self.df.shape
+        return (self.get_row_count(), len(self.col_hds))
 
     def get_dataframe(self):
-        """ Return the DataFrame """
-        return self.df
+        """ Return a DataFrame view of the contents """
+        if self.view is None or self.view_version != self.version:
+            self.view = pd.DataFrame(self.cols, columns= self.col_hds)
+            self.view_version = self.version
+        return self.view
+
+    def get_column(self, col_hd):
+        """ Return the list of values held in column col_hd """
+        return self.cols[col_hd]
 
     def get_row_by_index(self, i):
         """ Return the ith row of the DataFrame """
         if i < self.get_row_count():
-            return list(self.df.iloc[i].values)
+            return [self.cols[hd][i] for hd in self.col_hds]
         return []
 
     def drop_row_by_index(self, i):
         """ Update DataFrame by Dropping the row at specified index """
-        self.df.drop(self.df.index[i], inplace=True)
+        self.delete_row(i)
 
     def get_headers(self):
         """ Return a list of Column Headings """
@@ -112,31 +150,30 @@ class DataFrame:
 
     def purge_frame(self):
         """ Clear existing load definition data from the underlying DataFrame"""
-        self.df = pd.DataFrame(None, None, self.col_hds)
+        self.cols = {hd: list() for hd in self.col_hds}
+        self.mark_changed()
 
     def export_frame(self):
         """ create a dict of DataFrame contents keyed to Rows
             used to save the dataframe contents but not the class code"""
-        return self.df.to_dict('Index')
+        return {r: {hd: self.cols[hd][r] for hd in self.col_hds}
+                for r in range(self.get_row_count())}
 
     def import_frame(self, dfInput):
         """ Rebuild  DataFrame contents from imported data"""
-
+        dflts = []
+        for typ in self.col_typs:
+            if typ is str:
+                dflts.append("")
+            elif typ is int:
+                dflts.append(0)
+            else:
+                dflts.append(0.0)
         rws = list(dfInput.keys())
         rws.sort()
-        for rw in rws:
-            rwDict = dfInput[rw]
-            ar = []
-            for i in range(len(self.col_hds)):
-                dfval = None
-                if self.col_typs[i] is str:
-                    dfval = ""
-                elif self.col_typs[i] is int:
-                    dfval = 0
-                else:
-                    dfval = 0.0
-                ar.append(rwDict.pop(self.col_hds[i], dfval))
-            self.add_new_row(ar)
+        self.add_rows([[dfInput[rw].get(hd, dv)
+                        for hd, dv in zip(self.col_hds, dflts)]
+                       for rw in rws])
 
 
     def __str__(self):
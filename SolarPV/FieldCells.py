@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 23:05:44 2026
+
+@author: Bob Hentz
+
+-------------------------------------------------------------------------------
+  Name:        FieldCells.py
+  Purpose:     Provides the entry widgets used by the data forms to display
+               & update the data fields of FieldClasses, kept apart so
+               that the fields can be used without tkinter
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+from tkinter import *
+import tkinter.ttk as ttk
+from FieldClasses import build_args
+
+class data_cell(ttk.Entry):
+    """ Creates an Entry Field widget for displaying & updating a data field
+        kargs include standard ttk.tkinter arguments plus:
+            On_change - defines method to externally process changes
+    """
+    def __init__(self, parent_frame, data_src, **kargs):
+        self.parent = parent_frame
+        self.src = data_src
+        self.kargs = kargs
+        self.val = StringVar()
+        self.set_val()
+        self.show_field()
+        
+    def show_field(self):
+        """ Display The Frame """  
+        fargs, gargs = build_args(self.kargs)
+        self.chg_cmd = fargs.pop('On_change', None)
+        fargs['textvariable'] = self.val        
+        ttk.Entry.__init__(self, self.parent, **fargs)
+        self.grid(**gargs)
+        self.bind('<Enter>', self.on_enter)
+        self.bind('<Leave>', self.on_leave)
+      
+    def get_val(self):
+        """ Method to get the contents of cell """
+        return self.val.get()
+
+    def set_val(self):
+        if self.src.get_data_type() is float:
+            self.val.set(self.src.read_data())     
+        else:
+            self.val.set(self.src.read_data())
+        
+    def on_enter(self, event):
+        pass
+               
+    def on_leave(self, event):
+        """ Method to process cell content changes """
+        val = self.get_val()
+        if val is not self.src.read_data():
+            if self.chg_cmd is not None:
+                self.chg_cmd(self.src.get_name(), val)
+            self.src.write_data(val)
+                  
+class list_cell(ttk.Combobox):
+    """ Creates an Option List Field widget for displaying & updating source data 
+        kargs include standard ttk.tkinter arguments Plus:
+            On_change - defines method to externally process changes
+    """
+    def __init__(self, parent_frame, data_src, **kargs):
+        self.parent = parent_frame
+        self.src = data_src
+        self.kargs = kargs
+        self.val = StringVar()
+        self.set_val()
+        self.show_field()
+        
+    def show_field(self):
+        """ Display The Frame """              
+        fargs, gargs = build_args(self.kargs)
+        self.chg_cmd = fargs.pop('On_change', None)
+        fargs['textvariable'] = self.val
+        fargs['values'] = self.src.get_list()
+        if not 'postcommand' in fargs:
+            fargs['postcommand'] = self.on_click
+        ttk.Combobox.__init__(self, self.parent, **fargs)
+        self.grid(**gargs)
+#        self.bind('<Enter>', self.on_enter)
+        self.bind('<Leave>', self.on_leave)
+
+    def on_click(self):
+        """ invoked when dropdown arrow is clicked """
+        # self['values'] = list(filter(lambda x: x.startswith(self.val.get()),
+        #                                        self.src.get_list()))
+        pass
+        
+    def get_val(self):
+        """ Method to get the contents of cell """
+        return self.val.get()
+
+    def set_val(self):
+        """ Sets value of underlying data source """
+        self.val.set(self.src.read_data())
+               
+    def on_leave(self, event):
+        """ Method to process cell content changes """
+        val = self.get_val()
+        if val is not self.src.read_data():
+            if self.chg_cmd is not None:
+                self.chg_cmd(self.src.get_name(), val)
+            self.src.write_data(val)
+
+class note_cell(Text):
+    """ Creates an Note Field widget for displaying & updating source data 
+        kargs include standard ttk.tkinter arguments plus:
+            On_change - defines method to externally process changes
+    """
+    def __init__(self, parent_frame, data_src, **kargs): 
+        self.parent = parent_frame
+        self.src = data_src
+        self.show_field
+
+    def show_field(self):
+        """ Display The Frame """              
+        fargs, gargs = build_args(self.kargs)
+        self.chg_cmd = fargs.pop('On_change', None)
+        fargs['textvariable'] = self.val
+        fargs['values'] = list(filter(lambda x: x.startswith(self.val.get()), 
+                                               self.opts))
+        Text.__init__(self, self.parent, **fargs)
+        self.grid(**gargs)
+        self.insert('1.0', self.src.read_data())
+        self.bind('<Leave>', self.on_chg)
+
+
+    def get_val(self):
+        return self.get('1.0', END+'-1c')
+
+    def on_chg(self, event):
+        """ Method to process cell content changes """
+        val = self.get_val()
+        if val is not self.src.read_data():
+            if self.chg_cmd is not None:
+                self.chg_cmd(self.src.get_name(), val)
+            else:
+                self.src.write_data(val)
+
+
+def main():
+    print ('Field Cells says - Hello World')
+
+
+if __name__ == '__main__':
+    main()
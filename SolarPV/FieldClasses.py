@@ -3,6 +3,7 @@
 """
 Created on Fri Sep 21 12:20:27 2018
 Modified on 02/22/2019 for version 0.1.0
+Modified on 10/17/2026 to move the entry widgets to FieldCells
 
 @author: Bob Hentz
 
@@ -19,9 +20,6 @@ Modified on 02/22/2019 for version 0.1.0
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import *
-import tkinter.ttk as ttk
-import guiFrames as tbf
 
 GRID_ARGS = ['column','columnspan', 'in_', 'ipadx', 'ipady',
              'padx', 'pady', 'row', 'rowspan', 'sticky']
@@ -128,135 +126,6 @@ class option_field(data_field):
         return self.osrc
         
 
-class data_cell(ttk.Entry):
-    """ Creates an Entry Field widget for displaying & updating a data field
-        kargs include standard ttk.tkinter arguments plus:
-            On_change - defines method to externally process changes
-    """
-    def __init__(self, parent_frame, data_src, **kargs):
-        self.parent = parent_frame
-        self.src = data_src
-        self.kargs = kargs
-        self.val = StringVar()
-        self.set_val()
-        self.show_field()
-        
-    def show_field(self):
-        """ Display The Frame """  
-        fargs, gargs = build_args(self.kargs)
-        self.chg_cmd = fargs.pop('On_change', None)
-        fargs['textvariable'] = self.val        
-        ttk.Entry.__init__(self, self.parent, **fargs)
-        self.grid(**gargs)
-        self.bind('<Enter>', self.on_enter)
-        self.bind('<Leave>', self.on_leave)
-      
-    def get_val(self):
-        """ Method to get the contents of cell """
-        return self.val.get()
-
-    def set_val(self):
-        if self.src.get_data_type() is float:
-            self.val.set(self.src.read_data())     
-        else:
-            self.val.set(self.src.read_data())
-        
-    def on_enter(self, event):
-        pass
-               
-    def on_leave(self, event):
-        """ Method to process cell content changes """
-        val = self.get_val()
-        if val is not self.src.read_data():
-            if self.chg_cmd is not None:
-                self.chg_cmd(self.src.get_name(), val)
-            self.src.write_data(val)
-                  
-class list_cell(ttk.Combobox):
-    """ Creates an Option List Field widget for displaying & updating source data 
-        kargs include standard ttk.tkinter arguments Plus:
-            On_change - defines method to externally process changes
-    """
-    def __init__(self, parent_frame, data_src, **kargs):
-        self.parent = parent_frame
-        self.src = data_src
-        self.kargs = kargs
-        self.val = StringVar()
-        self.set_val()
-        self.show_field()
-        
-    def show_field(self):
-        """ Display The Frame """              
-        fargs, gargs = build_args(self.kargs)
-        self.chg_cmd = fargs.pop('On_change', None)
-        fargs['textvariable'] = self.val
-        fargs['values'] = self.src.get_list()
-        if not 'postcommand' in fargs:
-            fargs['postcommand'] = self.on_click
-        ttk.Combobox.__init__(self, self.parent, **fargs)
-        self.grid(**gargs)
-#        self.bind('<Enter>', self.on_enter)
-        self.bind('<Leave>', self.on_leave)
-
-    def on_click(self):
-        """ invoked when dropdown arrow is clicked """
-        # self['values'] = list(filter(lambda x: x.startswith(self.val.get()),
-        #                                        self.src.get_list()))
-        pass
-        
-    def get_val(self):
-        """ Method to get the contents of cell """
-        return self.val.get()
-
-    def set_val(self):
-        """ Sets value of underlying data source """
-        self.val.set(self.src.read_data())
-               
-    def on_leave(self, event):
-        """ Method to process cell content changes """
-        val = self.get_val()
-        if val is not self.src.read_data():
-            if self.chg_cmd is not None:
-                self.chg_cmd(self.src.get_name(), val)
-            self.src.write_data(val)
-
-class note_cell(Text):
-    """ Creates an Note Field widget for displaying & updating source data 
-        kargs include standard ttk.tkinter arguments plus:
-            On_change - defines method to externally process changes
-    """
-    def __init__(self, parent_frame, data_src, **kargs): 
-        self.parent = parent_frame
-        self.src = data_src
-        self.show_field
-
-    def show_field(self):
-        """ Display The Frame """              
-        fargs, gargs = build_args(self.kargs)
-        self.chg_cmd = fargs.pop('On_change', None)
-        fargs['textvariable'] = self.val
-        fargs['values'] = list(filter(lambda x: x.startswith(self.val.get()), 
-                                               self.opts))
-        Text.__init__(self, self.parent, **fargs)
-        self.grid(**gargs)
-        self.insert('1.0', self.src.read_data())
-        self.bind('<Leave>', self.on_chg)
-
-
-    def get_val(self):
-        return self.get('1.0', END+'-1c')
-
-    def on_chg(self, event):
-        """ Method to process cell content changes """
-        val = self.get_val()
-        if val is not self.src.read_data():
-            if self.chg_cmd is not None:
-                self.chg_cmd(self.src.get_name(), val)
-            else:
-                self.src.write_data(val)
-
-
-
 def main():
     print ('Field Classes says - Hello World')
     battery_types = {'FLA':('Flooded Lead Acid', 0.90),
@@ -3,6 +3,7 @@
 """
 Created on Sat Sep 22 12:59:16 2018
 Modified on 02/22/2019 for version 0.1.0
+Modified on 10/17/2026 to take the entry widgets from FieldCells
 
 @author: Bob Hentz
 
@@ -22,7 +23,8 @@ Modified on 02/22/2019 for version 0.1.0
 
 from tkinter import *
 import tkinter.ttk as ttk
-from FieldClasses import build_args, data_cell, list_cell
+from FieldClasses import build_args
+from FieldCells import data_cell, list_cell
 
 """ Class for generating Display of Componet Specification Form  """
 class DataForm(ttk.Frame):
@@ -4,6 +4,10 @@
 Created on Thu Apr 26 19:11:58 2018
 Modified on 02/22/2019 for version 0.1.0
 Modified on 02/04/2021 to simplify the logic and make better use of Pandas methods
+Modified on 10/17/2026 to cache the retrieved statistics on disk
+Modified on 10/17/2026 to add pooled, parallel bulk retrieval of site data
+Modified on 10/17/2026 to allow the API URL to be configured
+Modified on 10/17/2026 to reduce the statistics into ClimateStats in one pass
 
 @author: Bob Hentz
 
@@ -29,13 +33,176 @@ Modified on 02/04/2021 to simplify the logic and make better use of Pandas metho
  -------------------------------------------------------------------------------
 """
 
+import os.path
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import datetime as dt
+from PVCache import DiskCache
 
 
-""" BaseURL defines the NASA site used to retrieve Lat/Lon specific data """
-BaseURL = 'https://power.larc.nasa.gov/cgi-bin/v1/DataAccess.py?'
+""" BaseURL defines the NASA site used to retrieve Lat/Lon specific data,
+    the NASA_POWER_URL environment variable or set_base_url may direct
+    requests elsewhere, such as a NasaStandIn server """
+PublicURL = 'https://power.larc.nasa.gov/cgi-bin/v1/DataAccess.py?'
+BaseURL = os.environ.get('NASA_POWER_URL', PublicURL)
+
+""" Location (relative to the working directory), time to live in seconds
+    and maximum total size in bytes of the local NASA data cache """
+CacheDir = os.path.join('Cache', 'NASA')
+CacheTTL = 30*24*3600
+CacheSize = 64*1024*1024
+
+""" Request timeout (connect, read) in seconds, number of retries after a
+    failed request, and the initial delay in seconds between retries which
+    doubles with each attempt """
+RequestTimeout = (10, 120)
+RequestRetries = 3
+RetryBackoff = 1.0
+
+""" HTTP status codes for which a request is retried """
+RetryStatus = (429, 500, 502, 503, 504)
+
+""" Statistics computed by DayofYear for each parameter """
+stat_cols = ['Min', 'Max', 'S-Mean', 'STDV']
+
+_nasa_cache = None
+_session = None
+
+
+def get_nasa_cache():
+    """ Return the DiskCache used for NASA data, creating it if required """
+    global _nasa_cache
+    if _nasa_cache is None:
+        _nasa_cache = DiskCache(os.path.join(os.getcwd(), CacheDir),
+                                CacheTTL, CacheSize)
+    return _nasa_cache
+
+
+def set_base_url(url= None):
+    """ Direct NASA requests to url, None restores the public API """
+    global BaseURL
+    BaseURL = PublicURL if url is None else url
+
+
+def set_nasa_cache(cache):
+    """ Use cache (a PVCache.DiskCache) for NASA data, None restores
+        the default cache """
+    global _nasa_cache
+    _nasa_cache = cache
+
+
+def create_session(pool_size= 8):
+    """ Return a requests Session whose connection pool holds pool_size
+        connections per host """
+    ses = requests.Session()
+    adapter = HTTPAdapter(pool_connections= pool_size, pool_maxsize= pool_size)
+    ses.mount('http://', adapter)
+    ses.mount('https://', adapter)
+    return ses
+
+
+def get_session():
+    """ Return the Session shared by NASA requests, creating it if required """
+    global _session
+    if _session is None:
+        _session = create_session()
+    return _session
+
+
+def fetch_response(cmd, session= None, retries= None, backoff= None,
+                   timeout= None):
+    """ Issue the GET request cmd and return the response, retrying with
+        an increasing delay on connection errors, timeouts & the RetryStatus
+        codes.  Other failures raise the requests exception """
+    ses = get_session() if session is None else session
+    retries = RequestRetries if retries is None else retries
+    backoff = RetryBackoff if backoff is None else backoff
+    timeout = RequestTimeout if timeout is None else timeout
+    attempt = 0
+    while True:
+        try:
+            rsp = ses.get(cmd, timeout= timeout)
+            if rsp.status_code in RetryStatus and attempt < retries:
+                raise requests.exceptions.RetryError(
+                        'Status {0}'.format(rsp.status_code))
+            rsp.raise_for_status()
+            return rsp
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.RetryError):
+            if attempt >= retries:
+                raise
+        time.sleep(backoff * 2**attempt)
+        attempt += 1
+
+
+def get_request_years():
+    """ Return the (first, last) years of data requested from NASA """
+    now = dt.date.today()
+    baseyear = now.year-1
+    return (baseyear-9, baseyear)
+
+
+def nasa_cache_key(lat, lon, parms, years):
+    """ Return the cache key for the statistics of the parms list over
+        years at lat, lon rounded to 0.01 degree """
+    return 'NASA2|{0:.2f}|{1:.2f}|{2}|{3}-{4}'.format(
+            round(lat, 2) + 0.0, round(lon, 2) + 0.0, ','.join(parms),
+            years[0], years[1])
+
+
+class ClimateStats:
+    """ Daily statistics by DayofYear for a set of NASA parameters, held in
+        a (days x parameters x stat_cols) array.  Indexing by a parameter
+        name returns a DataFrame of its statistics, as provided by the dict
+        LoadNasaData once returned, so either may be used as a Site's
+        atmospherics """
+    def __init__(self, parms, days, data):
+        self.parms = list(parms)
+        self.days = np.asarray(days)
+        self.data = np.asarray(data, dtype= float)
+        assert self.data.shape == (len(self.days), len(self.parms), len(stat_cols))
+
+    def __len__(self):
+        return len(self.parms)
+
+    def __contains__(self, parm):
+        return parm in self.parms
+
+    def __getitem__(self, parm):
+        return pd.DataFrame(self.data[:, self.parms.index(parm), :],
+                            index= pd.Index(self.days, name= 'DayofYear'),
+                            columns= stat_cols)
+
+    def keys(self):
+        """ Return the list of parameters """
+        return list(self.parms)
+
+    def get_stat(self, parm, stat):
+        """ Return the Numpy Array of the stat values of parm by day """
+        return self.data[:, self.parms.index(parm), stat_cols.index(stat)]
+
+    def to_arrays(self):
+        """ Return a dict of Numpy Arrays used to store the statistics """
+        return {'parms': np.array(self.parms), 'days': self.days,
+                'data': self.data}
+
+    @classmethod
+    def from_arrays(cls, arys):
+        """ Create ClimateStats from the output of to_arrays """
+        return cls([str(p) for p in arys['parms']], arys['days'], arys['data'])
+
+
+def get_daily_stat(atmo, parm, stat):
+    """ Return a Numpy Array of the stat values of parm by day from the
+        atmospherics atmo, either ClimateStats or a dict of DataFrames """
+    if isinstance(atmo, ClimateStats):
+        return atmo.get_stat(parm, stat)
+    return atmo[parm][stat].values
 
 
 def getLocationData(dtin):
@@ -50,7 +217,7 @@ def getLocationData(dtin):
     return ln
 
     
-def getSiteElevation(lat, lon):
+def getSiteElevation(lat, lon, session= None):
     baseURL = BaseURL
     baseReq = 'request=execute&identifier=SinglePoint&parameters=T2M'
     dateSel = dateSel = '&startDate=20140101&endDate=20140101&userCommunity=SSE'
@@ -59,9 +226,9 @@ def getSiteElevation(lat, lon):
     cmd = baseURL + baseReq + dateSel + outSel + locSel
     # Request NASA Data from API
     try:
-        data = requests.get(cmd).text
+        data = fetch_response(cmd, session).text
         return getLocationData(data)
-    except requests.exceptions.ConnectionError:
+    except requests.exceptions.RequestException:
         return [None, None, None]
     
 def formulateRequest(lat, lon, selectparms= None):
@@ -77,10 +244,9 @@ def formulateRequest(lat, lon, selectparms= None):
                 ('WS10M_MAX','Max Daily Wind Speed (m/s)'),
                 ('WS10M_MIN','Min Daily Wind Speed (m/s)')
                ]   
-    now = dt.date.today()
-    baseyear = now.year-1
-    startdate='{0}0101'.format(baseyear-9)
-    enddate ='{0}1231'.format(baseyear)
+    years = get_request_years()
+    startdate='{0}0101'.format(years[0])
+    enddate ='{0}1231'.format(years[1])
     #  build request parameters
     parms = []
     for itm in stdparms:
@@ -99,39 +265,80 @@ def formulateRequest(lat, lon, selectparms= None):
     return (cmd, reqparms.split(','))
 
 
-def LoadNasaData(lat, lon, show= False, selectparms= None): 
+def build_atmospherics(jdi, cols):
+    """ Reduce the decoded NASA response jdi to ClimateStats holding the
+        daily statistics by DayofYear of the cols parameters """
+    parms = jdi['features'][0]['properties']['parameter']
+    dates = list(parms[cols[0]].keys())
+    mtx = np.empty((len(dates), len(cols)))
+    for c, col in enumerate(cols):
+        vals = parms[col]
+        if list(vals.keys()) != dates:
+            vals = {dt: vals[dt] for dt in dates}
+        mtx[:, c] = np.fromiter(vals.values(), dtype= float, count= len(dates))
+    doy = np.asarray(pd.to_datetime(dates, format= '%Y%m%d').dayofyear)
+    keep = doy != 366   #drop a day for leap years
+    stats = pd.DataFrame(mtx[keep], columns= cols).groupby(doy[keep]).agg(
+            ['min', 'max', 'mean', 'std'])
+    return ClimateStats(cols, stats.index.values,
+                        stats.values.reshape(len(stats), len(cols),
+                                             len(stat_cols)))
+
+
+def LoadNasaData(lat, lon, show= False, selectparms= None, use_cache= True,
+                 session= None):
     """ Execute a request from NASA API for 10 years of atmospheric data 
         required to prepare daily statistical data used in Solar Insolation
-        calculations """
-    cmd = formulateRequest(-0.2739, 36.3765, selectparms)
-    jdi = requests.get(cmd[0]).json()
+        calculations.  Results are kept in the NASA data cache and reused
+        while they remain valid unless use_cache is False """
+    cmd = formulateRequest(lat, lon, selectparms)
     cols = cmd[1]
-    df = pd.json_normalize(jdi['features'][0]['properties']['parameter'][cols[0]]).T
-    df.index = pd.to_datetime(df.index)
-    df.rename(columns={0: cols[0]}, inplace= True)
-    for c in cols[1:]:
-        dfc = pd.json_normalize(jdi['features'][0]['properties']['parameter'][c]).T
-        dfc.index = pd.to_datetime(df.index)
-        dfc.rename(columns={0: c}, inplace= True)
-        df = df.join(dfc)
-    df['DayofYear'] = df.index.dayofyear
-    df = df[df['DayofYear'] != 366]  #drop a day for leap years
-    atmo_dict = dict()
-    dg = df.groupby('DayofYear')
-    for col in cols:
-        dp = pd.DataFrame(dg[col].min())
-        dp.rename(columns={col: 'Min'}, inplace= True)
-        atmo_dict[col] = dp
-        dp = pd.DataFrame(dg[col].max())
-        dp.rename(columns={col: 'Max'}, inplace= True)
-        atmo_dict[col] = atmo_dict[col].join(dp)
-        dp = pd.DataFrame(dg[col].mean())
-        dp.rename(columns={col: 'S-Mean'}, inplace= True)
-        atmo_dict[col] = atmo_dict[col].join(dp)
-        dp = pd.DataFrame(dg[col].std())
-        dp.rename(columns={col: 'STDV'}, inplace= True)
-        atmo_dict[col] = atmo_dict[col].join(dp)       
-    return atmo_dict
+    cache = get_nasa_cache() if use_cache else None
+    key = nasa_cache_key(lat, lon, cols, get_request_years())
+    if cache is not None:
+        arys = cache.get_arrays(key)
+        if arys is not None:
+            return ClimateStats.from_arrays(arys)
+    jdi = fetch_response(cmd[0], session).json()
+    atmo = build_atmospherics(jdi, cols)
+    if cache is not None:
+        cache.put_arrays(key, atmo.to_arrays())
+    return atmo
+
+
+def LoadNasaSites(sites, selectparms= None, max_workers= 8, use_cache= True,
+                  errors= None):
+    """ Retrieve the atmospheric data for a list of (lat, lon) sites using
+        up to max_workers concurrent requests over pooled connections.
+        Returns a list of LoadNasaData results in the order of sites, with
+        an empty dict for any site that could not be retrieved.  If errors
+        is a dict the exception raised for a failed site is stored keyed by
+        its (lat, lon) """
+    cmd = formulateRequest(0, 0, selectparms)
+    years = get_request_years()
+    # Sites sharing a cache key are only requested once
+    keys = [nasa_cache_key(lt, ln, cmd[1], years) for lt, ln in sites]
+    uniq = dict()
+    for ky, site in zip(keys, sites):
+        uniq.setdefault(ky, site)
+    ses = create_session(max_workers)
+
+    def load_site(site):
+        try:
+            return LoadNasaData(site[0], site[1], selectparms= selectparms,
+                                use_cache= use_cache, session= ses)
+        except (requests.exceptions.RequestException, ValueError,
+                KeyError, IndexError) as err:
+            if errors is not None:
+                errors[tuple(site)] = err
+            return dict()
+
+    try:
+        with ThreadPoolExecutor(max_workers= max_workers) as pool:
+            rslts = dict(zip(uniq.keys(), pool.map(load_site, uniq.values())))
+    finally:
+        ses.close()
+    return [rslts[ky] for ky in keys]
 
 
 def main():
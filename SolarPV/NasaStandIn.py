@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:21:09 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        NasaStandIn.py
+  Purpose:     Provide a local HTTP server that stands in for the NASA POWER
+               API, so the retrieval of atmospheric data can be exercised
+               and benchmarked without network access.  Responses are either
+               synthesized, replayed from a directory of recorded responses
+               or recorded from the real API.  Latency & errors may be
+               injected deterministically.
+
+               Usage:
+                   python NasaStandIn.py --port 8765 --latency 0.2
+               then point the simulator at it with
+                   NASA_POWER_URL=http://127.0.0.1:8765/?
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import numpy as np
+import pandas as pd
+import requests
+
+""" Nominal values & seasonal swing of the synthesized parameters """
+synthetic_parms = {'T2M': (20.0, 6.0), 'T10M': (20.0, 6.0),
+                   'T10M_MAX': (26.0, 6.0), 'T10M_MIN': (14.0, 6.0),
+                   'WS10M': (3.0, 1.0), 'WS10M_MAX': (6.0, 1.5),
+                   'WS10M_MIN': (1.0, 0.5)}
+
+
+def synthesize_response(query):
+    """ Return a dict in the NASA POWER SinglePoint JSON schema for the
+        parsed query.  Values are repeatable for a given site & parameter """
+    lat = float(query['lat'][0])
+    lon = float(query['lon'][0])
+    days = pd.date_range(query['startDate'][0], query['endDate'][0])
+    dstrs = days.strftime('%Y%m%d')
+    doy = np.asarray(days.dayofyear)
+    parms = dict()
+    for p in query['parameters'][0].split(','):
+        seed = int(hashlib.sha1('{0:.4f}|{1:.4f}|{2}'.format(
+                lat, lon, p).encode('ascii')).hexdigest()[:8], 16)
+        rng = np.random.RandomState(seed)
+        nom, swing = synthetic_parms.get(p, (1.0, 0.5))
+        # Seasons are reversed in the southern hemisphere
+        phase = np.pi if lat < 0 else 0.0
+        vals = (nom + swing*np.sin(2*np.pi*(doy - 80)/365 + phase) +
+                rng.normal(0, swing/4, len(doy)))
+        parms[p] = dict(zip(dstrs, np.round(vals, 2).tolist()))
+    elev = round(100.0 + 25.0*abs(lat), 2)
+    return {'type': 'FeatureCollection',
+            'features': [{'type': 'Feature',
+                          'geometry': {'type': 'Point',
+                                       'coordinates': [lon, lat, elev]},
+                          'properties': {'parameter': parms}}]}
+
+
+class NasaStandIn:
+    """ A stand in NASA POWER server running on a background thread.
+        mode is 'synthetic', 'replay' (serve responses saved in record_dir)
+        or 'record' (forward requests to upstream and save the responses in
+        record_dir).  Each request is delayed by latency seconds plus up to
+        jitter seconds and error_rate of the requests receive error_status,
+        both drawn from a random generator seeded with seed """
+    def __init__(self, host= '127.0.0.1', port= 0, mode= 'synthetic',
+                 record_dir= None, upstream= None, latency= 0.0, jitter= 0.0,
+                 error_rate= 0.0, error_status= 503, seed= 0):
+        if mode not in ('synthetic', 'replay', 'record'):
+            raise ValueError('Unknown mode: {0}'.format(mode))
+        if mode != 'synthetic' and record_dir is None:
+            raise ValueError('record_dir is required for {0} mode'.format(mode))
+        self.mode = mode
+        self.record_dir = record_dir
+        self.upstream = upstream
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.server = ThreadingHTTPServer((host, port), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.standin = self
+        self.thread = None
+        if record_dir is not None:
+            os.makedirs(record_dir, exist_ok= True)
+
+    @property
+    def url(self):
+        """ Base URL to use in place of NasaData.BaseURL """
+        host, port = self.server.server_address[:2]
+        return 'http://{0}:{1}/?'.format(host, port)
+
+    def start(self):
+        """ Start serving requests on a background thread """
+        self.thread = threading.Thread(target= self.server.serve_forever,
+                                       daemon= True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """ Stop the server """
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def next_fault(self):
+        """ Return (delay, fail) for the next request """
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + self.jitter*self.rng.random()
+            fail = self.rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        return delay, fail
+
+    def record_path(self, query):
+        """ Return the file holding the recorded response for query """
+        ky = '&'.join('{0}={1}'.format(k, query[k][0]) for k in sorted(query)
+                      if k != 'user')
+        hsh = hashlib.sha1(ky.encode('utf-8')).hexdigest()
+        return os.path.join(self.record_dir, hsh + '.json')
+
+    def respond(self, path):
+        """ Return (status, body bytes) for the request path """
+        query = parse_qs(urlparse(path).query)
+        if self.mode == 'synthetic':
+            try:
+                return 200, json.dumps(synthesize_response(query)).encode('utf-8')
+            except (KeyError, ValueError):
+                return 400, b'{"messages": ["Invalid request"]}'
+        fp = self.record_path(query)
+        if self.mode == 'replay':
+            if not os.path.exists(fp):
+                return 404, b'{"messages": ["No recorded response"]}'
+            with open(fp, 'rb') as fi:
+                return 200, fi.read()
+        rsp = requests.get(self.upstream + urlparse(path).query, timeout= 120)
+        if rsp.status_code == 200:
+            tmp = fp + '.tmp{0}'.format(threading.get_ident())
+            with open(tmp, 'wb') as fo:
+                fo.write(rsp.content)
+            os.replace(tmp, fp)
+        return rsp.status_code, rsp.content
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """ Request handler for NasaStandIn """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        standin = self.server.standin
+        delay, fail = standin.next_fault()
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            status = standin.error_status
+            body = b'{"messages": ["Injected error"]}'
+        else:
+            status, body = standin.respond(self.path)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    prs = argparse.ArgumentParser(description= 'Stand in NASA POWER server')
+    prs.add_argument('--host', default= '127.0.0.1')
+    prs.add_argument('--port', type= int, default= 8765)
+    prs.add_argument('--mode', default= 'synthetic',
+                     choices= ['synthetic', 'replay', 'record'])
+    prs.add_argument('--record-dir', default= None)
+    prs.add_argument('--upstream', default= None,
+                     help= 'API URL used in record mode, defaults to NasaData.BaseURL')
+    prs.add_argument('--latency', type= float, default= 0.0)
+    prs.add_argument('--jitter', type= float, default= 0.0)
+    prs.add_argument('--error-rate', type= float, default= 0.0)
+    prs.add_argument('--error-status', type= int, default= 503)
+    prs.add_argument('--seed', type= int, default= 0)
+    args = prs.parse_args()
+    upstream = args.upstream
+    if args.mode == 'record' and upstream is None:
+        from NasaData import PublicURL
+        upstream = PublicURL
+    srv = NasaStandIn(args.host, args.port, args.mode, args.record_dir,
+                      upstream, args.latency, args.jitter, args.error_rate,
+                      args.error_status, args.seed)
+    print('Serving NASA POWER stand in at {0}'.format(srv.url))
+    try:
+        srv.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
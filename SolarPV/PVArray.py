@@ -5,6 +5,13 @@ Created on Tue Oct  2 12:57:18 2018
 Modified on 02/22/2019 - for version 0.1.0
 modified on 1/8/2021 - to adapt to pvlib 0.8 requirements for cell 
                         temperature model definition
+Modified on 10/17/2026 to use the shared solar geometry of the site
+Modified on 10/17/2026 to skip the module physics for night time hours
+Modified on 10/17/2026 to memoize the array performance
+Modified on 10/17/2026 to scale the array output from a cached single
+                        module output
+Modified on 10/17/2026 to evaluate modules over weather ensembles
+Modified on 10/17/2026 to move the data entry form to PVForms
 
 @author: Bob Hentz
 
@@ -21,17 +28,62 @@ modified on 1/8/2021 - to adapt to pvlib 0.8 requirements for cell
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import GROOVE, EW, CENTER, RIGHT
-from FormBuilder import DataForm
 from Component import Component
 from FieldClasses import data_field, option_field
-from Parameters import panel_racking, albedo_types, panel_types, temp_model_xlate
+from Parameters import panel_racking, albedo_types, temp_model_xlate
 
 #from pvlib import *
 from pvlib.pvsystem import PVSystem
 #from pvlib.solarposition import spa_python
 #from pvlib.irradiance import aoi, get_total_irradiance
 from pvlib.temperature import TEMPERATURE_MODEL_PARAMETERS 
+import pvlib
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+from PVCache import DiskCache
+from SolarGeometry import values_digest
+from PVUtilities import scale_module_output
+
+# Columns of the DataFrames returned by define_array_performance &
+# define_module_performance
+array_out_cols = ['i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx']
+
+""" Module performance results are memoized in memory and held in a
+    DiskCache at CacheDir (relative to the working directory) of at most
+    CacheSize bytes, keyed on a hash of every input to the model """
+CacheDir = os.path.join('Cache', 'Array')
+CacheSize = 256*1024*1024
+MemoSize = 16
+
+_array_cache = None
+_array_memo = dict()
+
+
+def get_array_cache():
+    """ Return the DiskCache used for array performance, creating it if
+        required """
+    global _array_cache
+    if _array_cache is None:
+        _array_cache = DiskCache(os.path.join(os.getcwd(), CacheDir),
+                                 None, CacheSize)
+    return _array_cache
+
+
+def set_array_cache(cache):
+    """ Use cache (a PVCache.DiskCache) for array performance, None
+        restores the default cache """
+    global _array_cache
+    _array_cache = cache
+    _array_memo.clear()
+
+
+def array_performance_key(*inputs):
+    """ Return the cache key for the model inputs, each of which is a
+        value with a stable repr or a digest of an array of values """
+    ky = '|'.join(repr(v) for v in ('MODULE1', pvlib.__version__) + inputs)
+    return hashlib.sha1(ky.encode('utf-8')).hexdigest()
 
 class PVArray(Component):
     """ Methods associated with the definition, display, and operation of a
@@ -103,6 +155,8 @@ class PVArray(Component):
 
     def display_input_form(self, parent_frame):
         """ Generate the data input form """
+        from tkinter import GROOVE
+        from PVForms import ArrayForm
         self.parent_frame = parent_frame
         if len(self.parts) > 0:
             pnl = self.parts[0]
@@ -114,181 +168,159 @@ class PVArray(Component):
                       borderwidth= 5, relief= GROOVE, padx= 10, pady= 10, ipadx= 5, ipady= 5)
         return self.form
 
-    def define_array_performance(self, times, cur_site, cur_inv, stat_win):
-        inv_name = None
-        inv_parameters = None
-        if cur_inv is not None:
-            inv_name = cur_inv.read_attrb('Name')
-            inv_parameters = cur_inv.get_parameters()
+    def define_array_performance(self, times, cur_site, cur_inv, stat_win,
+                                 use_cache= True, uis= None, sip= None):
+        """ Return a DataFrame of the array output over times, scaled from
+            the output of a single module.  uis & sip, if given, replace
+            the array's units in series & strings in parallel """
+        mdl_series = self.read_attrb('uis') if uis is None else uis
+        mdl_sip = self.read_attrb('sip') if sip is None else sip
+        return scale_module_output(self.define_module_performance(times,
+                                            cur_site, stat_win, use_cache),
+                                   mdl_series, mdl_sip)
+
+    def define_module_performance(self, times, cur_site, stat_win,
+                                  use_cache= True):
+        """ Return a DataFrame of the output of one module of the array over
+            times, reusing a previous result for the same site, orientation,
+            module & racking unless use_cache is False """
         surf_tilt = self.read_attrb('tilt')
         surf_azm = self.read_attrb('azimuth')
         surf_alb = self.read_attrb('albedo')
-        mdl_series = self.read_attrb('uis')
-        mdl_sip = self.read_attrb('sip')
         loc = cur_site.get_location()
         mdl_rack_config =self.read_attrb('mtg_cnfg')
         pnl_name = self.parts[0].read_attrb('Name')
         pnl_parms = self.parts[0].get_parameters()
-        temp_model = temp_model_xlate[mdl_rack_config][0]
-        temp_type = temp_model_xlate[mdl_rack_config][1]
-        temp_parms = TEMPERATURE_MODEL_PARAMETERS[temp_model][temp_type]
         air_temp = cur_site.get_air_temp(times, stat_win)['Air_Temp']
         wnd_spd = cur_site.get_wind_spd(times, stat_win)['Wind_Spd']
-        pvsys = PVSystem(surf_tilt, surf_azm, surf_alb,
-                         module= pnl_name, module_parameters= pnl_parms,
-                         temperature_model_parameters = temp_parms,
-                         modules_per_string= mdl_series, 
-                         strings_per_inverter= mdl_sip,
-                         inverter= inv_name,
-                         inverter_parameters= inv_parameters,
-                         racking_model= mdl_rack_config,
-                         name= loc.name)
+        key = None
+        if use_cache:
+            key = array_performance_key(
+                    [surf_tilt, surf_azm, surf_alb, mdl_rack_config],
+                    pnl_name, sorted(pnl_parms.items()),
+                    self.parts[0].read_attrb('Technology'),
+                    (loc.latitude, loc.longitude, loc.altitude, str(loc.tz)),
+                    values_digest(times), values_digest(air_temp),
+                    values_digest(wnd_spd))
+            arys = _array_memo.get(key)
+            if arys is None:
+                arys = get_array_cache().get_arrays(key)
+                if arys is not None:
+                    self._memoize(key, arys)
+            if arys is not None:
+                return pd.DataFrame(arys, index= pd.Index(times, name= 'Time'),
+                                    columns= array_out_cols)
+        pvsys = self._module_system(loc)
+        daylit, total_irrad = self._module_irradiance(pvsys, times, cur_site,
+                                                      air_temp)
+        if total_irrad is None:
+            array_out = pd.DataFrame(0.0, index= pd.Index(times, name= 'Time'),
+                                     columns= array_out_cols)
+            return self._store_performance(key, array_out)
+
+        photocurrent, saturation_current, resistance_series, resistance_shunt, nNsVth = (
+            pvsys.calcparams_desoto(total_irrad['poa_global'],
+                                             temp_cell= pnl_parms['T_NOCT']))
+                 
+        """ Compute Module  'i_sc',  'v_oc',  'i_mp',  'v_mp',
+            'p_mp',  'i_x', &  'i_xx' and scatter back over all times """
+        array_out = pvsys.singlediode(photocurrent, saturation_current,
+                                      resistance_series, resistance_shunt,
+                                      nNsVth)[array_out_cols]
+        array_out = array_out.reindex(times, fill_value= 0.0)
+        array_out.index.name = 'Time'
+        return self._store_performance(key, array_out)
+
+    def define_module_ensemble(self, times, cur_site, stat_win, air_temps,
+                               wnd_spds):
+        """ Return a dict of (realization x times) Numpy Arrays of the
+            module 'i_mp', 'v_mp' & 'p_mp' for the realizations of the air
+            temperature & wind speed given by the rows of air_temps &
+            wnd_spds.  define_module_performance takes the cell temperature
+            as the module NOCT for the site's weather, here it is offset by
+            the change the realization's weather makes to the cell
+            temperature of the array's SAPM temperature model.  Realizations
+            of the site's weather thus give the output of
+            define_module_performance """
+        air_temp = cur_site.get_air_temp(times, stat_win)['Air_Temp']
+        wnd_spd = cur_site.get_wind_spd(times, stat_win)['Wind_Spd']
+        pvsys = self._module_system(cur_site.get_location())
+        daylit, total_irrad = self._module_irradiance(pvsys, times, cur_site,
+                                                      air_temp)
+        shape = (len(air_temps), len(times))
+        rslt = {c: np.zeros(shape) for c in ['i_mp', 'v_mp', 'p_mp']}
+        if total_irrad is None:
+            return rslt
+        poa = total_irrad['poa_global'].values
+        site_cell = pvsys.sapm_celltemp(poa, air_temp.values[daylit],
+                                        wnd_spd.values[daylit])
+        temp_cell = (self.parts[0].read_attrb('T_NOCT') +
+                     (pvsys.sapm_celltemp(poa, air_temps[:, daylit],
+                                          wnd_spds[:, daylit]) - site_cell))
+        mdl_out = pvsys.singlediode(*pvsys.calcparams_desoto(poa, temp_cell))
+        for c in rslt:
+            rslt[c][:, daylit] = mdl_out[c]
+        return rslt
+
+    def _module_system(self, loc):
+        """ Return a pvlib PVSystem of one module of the array """
+        mdl_rack_config = self.read_attrb('mtg_cnfg')
+        temp_model = temp_model_xlate[mdl_rack_config][0]
+        temp_type = temp_model_xlate[mdl_rack_config][1]
+        return PVSystem(self.read_attrb('tilt'), self.read_attrb('azimuth'),
+                        self.read_attrb('albedo'),
+                        module= self.parts[0].read_attrb('Name'),
+                        module_parameters= self.parts[0].get_parameters(),
+                        temperature_model_parameters =
+                            TEMPERATURE_MODEL_PARAMETERS[temp_model][temp_type],
+                        racking_model= mdl_rack_config,
+                        name= loc.name)
+
+    def _module_irradiance(self, pvsys, times, cur_site, air_temp):
+        """ Return the daylight mask over times and a DataFrame of the plane
+            of array irradiance for the daylit times (None if there are
+            none) """
         """Define 'apparent_elevation', 'apparent_zenith', 'azimuth',  
            'elevation', 'equation_of_time', and 'zenith'   """
-        solpos = loc.get_solarposition(times, pressure= None, temperature= air_temp)
+        geom = cur_site.get_geometry(times)
+        solpos = geom.get_solarposition(air_temp)
         
         """Define 'airmass_relative'  & 'airmass_absolute' """       
-        airmass = loc.get_airmass(times, solar_position=solpos, model='kastenyoung1989')
+        airmass = geom.get_airmass(air_temp, model='kastenyoung1989')
 
         """ Compute ghi, dni, & dhi """
-        csky= loc.get_clearsky(times, model='ineichen')
-        """ Compute 'aoi' """
-        aoi = pvsys.get_aoi(solpos['zenith'], solpos['azimuth'])
-         
-        
+        csky= geom.get_clearsky(model='ineichen')
+
+        """ The module physics is only evaluated for daylit hours, the
+            array produces nothing while the sun is below the horizon """
+        daylit = (solpos['zenith'] < 90).values
+        if not daylit.any():
+            return daylit, None
+        solpos = solpos[daylit]
+        csky = csky[daylit]
+
         """ Compute 'poa_global',  'poa_direct',  'poa_diffuse',
             'poa_sky_diffuse', & 'poa_ground_diffuse' """
         total_irrad = pvsys.get_irradiance(solpos['zenith'], solpos['azimuth'], 
                                            csky['dni'], csky['ghi'], csky['dhi'],
-                                           dni_extra=None, airmass=airmass, 
+                                           dni_extra=geom.get_dni_extra()[daylit],
+                                           airmass=airmass[daylit], 
                                            model='haydavies')        
-        
-        """ Compute 'temp_cell' & 'temp_module'  """
-        temps = pvsys.sapm_celltemp(total_irrad['poa_global'], air_temp, wnd_spd)
-        vars_dict = panel_types[self.parts[0].read_attrb('Technology')]
-        egrf = vars_dict.pop('EgRef', 1.121)
-        dgdt = vars_dict.pop('dEgdT', -0.0002677)
-        
-        photocurrent, saturation_current, resistance_series, resistance_shunt, nNsVth = (
-            pvsys.calcparams_desoto(total_irrad['poa_global'],
-                                             temp_cell= pnl_parms['T_NOCT']))
-                 
-        """ Compute Total Array  'i_sc',  'v_oc',  'i_mp',  'v_mp',
-            'p_mp',  'i_x', &  'i_xx' """
-        array_out = pvsys.scale_voltage_current_power( pvsys.singlediode(photocurrent, 
-                                             saturation_current, 
-                                             resistance_series, 
-                                             resistance_shunt, nNsVth))
-        array_out.index.name = 'Time'
-        return array_out
+        return daylit, total_irrad
 
-class ArrayForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 0, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                'lbl_tilt':self.create_label(self.src.get_attrb('tilt'),
-                                            row= 1, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc11': self.create_space(2, row= 2, column= 1, sticky= (EW)),
-                'tilt': self.create_entry(self.src.get_attrb('tilt'),
-                                           row= 1, column= 2, sticky=(EW),
-                                           justify= CENTER),
-                'spc13': self.create_space(30, row= 1, column= 3, sticky= (EW)),                                                          
-                'lbl_azm':self.create_label(self.src.get_attrb('azimuth'),
-                                            row= 1, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc15': self.create_space(2, row= 1, column= 5, sticky= (EW)),
-                'azimuth': self.create_entry(self.src.get_attrb('azimuth'),
-                                           row= 1, column= 6, sticky=(EW),
-                                           justify= CENTER),               
-                'blank2': self.create_space(40, row= 2, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                'lbl_mc':self.create_label(self.src.get_attrb('mtg_cnfg'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
-                'mtg_cnfg': self.create_dropdown(self.src.get_attrb('mtg_cnfg'),
-                                           row= 3, column= 2, sticky=(EW), 
-                                           columnspan = 4, width = 40),
-                'lbl_ms':self.create_label(self.src.get_attrb('mtg_spc'),
-                                            row= 4, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc41': self.create_space(2, row= 4, column= 1, sticky= (EW)),
-                'mtg_spc': self.create_entry(self.src.get_attrb('mtg_spc'),
-                                           row= 4, column= 2, sticky=(EW),
-                                           justify= CENTER),
-                'spc43': self.create_space(30, row= 4, column= 3, sticky= (EW)),                                                          
-                'lbl_mh':self.create_label(self.src.get_attrb('mtg_hgt'),
-                                            row= 4, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc45': self.create_space(2, row= 4, column= 5, sticky= (EW)),
-                'mtg_hgt': self.create_entry(self.src.get_attrb('mtg_hgt'),
-                                           row= 4, column= 6, sticky=(EW),
-                                           justify= CENTER),               
-                'lbl_gc':self.create_label(self.src.get_attrb('gnd_cnd'),
-                                            row= 5, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
-                'gnd_cnd': self.create_dropdown(self.src.get_attrb('gnd_cnd'),
-                                           row= 5, column= 2, validate= 'focusout',
-                                           validatecommand= self.src.validate_gnd_cnd_setting),                                                         
-                'spc53': self.create_space(2, row= 5, column= 3, sticky= (EW)),
-                'lbl_alb':self.create_label(self.src.get_attrb('albedo'),
-                                            row= 5, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc55': self.create_space(2, row= 5, column= 5, sticky= (EW)),
-                'albedo': self.create_entry(self.src.get_attrb('albedo'),
-                                           row= 5, column= 6, sticky=(EW),
-                                           justify= CENTER),                                                             
-                'blank3': self.create_space(40, row= 6, column= 0, sticky=(EW),
-                                           columnspan= 10),
-
-                'lbl_uis':self.create_label(self.src.get_attrb('uis'),
-                                            row= 7, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
-                'uis': self.create_entry(self.src.get_attrb('uis'),
-                                           row= 7, column= 2, sticky=(EW),
-                                           justify= CENTER, validate= 'focusout',
-                                           validatecommand= self.src.validate_size_setting),
-                'spc73': self.create_space(30, row= 7, column= 3, sticky= (EW)),                                                          
-                'lbl_sip':self.create_label(self.src.get_attrb('sip'),
-                                            row= 7, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc75': self.create_space(2, row= 7, column= 5, sticky= (EW)),
-                'sip': self.create_entry(self.src.get_attrb('sip'),
-                                           row= 7, column= 6, sticky=(EW),
-                                           justify= CENTER, validate= 'focusout',
-                                           validatecommand= self.src.validate_size_setting),               
-                'lbl_tp':self.create_label(self.src.get_attrb('ary_tpnl'),
-                                            row= 8, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc81': self.create_space(2, row= 8, column= 1, sticky= (EW)),
-                'ary_tpnl': self.create_entry(self.src.get_attrb('ary_tpnl'),
-                                           row= 8, column= 2, sticky=(EW),
-                                           justify= CENTER),
-                'lbl_vmp':self.create_label(self.src.get_attrb('ary_Vmp'),
-                                            row= 9, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc91': self.create_space(2, row= 9, column= 1, sticky= (EW)),
-                'ary_Vmp': self.create_entry(self.src.get_attrb('ary_Vmp'),
-                                           row= 9, column= 2, sticky=(EW),
-                                           justify= CENTER),
-                'spc93': self.create_space(30, row= 9, column= 3, sticky= (EW)),                                                          
-                'lbl_imp':self.create_label(self.src.get_attrb('ary_Imp'),
-                                            row= 9, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc95': self.create_space(2, row= 9, column= 5, sticky= (EW)),
-                'ary_Imp': self.create_entry(self.src.get_attrb('ary_Imp'),
-                                           row= 9, column= 6, sticky=(EW),
-                                           justify= CENTER),               
-                
-                }
+    def _memoize(self, key, arys):
+        if len(_array_memo) >= MemoSize:
+            _array_memo.clear()
+        _array_memo[key] = arys
 
+    def _store_performance(self, key, array_out):
+        """ Save array_out under key (if not None) & return it """
+        if key is not None:
+            arys = {c: array_out[c].to_numpy(dtype= float, copy= True)
+                    for c in array_out_cols}
+            self._memoize(key, arys)
+            get_array_cache().put_arrays(key, arys)
+        return array_out
 
 def main():
     print ('PV Array Definition Check')
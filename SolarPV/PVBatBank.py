@@ -5,6 +5,10 @@ Created on Thu Sep 27 17:00:07 2018
 Modified   Wed Dec  5 2018 (Fix Issue 2, Handle DC Loads)
 Modified on 02/25/2019 for version 0.1.0
 Modified on 03/06/2019 to correct in updating soc
+Modified on 10/17/2026 to expose the bank state used by PVDispatch
+Modified on 10/17/2026 to build the overview without a per day loop
+Modified on 10/17/2026 to support sizing the bank from the energy balance
+Modified on 10/17/2026 to move the data entry form to PVForms
 
 @author: Bob Hentz
 
@@ -21,15 +25,12 @@ Modified on 03/06/2019 to correct in updating soc
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import *
 import numpy as np
 from math import log
 import pandas as pd
-from FormBuilder import DataForm
 from FieldClasses import data_field
 from Parameters import battery_types
 from Component import Component
-from guiFrames import plot_graphic
 #from PVUtilities import create_time_mask
 
 class PVBatBank(Component):
@@ -119,6 +120,46 @@ class PVBatBank(Component):
         """ Return current Bnk SOC """
         return self.soc
 
+    def get_dispatch_state(self):
+        """ Return the operating state of the Bank as a dict """
+        return {'soc': self.soc, 'cur_cap': self.cur_cap,
+                'bnk_vo': self.bnk_vo, 'tot_cycles': self.tot_cycles,
+                'max_dischg_cycles': self.max_dischg_cycles,
+                'max_dischg_dod': self.max_dischg_dod}
+
+    def initial_dispatch_state(self, bnk_cap, socpt = 0.75):
+        """ Return the state initialize_bank would give a Bank of bnk_cap AH,
+            in the form created by get_dispatch_state """
+        soc = socpt + (self.read_attrb('doc')/100)*(1-socpt)
+        bnk_vnom = self.read_attrb('bnk_vo')
+        eff = battery_types[self.parts[0].read_attrb('b_typ')][1]
+        if soc == 1:
+            bnk_vo = bnk_vnom
+        elif soc == 0:
+            bnk_vo = 0
+        else:
+            bnk_vo = eff*((bnk_vnom*1.2/6.22)*log(soc))+ bnk_vnom
+        return {'soc': soc, 'cur_cap': bnk_cap*soc, 'bnk_vo': bnk_vo,
+                'tot_cycles': 0, 'max_dischg_cycles': self.max_dischg_cycles,
+                'max_dischg_dod': self.max_dischg_dod}
+
+    def strings_for_energy(self, usable_wh):
+        """ Return the number of battery strings in parallel giving at
+            least usable_wh of usable energy at the Bank voltage & DOC """
+        usable = (self.read_attrb('doc')/100)*self.read_attrb('bnk_vo')
+        cap = usable_wh/usable if usable > 0 else 0
+        return max(1, int(np.ceil(cap/self.parts[0].read_attrb('b_rcap'))))
+
+    def set_dispatch_state(self, state):
+        """ Restore the operating state of the Bank from a dict
+            created by get_dispatch_state """
+        self.soc = state['soc']
+        self.cur_cap = state['cur_cap']
+        self.bnk_vo = state['bnk_vo']
+        self.tot_cycles = state['tot_cycles']
+        self.max_dischg_cycles = state['max_dischg_cycles']
+        self.max_dischg_dod = state['max_dischg_dod']
+
     def is_okay(self):
         """ Tests for battery SOC above Minimum """
         return self.soc >  (1- (self.read_attrb('doc')/100))
@@ -226,6 +267,7 @@ class PVBatBank(Component):
       
     def show_bank_drain(self):
         """ Create graphic of Battery Bank Drain Performance  """
+        from guiFrames import plot_graphic
         if self.master.power_flow  is not None:
             xlabels = np.arange(24)
             pltslist = [
@@ -244,6 +286,7 @@ class PVBatBank(Component):
 
     def show_bank_soc(self):
         """ Create graphic of Battery Bank SOC Performance  """
+        from guiFrames import plot_graphic
         if self.master.power_flow  is not None:
             xlabels = np.arange(24)
             pltslist = [{'label': 'Best Day SOC', 
@@ -260,25 +303,22 @@ class PVBatBank(Component):
                                   pltslist, 'Range of Bank SOC', (6,4))
 
     def create_overview(self):
+        """ Return a DataFrame of the Bank SOC at Sunrise & Sunset for each
+            day, taken from the hourly power flow """
         if self.master.power_flow  is not None:
             suns = self.master.site.get_sun_times(self.master.times.index)
-            sr_soc = np.zeros(len(suns))
-            ss_soc = np.zeros(len(suns))
-            day = [None]*len(suns)
-            for i in range(len(suns)):
-                snr = suns['Sunrise'].iloc[i]
-                sns = suns['Sunset'].iloc[i]
-                snrtm = snr.floor('H')
-                snstm = snr.ceil('H')
-                day[i] = snrtm
-                sr_soc[i] = self.master.power_flow.loc[snrtm]['BatSoc']
-                ss_soc[i] = self.master.power_flow.loc[snstm]['BatSoc']
-            bat_ovr = pd.DataFrame(data={'Sunrise':sr_soc, 'Sunset':ss_soc},
+            snr = pd.DatetimeIndex(suns['Sunrise'])
+            day = snr.floor('h').rename(None)
+            soc = self.master.power_flow['BatSoc']
+            # Sunset SOC has always been sampled at the hour after sunrise
+            bat_ovr = pd.DataFrame(data={'Sunrise':soc.loc[day].values,
+                                         'Sunset':soc.loc[snr.ceil('h')].values},
                                    index= day)        
             return bat_ovr
     
     def show_bank_overview(self):
         """ Create graphic of Battery Bank Overview Performance  """
+        from guiFrames import plot_graphic
         if self.master.power_flow  is not None:
             ovr = self.create_overview()
             xlabels = ovr.index
@@ -295,6 +335,8 @@ class PVBatBank(Component):
 
     def display_input_form(self, parent_frame):
         """ Generate the Data entry form for Battery Bank """
+        from tkinter import GROOVE
+        from PVForms import BankForm
         self.parent_frame = parent_frame
         self.update_attributes()
         if len(self.parts) > 0:
@@ -322,85 +364,6 @@ class PVBatBank(Component):
                 self.master.stw.show_message(s, 'Warning')
                 
 
-class BankForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                # Row 2
-                'lbl_doa':self.create_label(self.src.get_attrb('doa'),
-                                            row= 2, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
-                'doa': self.create_entry(self.src.get_attrb('doa'),
-                                           row= 2, column= 2, sticky=(EW),
-                                           justify= CENTER),
-                'spc23': self.create_space(5, row= 2, column= 3, sticky= (EW)),
-                'lbl_doc': self.create_label(self.src.get_attrb('doc'),
-                                            row= 2, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc25': self.create_space(2, row= 2, column= 5, sticky= (EW)),
-                'doc': self.create_entry(self.src.get_attrb('doc'),
-                                           row= 2, column= 6, sticky=(EW),
-                                           justify= CENTER),
-                'spc27': self.create_space(5, row= 2, column= 7, sticky= (EW)),
-                # Row 3
-                'lbl_uis': self.create_label(self.src.get_attrb('bnk_uis'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
-                'bnk_uis': self.create_entry(self.src.get_attrb('bnk_uis'),
-                                           row= 3, column= 2, sticky=(EW),
-                                           justify= CENTER, validate= 'focusout',
-                                           validatecommand= self.src.validate_size_setting),
-                'spc33': self.create_space(2, row= 3, column= 3, sticky= (EW)),
-                'lbl_sip': self.create_label(self.src.get_attrb('bnk_sip'),
-                                            row= 3, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-                'spc35': self.create_space(2, row= 3, column= 5, sticky= (EW)),
-                'bnk_sip': self.create_entry(self.src.get_attrb('bnk_sip'),
-                                           row= 3, column= 6, sticky=(EW),
-                                           justify= CENTER, validate= 'focusout',
-                                           validatecommand= self.src.validate_size_setting),
-                'spc37': self.create_space(2, row= 3, column= 7, sticky= (EW)),
-                # Row 4
-                'blank1': self.create_space(40, row= 4, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                # Row 5
-                'lbl_tbats': self.create_label(self.src.get_attrb('bnk_tbats'),
-                                            row= 5, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
-                'bnk_tbats': self.create_entry(self.src.get_attrb('bnk_tbats'),
-                                           row= 5, column= 2, sticky=(EW),
-                                           justify= CENTER) ,
-                # Row 6
-                'lbl_cap': self.create_label(self.src.get_attrb('bnk_cap'),
-                                            row= 6, column= 0, justify= RIGHT,
-                                            width= 40, sticky= (EW), columnspan= 3),
-                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
-                'bnk_cap': self.create_entry(self.src.get_attrb('bnk_cap'),
-                                           row= 6, column= 2, sticky=(EW),
-                                           justify= CENTER) ,
-                'spc63': self.create_space(2, row= 6, column= 3, sticky= (EW)),
-                'lbl_vo': self.create_label(self.src.get_attrb('bnk_vo'),
-                                            row= 6, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-                'spc65': self.create_space(2, row= 6, column= 5, sticky= (EW)),
-                'bnk_vo': self.create_entry(self.src.get_attrb('bnk_vo'),
-                                           row= 6, column= 6, sticky=(EW),
-                                           justify= CENTER) ,
-                # Row 7
-                 'blank2': self.create_space(40, row= 7, column= 0, sticky=(EW),
-                                           columnspan= 10)
-
-                }
-
-      
 def main():
     print ('BatBank Startup check')
 
@@ -4,6 +4,7 @@
 Created   on Mon Jul 30 11:01:58 2018
 Modified  on Mon Sep 17 19:33:02 2018
 Modified on 02/22/2019 for version 0.1.0
+Modified on 10/17/2026 to move the data entry form to PVForms
 
 @author: Bob Hentz
 
@@ -20,8 +21,6 @@ Modified on 02/22/2019 for version 0.1.0
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import *
-from FormBuilder import DataForm
 from FieldClasses import data_field, option_field
 from Parameters import battery_types
 from Component import Component
@@ -65,6 +64,8 @@ class PVBattery(Component):
         return True,''
  
     def display_input_form(self, parent_frame):
+        from tkinter import GROOVE
+        from PVForms import BatteryForm
         self.parent_frame = parent_frame
         self.form = BatteryForm(parent_frame, self, row=1, column=1,  width= 300, height= 300,
                       borderwidth= 5, relief= GROOVE, padx= 10, pady= 10, ipadx= 5, ipady= 5)
@@ -75,112 +76,6 @@ class PVBattery(Component):
         pass
     
     
-class BatteryForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),               
-                'lbl_mfg':self.create_label(self.src.get_attrb('b_mfg'),
-                                            row= 2, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
-                'b_mfg': self.create_entry(self.src.get_attrb('b_mfg'),
-                                           row= 2, column= 2, sticky=(EW), 
-                                           name= self.src.get_attrb_name('b_mfg'),
-                                           justify= CENTER),               
-                'spc22': self.create_space(5, row= 2, column= 3, sticky= (EW)),
-                'lbl_mdl': self.create_label(self.src.get_attrb('b_mdl'),
-                                            row= 2, column= 5, justify= RIGHT,
-                                            sticky= (EW)),
-#                'spc23': self.create_space(2, row= 2, column= 5, sticky= (EW)),
-                'b_mdl': self.create_entry(self.src.get_attrb('b_mdl'),
-                                           row= 2, column= 6, sticky=(EW), 
-                                           justify= CENTER),               
-                'spc24': self.create_space(5, row= 2, column= 7, sticky= (EW)),
-                'lbl_typ': self.create_label(self.src.get_attrb('b_typ'),
-                                            row= 2, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc25': self.create_space(2, row= 2, column= 9, sticky= (EW)),
-                'b_typ': self.create_dropdown(self.src.get_attrb('b_typ'),
-                                           row= 2, column= 10, sticky=(EW), 
-                                           justify= CENTER),               
-                'lbl_desc': self.create_label(self.src.get_attrb('b_desc'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
-                'b_desc': self.create_entry(self.src.get_attrb('b_desc'),
-                                           row= 3, column= 2, sticky=(EW), 
-                                           justify= LEFT, columnspan= 9) ,              
-                'lbl_ir': self.create_label(self.src.get_attrb('b_ir'),
-                                            row= 4, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 4, column= 2, sticky= (EW)),
-                'b_ir': self.create_entry(self.src.get_attrb('b_ir'),
-                                           row= 4, column= 3, sticky=(EW), 
-                                           justify= CENTER) ,              
-                 'lbl_nv': self.create_label(self.src.get_attrb('b_nomv'),
-                                            row= 4, column= 7, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 4, column= 2, sticky= (EW)),
-                'b_nomv': self.create_entry(self.src.get_attrb('b_nomv'),
-                                           row= 4, column= 10, sticky=(EW), 
-                                           justify= CENTER,
-                                           On_change= self.src.on_form_change),                
-                'lbl_cap': self.create_label(self.src.get_attrb('b_rcap'),
-                                            row= 5, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_rcap': self.create_entry(self.src.get_attrb('b_rcap'),
-                                           row= 5, column= 3, sticky=(EW), 
-                                           justify= CENTER,
-                                           On_change= self.src.on_form_change),
-                 'lbl_hrs': self.create_label(self.src.get_attrb('b_rhrs'),
-                                            row= 5, column= 7, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_rhrs': self.create_entry(self.src.get_attrb('b_rhrs'),
-                                           row= 5, column= 10, sticky=(EW), 
-                                           justify= CENTER),               
- 
-                'lbl_tc': self.create_label(self.src.get_attrb('b_tmpc'),
-                                            row= 6, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_tmpc': self.create_entry(self.src.get_attrb('b_tmpc'),
-                                           row= 6, column= 3, sticky=(EW), 
-                                           justify= CENTER) ,              
-                 'lbl_st': self.create_label(self.src.get_attrb('b_stdTemp'),
-                                            row= 6, column= 7, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_stdTemp': self.create_entry(self.src.get_attrb('b_stdTemp'),
-                                           row= 6, column= 10, sticky=(EW), 
-                                           justify= CENTER),               
- 
-                'lbl_mxdc': self.create_label(self.src.get_attrb('b_mxDschg'),
-                                            row= 7, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_mxDschg': self.create_entry(self.src.get_attrb('b_mxDschg'),
-                                           row= 7, column= 3, sticky=(EW), 
-                                           justify= CENTER) ,              
-                 'lbl_mxDoD': self.create_label(self.src.get_attrb('b_mxDoD'),
-                                            row= 7, column= 7, justify= RIGHT,
-                                            sticky= (EW), columnspan= 3),
-#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
-                'b_mxDoD': self.create_entry(self.src.get_attrb('b_mxDoD'),
-                                           row= 7, column= 10, sticky=(EW), 
-                                           justify= CENTER),               
-
-                'blank1': self.create_space(40, row= 8, column= 0, sticky=(EW),
-                                           columnspan= 10)               
-            
-                }
-
-
 def main():
     print('PVBattery.py Load Check')    
     
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 16:05:37 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        PVCache.py
+  Purpose:     Provide a persistent on disk cache for data that is expensive
+               to retrieve or compute, such as NASA climatology
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import hashlib
+import io
+import os
+import tempfile
+import time
+import numpy as np
+
+
+class DiskCache:
+    """ A directory of cache entries, each held in its own file named by
+        a hash of its key.  Entries older than ttl seconds are discarded and
+        once the total size exceeds max_bytes the least recently used entries
+        are evicted.  Entries are written to a temporary file and renamed
+        into place so several processes may share the same directory """
+    suffix = '.cache'
+
+    def __init__(self, cache_dir, ttl= None, max_bytes= None):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok= True)
+
+    def key_path(self, key):
+        """ Return the path of the file holding the entry for key """
+        hsh = hashlib.sha1(str(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, hsh + self.suffix)
+
+    def get(self, key):
+        """ Return the bytes stored for key or None if there is no valid
+            entry.  File modification time marks when the entry was written
+            and access time when it was last used """
+        fp = self.key_path(key)
+        try:
+            st = os.stat(fp)
+            if self.ttl is not None and time.time() - st.st_mtime > self.ttl:
+                os.remove(fp)
+                return None
+            with open(fp, 'rb') as fi:
+                data = fi.read()
+            os.utime(fp, (time.time(), st.st_mtime))
+            return data
+        except FileNotFoundError:
+            # Entry is absent or was evicted by another process
+            return None
+
+    def put(self, key, data):
+        """ Store the bytes data as the entry for key """
+        fd, tmp = tempfile.mkstemp(dir= self.cache_dir, suffix= '.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fo:
+                fo.write(data)
+            os.replace(tmp, self.key_path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.evict()
+
+    def get_arrays(self, key):
+        """ Return the dict of Numpy Arrays stored for key or None """
+        data = self.get(key)
+        if data is None:
+            return None
+        with np.load(io.BytesIO(data), allow_pickle= False) as npz:
+            return {ky: npz[ky] for ky in npz.files}
+
+    def put_arrays(self, key, arrays):
+        """ Store the dict of Numpy Arrays as the entry for key """
+        buf = io.BytesIO()
+        np.savez_compressed(buf, **arrays)
+        self.put(key, buf.getvalue())
+
+    def remove(self, key):
+        """ Remove any entry for key """
+        try:
+            os.remove(self.key_path(key))
+        except FileNotFoundError:
+            pass
+
+    def entries(self):
+        """ Return list of (last use, size, path) for each entry """
+        rslt = []
+        for fn in os.listdir(self.cache_dir):
+            if fn.endswith(self.suffix):
+                fp = os.path.join(self.cache_dir, fn)
+                try:
+                    st = os.stat(fp)
+                except FileNotFoundError:
+                    continue
+                rslt.append((max(st.st_atime, st.st_mtime), st.st_size, fp))
+        return rslt
+
+    def size(self):
+        """ Return the total size in bytes of the cache entries """
+        return sum(e[1] for e in self.entries())
+
+    def evict(self):
+        """ Remove expired entries and then the least recently used ones
+            until the cache is within max_bytes """
+        ents = self.entries()
+        now = time.time()
+        if self.ttl is not None:
+            keep = []
+            for ent in ents:
+                try:
+                    if now - os.stat(ent[2]).st_mtime > self.ttl:
+                        os.remove(ent[2])
+                        continue
+                except FileNotFoundError:
+                    continue
+                keep.append(ent)
+            ents = keep
+        if self.max_bytes is None:
+            return
+        total = sum(e[1] for e in ents)
+        for ent in sorted(ents):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ent[2])
+            except FileNotFoundError:
+                pass
+            total -= ent[1]
+
+    def clear(self):
+        """ Remove all entries """
+        for ent in self.entries():
+            try:
+                os.remove(ent[2])
+            except FileNotFoundError:
+                pass
+
+
+def main():
+    print('PVCache Load Check')
+
+
+if __name__ == '__main__':
+    main()
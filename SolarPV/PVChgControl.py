@@ -5,6 +5,9 @@ Created on Fri Oct  5 13:39:02 2018
 modified   Wed Dec 12 2018 (Issue #5)
 Modified on 02/25/2019 for version 0.1.0
 Modified 01/20/2021 to relocate power control to PVUtilities to allow for inverter control
+Modified on 10/17/2026 to move the data entry form to PVForms
+Modified on 10/17/2026 to check the array open circuit voltage & short
+                        circuit current against the PV limits
 
 @author: Bob Hentz
 
@@ -21,8 +24,6 @@ Modified 01/20/2021 to relocate power control to PVUtilities to allow for invert
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import *
-from FormBuilder import DataForm
 from FieldClasses import data_field, option_field
 from Component import Component
 from Parameters import chgcntl_types
@@ -68,15 +69,30 @@ class PVChgControl(Component):
             return False, 'PV Charge Controller Max Discharge Current not defined'
         if self.read_attrb('c_bvnom') == 0.0:
             return False, 'PV Charge Controller Bat Nom Volts not defined'
-        if self.master.ary.read_attrb('ary_Vmp') > self.read_attrb('c_pvmxv'):
-            return False, 'Charge Control Max PVvolts mismatch Array Voltage'
+        ary = self.master.ary
+        pnl = self.master.pnl
+        rslt, msg = self.check_array_limits(
+                            ary.read_attrb('uis')*pnl.read_attrb('V_oc_ref'),
+                            ary.read_attrb('sip')*pnl.read_attrb('I_sc_ref'))
+        if not rslt:
+            return rslt, msg
         if bf and (self.master.bnk.read_attrb('bnk_vo') > self.read_attrb('c_bvnom')):
             return False, 'Charge Control Max Bat volts mismatch Bank Voltage'
         return True, ""
 
+    def check_array_limits(self, voc, isc):
+        """ Verify an array with open circuit voltage voc & short circuit
+            current isc is within the PV limits of the Charge Controller """
+        if voc > self.read_attrb('c_pvmxv'):
+            return False, 'Charge Control Max PVvolts less than Array Open Circuit Voltage'
+        if isc > self.read_attrb('c_pvmxi'):
+            return False, 'Charge Control Max PVcurrent less than Array Short Circuit Current'
+        return True, ""
 
     def display_input_form(self, parent_frame):
         """ Generate the Data Entry Form """
+        from tkinter import GROOVE
+        from PVForms import ChgCntlForm
         self.parent_frame = parent_frame
         self.form = ChgCntlForm(parent_frame, self, row=1, column=1,  
                                 width= 300, height= 300, borderwidth= 5, 
@@ -85,124 +101,6 @@ class PVChgControl(Component):
         return self.form
 
 """ The Charge Controller Data Entry Window Definition """
-class ChgCntlForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                 'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                'lbl_mfg':self.create_label(self.src.get_attrb('c_mfg'),
-                                            row= 2, column= 0, justify= LEFT,
-                                            sticky= (EW)),
-                'c_mfg': self.create_entry(self.src.get_attrb('c_mfg'),
-                                           row= 2, column= 1, sticky=(EW),
-                                           width= 25, justify= CENTER, columnspan= 5),
-                'lbl_mdl': self.create_label(self.src.get_attrb('c_mdl'),
-                                            row= 3, column= 0, justify= LEFT),
-                'c_mdl': self.create_entry(self.src.get_attrb('c_mdl'),
-                                           row= 3, column= 1, sticky=(EW),
-                                           justify= CENTER, width= 25, columnspan= 3),
-                'lbl_typ': self.create_label(self.src.get_attrb('c_type'),
-                                            row= 3, column= 7, justify= RIGHT),
-                'c_type': self.create_dropdown(self.src.get_attrb('c_type'),
-                                           row= 3, column= 8, sticky=(EW),
-                                           justify= CENTER, width= 10),
-                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
-                                            row= 4, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc31': self.create_space(2, row= 4, column= 1, sticky= (EW)),
-                'Name': self.create_entry(self.src.get_attrb('Name'),
-                                           row= 4, column= 2, sticky=(EW),
-                                           justify= LEFT, columnspan= 8) ,
-
-                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
-                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
-                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
-                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
-                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
-                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
-                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
-                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
-                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
-                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
-                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
-
-                'lbl_mxv':self.create_label(self.src.get_attrb('c_pvmxv'),
-                                             row= 6, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
-                'c_pvmxv': self.create_entry(self.src.get_attrb('c_pvmxv'),
-                                             row= 6, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'spc63': self.create_space(2, row= 6, column= 3, sticky= (EW)),
-               'lbl_isc': self.create_label(self.src.get_attrb('c_pvmxi'),
-                                             row= 6, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-               'c_pvmxi': self.create_entry(self.src.get_attrb('c_pvmxi'),
-                                             row= 6, column= 5, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_bv':self.create_label(self.src.get_attrb('c_bvnom'),
-                                             row= 7, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
-                'c_bvnom': self.create_entry(self.src.get_attrb('c_bvnom'),
-                                             row= 7, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-                'lbl_mvchg':self.create_label(self.src.get_attrb('c_mvchg'),
-                                             row= 7, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'c_mvchg': self.create_entry(self.src.get_attrb('c_mvchg'),
-                                             row= 7, column= 5, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-                'lbl_michg':self.create_label(self.src.get_attrb('c_michg'),
-                                             row= 8, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc81': self.create_space(2, row= 8, column= 1, sticky= (EW)),
-                'c_michg': self.create_entry(self.src.get_attrb('c_michg'),
-                                             row= 8, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_mvdchg':self.create_label(self.src.get_attrb('c_midschg'),
-                                             row= 8, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'c_midschg': self.create_entry(self.src.get_attrb('c_midschg'),
-                                             row= 8, column= 5, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-               'lbl_tmpc': self.create_label(self.src.get_attrb('c_tmpc'),
-                                             row= 9, column= 0, justify= RIGHT,
-                                            sticky= (W)),
-                'spc91': self.create_space(2, row= 9, column= 1, sticky= (EW)),
-                'c_tmpc': self.create_entry(self.src.get_attrb('c_tmpc'),
-                                             row= 9, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_tmpr':self.create_label(self.src.get_attrb('c_tmpr'),
-                                             row= 9, column=4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc94': self.create_space(2, row= 9, column= 5, sticky= (EW)),
-                'c_tmpr': self.create_entry(self.src.get_attrb('c_tmpr'),
-                                             row= 9, column= 5, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-               'lbl_sPow': self.create_label(self.src.get_attrb('c_cnsmpt'),
-                                             row= 10, column= 0, justify= RIGHT,
-                                            sticky= (W)),
-                'spc101': self.create_space(2, row= 10, column= 1, sticky= (EW)),
-                'c_cnsmpt': self.create_entry(self.src.get_attrb('c_cnsmpt'),
-                                             row= 10, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_eff':self.create_label(self.src.get_attrb('c_eff'),
-                                             row= 10, column=4, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc104': self.create_space(2, row= 10, column= 5, sticky= (EW)),
-                'c_eff': self.create_entry(self.src.get_attrb('c_eff'),
-                                             row= 10, column= 5, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                }
-
 def main():
     print('PVChgControl.Py check complete')
 
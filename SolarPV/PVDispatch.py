@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 11:02:15 2026
+Modified on 10/17/2026 to size the battery bank from the energy balance
+Modified on 10/17/2026 to dispatch weather ensembles in batch
+Modified on 10/17/2026 to size the bank with the drain margin of the dispatch
+Modified on 10/17/2026 to report the system load
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        PVDispatch.py
+  Purpose:     Distribute Array power to the load and battery bank over an
+               entire simulation run.  Implements the same control logic
+               as PVUtilities.computOutputResults, but operates on plain
+               arrays with the system parameters resolved once per run
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+from math import log
+import numpy as np
+from Parameters import battery_types
+
+# The Bank is drawn upon when Array power falls short of the load by this
+# factor, as in PVUtilities.computOutputResults
+drain_margin = 1.1
+
+
+def resolve_dispatch_parameters(inv, chgc, bnk):
+    """ Build a dict of the system parameters which remain constant over a
+        simulation run from the Inverter, Charge Controller & Battery Bank
+        instances (any of which may be None) """
+    invFlg = inv is not None and inv.is_defined()
+    bnkFlg = bnk is not None and bnk.is_defined()
+    chgFlg = chgc is not None and chgc.is_defined()
+    parms = {'invFlg': invFlg, 'bnkFlg': bnkFlg, 'chgFlg': chgFlg}
+    if chgFlg or invFlg:
+        # stdbyPwr matches the evaluation order used by computOutputResults
+        parms['stdbyPwr'] = (inv.read_attrb('Pnt') if invFlg else
+                             (0 + chgc.read_attrb('c_cnsmpt') if chgFlg else 0))
+        parms['eff'] = min([(inv.read_attrb('Paco')/inv.read_attrb('Pdco')) if invFlg else 1.0,
+                            (chgc.read_attrb('c_eff')/100) if chgFlg else 1.0])
+        parms['pvmxv'] = inv.read_attrb('Vdcmax') if invFlg else chgc.read_attrb('c_pvmxv')
+        parms['pvmxi'] = ((inv.read_attrb('Pdco')/inv.read_attrb('Vdco')) if invFlg
+                          else chgc.read_attrb('c_pvmxi'))
+        parms['VmxChg'] = inv.read_attrb('Vdcmax') if invFlg else chgc.read_attrb('c_mvchg')
+        parms['ImxDchg'] = inv.read_attrb('Idcmax') if invFlg else chgc.read_attrb('c_midschg')
+        parms['cntlType'] = chgc.read_attrb('c_type') if chgFlg else 'MPPT'
+    if invFlg:
+        parms['Paco'] = inv.read_attrb('Paco')
+        parms['Pdco'] = inv.read_attrb('Pdco')
+    if bnkFlg:
+        bat = bnk.parts[0]
+        parms['doc'] = bnk.read_attrb('doc')
+        parms['bnk_cap'] = bnk.read_attrb('bnk_cap')
+        parms['bnk_vnom'] = bnk.read_attrb('bnk_vo')
+        parms['bat_eff'] = battery_types[bat.read_attrb('b_typ')][1]
+        parms['b_mxDschg'] = bat.read_attrb('b_mxDschg')
+        parms['b_mxDoD'] = bat.read_attrb('b_mxDoD')
+    return parms
+
+
+def dispatch_power_flows(parms, arp, arv, ari, acld, dcld, state= None):
+    """ Compute the hourly distribution of Array power to the load and battery
+        bank for the arrays of Array Power, Volts & Current and AC & DC load.
+        parms is the dict returned by resolve_dispatch_parameters and state
+        the starting Battery Bank state (see PVBatBank.get_dispatch_state).
+        Returns a dict containing the arrays:
+            'PO' - amount of total load satisfied
+            'PS' - fraction of load satisfied
+            'DE' - fraction of Array Power used to provide load
+            'SL' - load imposed by system chgCntlr & inverter (W)
+            'BS' - battery soc (%)
+            'BD' - power drawn from battery
+            'BP' - remaining amount of usable Battery Power
+            'EM' - recorded error messages
+        plus the final Battery Bank 'state' and the 'first_error' as a tuple
+        of (index, (message, level)) or None """
+    n = len(arp)
+    PO = np.zeros(n)
+    PS = np.zeros(n)
+    DE = np.zeros(n)
+    SL = np.zeros(n)
+    BS = np.zeros(n)
+    BD = np.zeros(n)
+    BP = np.zeros(n)
+    EM = np.empty(n, dtype=object)
+    arp = np.asarray(arp, dtype= float).tolist()
+    arv = np.asarray(arv, dtype= float).tolist()
+    ari = np.asarray(ari, dtype= float).tolist()
+    # Loads are kept as numpy scalars so division by zero behaves as it did
+    # when values were read from the DataFrame
+    acld = np.asarray(acld, dtype= float)
+    dcld = np.asarray(dcld, dtype= float)
+
+    invFlg = parms['invFlg']
+    bnkFlg = parms['bnkFlg']
+    chgFlg = parms['chgFlg']
+    if chgFlg or invFlg:
+        stdbyPwr = parms['stdbyPwr']
+        eff = parms['eff']
+        pvmxv = parms['pvmxv']
+        pvmxi = parms['pvmxi']
+        VmxChg = parms['VmxChg']
+        ImxDchg = parms['ImxDchg']
+        mppt = parms['cntlType'] == 'MPPT'
+    if invFlg:
+        paco = parms['Paco']
+        pdco = parms['Pdco']
+    if state is None:
+        state = {}
+    soc = state.get('soc', 1.0)
+    cur_cap = state.get('cur_cap', None)
+    bnk_vo = state.get('bnk_vo', 0)
+    tot_cycles = state.get('tot_cycles', 0)
+    mx_cycles = state.get('max_dischg_cycles', None)
+    mx_dod = state.get('max_dischg_dod', None)
+    if bnkFlg:
+        soc_min = 1 - (parms['doc']/100)
+        bnk_cap = parms['bnk_cap']
+        bnk_vnom = parms['bnk_vnom']
+        bat_eff = parms['bat_eff']
+
+    first_error = None
+    for tindx in range(n):
+        ArP = arp[tindx]
+        ArV = arv[tindx]
+        ArI = ari[tindx]
+        # Correct for possible power backflow into array
+        if ArP <= 0 or ArV <= 0 or ArI <= 0:
+            ArP = 0.0
+            ArV = 0.0
+            ArI = 0.0
+        acLd = acld[tindx]
+        dcLd = dcld[tindx]
+        po = 0.0
+        ps = 0.0
+        de = 0.0
+        sl = 0.0
+        bd = 0.0
+        bs = None
+        bp = None
+        err = None
+        if not chgFlg and not invFlg:
+            # No Charge Controller or Inverter in System
+            if dcLd > 0.0 and ArP > 0.0:
+                if ArP > dcLd:
+                    po = dcLd
+                else:
+                    po = ArP
+                de = po/ArP
+                ps = po/dcLd
+        else:
+            sysLd = stdbyPwr
+            totUsrLd = dcLd + acLd
+            if invFlg and acLd > 0:
+                sysLd += (1+ acLd*((pdco - paco)/paco))/0.9637
+            elif invFlg:
+                sysLd += 0.0
+            sysLd = ((totUsrLd + sysLd)/eff) - totUsrLd
+            sl = sysLd
+            pload = totUsrLd + sysLd
+            vout = min(ArV, pvmxv)
+            iout = min(ArI, pvmxi)
+            drain = ArP - pload*drain_margin
+            if bnkFlg and (drain >= 0 or (drain < 0 and soc > soc_min)):
+                # A battery bank exists and it is usable for charging or discharging
+                if soc == 1:
+                    bnk_vo = bnk_vnom
+                bv = bnk_vo
+                if bv <= 0:
+                    bv = 1
+                if drain >= 0:
+                    vout = min(vout, VmxChg)
+                    bv = bv*1.2
+                    if mppt:
+                        iout = max(drain/vout, drain/bv)
+                    else:
+                        iout = min(drain/vout, drain/bv)
+                else:
+                    # Discharge Battery state
+                    if cur_cap is None or soc == 1:
+                        soc = 1
+                        cur_cap = bnk_cap
+                    cap = bnk_cap*soc
+                    if soc == 1:
+                        bnk_vo = bnk_vnom
+                    if abs(drain) <= cap * bnk_vo:
+                        if vout == 0.0 or iout == 0.0:
+                            vout = bv
+                            iout = min(ImxDchg, -drain/vout)
+                        iout= -1* iout
+                    else:
+                        # Bnk can't provide needed power
+                        if ArP < sysLd:
+                            msg = 'Insufficient Array & Bank power to sustain System operation'
+                            msg += '\n {0:.2f} watts needed but only {1:.2f} watts generated'
+                            err = (msg.format(sysLd, ArP), 'Warning')
+                        else:
+                            iout = -1 * ((ArP-sysLd)/vout)
+                # update Bank State
+                old_soc = soc
+                new_soc = soc
+                if abs(iout) > 0:
+                    if cur_cap is None or soc == 1:
+                        soc = 1
+                        cur_cap = bnk_cap
+                    i_chg = min(abs(iout), bnk_cap*soc)
+                    i_chg = i_chg * (iout/abs(iout))
+                    bd = bnk_vo * i_chg
+                    cur_cap += iout
+                    if cur_cap > bnk_cap:
+                        cur_cap = bnk_cap
+                    if cur_cap <= 0:
+                        cur_cap = 0
+                    new_soc = min(cur_cap/bnk_cap, 1)
+                    assert new_soc >= 0, 'SOC is less than 0 for i={0}, cap={1}. '.format(
+                                                                    iout, cur_cap)
+                    soc = new_soc
+                    if soc == 1:
+                        bnk_vo = bnk_vnom
+                    elif soc == 0:
+                        bnk_vo = 0
+                    else:
+                        bnk_vo = bat_eff*((bnk_vnom*1.2/6.22)*log(soc))+ bnk_vnom
+                bs = soc
+                if cur_cap is None or soc == 1:
+                    soc = 1
+                    cur_cap = bnk_cap
+                cap = bnk_cap*soc
+                if soc == 1:
+                    bnk_vo = bnk_vnom
+                bp = cap * bnk_vo
+                if mx_cycles is None or mx_dod is None:
+                    mx_cycles = parms['b_mxDschg']
+                    mx_dod = parms['b_mxDoD']
+                delta_soc = old_soc - new_soc
+                if delta_soc != 0:
+                    if delta_soc < 0:
+                        tot_cycles += (abs(delta_soc)*100)/(2*mx_dod)
+                if ArP - bd -pload >= 0.0:
+                    #okay met pload requirements
+                    po = pload
+                elif ArP - bd - sysLd >= 0:
+                    po = ArP - sysLd
+                else:
+                    msg = 'Insufficient Array + Bank power to sustain System operation'
+                    msg += '\n {0:.2f} watts needed but only {1:.2f} watts generated'
+                    err = (msg.format(sysLd, ArP), 'Warning')
+                    po = 0.0
+                if totUsrLd > 0:
+                    ps = po/pload
+                if ArP > 0:
+                    de = po /ArP
+            else:
+                # No battery exists or battery can't be discharged further
+                if ArP < sysLd and totUsrLd > 0:
+                    msg = 'Insufficient Array power to sustain System operation'
+                    msg += '\n {0:.2f} watts needed but only {1:.2f} watts available'
+                    err = (msg.format(sysLd, ArP), 'Warning')
+                vout = min(vout, VmxChg)
+                iout = min(iout, ImxDchg)
+                if mppt:
+                    iout = max(iout, ImxDchg)
+                pout = min(ArP, vout*iout, pload)
+                if ArP > 0 and totUsrLd > 0:
+                    po = pout
+                    de = po/ArP
+                if ArP > pload and totUsrLd > 0:
+                    ps = pout/pload
+
+        PO[tindx] = po
+        PS[tindx] = ps
+        DE[tindx] = de
+        SL[tindx] = sl
+        if bnkFlg:
+            if bs is None:
+                bs = soc
+            BS[tindx] = bs*100
+            BD[tindx] = bd
+            # Available power is refreshed every hour, as the bank does
+            if cur_cap is None or soc == 1:
+                soc = 1
+                cur_cap = bnk_cap
+            cap = bnk_cap*soc
+            if soc == 1:
+                bnk_vo = bnk_vnom
+            BP[tindx] = cap * bnk_vo if bp is None else bp
+        if err is not None:
+            EM[tindx] = 'After {0} days '.format(1 + tindx//24) + err[0].replace('\n', ' ')
+            if first_error is None:
+                first_error = (tindx, err)
+        else:
+            EM[tindx] = ""
+
+    state = {'soc': soc, 'cur_cap': cur_cap, 'bnk_vo': bnk_vo,
+             'tot_cycles': tot_cycles, 'max_dischg_cycles': mx_cycles,
+             'max_dischg_dod': mx_dod}
+    return {'PO': PO, 'PS': PS, 'DE': DE, 'SL': SL, 'BS': BS, 'BD': BD,
+            'BP': BP, 'EM': EM, 'state': state, 'first_error': first_error}
+
+
+def _pmin(a, b):
+    """ Elementwise min(a, b) with the result of the builtin min, which
+        returns a unless b is smaller """
+    return np.where(b < a, b, a)
+
+
+def _pmax(a, b):
+    """ Elementwise max(a, b) with the result of the builtin max """
+    return np.where(b > a, b, a)
+
+
+def _soc_volts(soc, bnk_vnom, bat_eff):
+    """ Return the bank voltages for the array of states of charge soc """
+    vo = np.where(soc == 1, bnk_vnom, 0.0)
+    part = (soc > 0) & (soc < 1)
+    # math.log keeps the voltages identical to dispatch_power_flows
+    vo[part] = [bat_eff*((bnk_vnom*1.2/6.22)*log(s))+ bnk_vnom
+                for s in soc[part]]
+    return vo
+
+
+def dispatch_ensemble(parms, arp, arv, ari, acld, dcld, state= None):
+    """ Batch form of dispatch_power_flows for an ensemble of Array outputs.
+        arp, arv & ari are (realization x hour) arrays, the hourly AC & DC
+        load is common to all realizations.  Each hour is computed for all
+        realizations at once with the control logic of dispatch_power_flows,
+        giving the same results for every row.  Returns a dict containing
+        the (realization x hour) arrays 'PO' & 'PS' (see
+        dispatch_power_flows) and the array 'cycles' of the battery cycles
+        accumulated by each realization """
+    arp = np.atleast_2d(np.asarray(arp, dtype= float))
+    arv = np.atleast_2d(np.asarray(arv, dtype= float))
+    ari = np.atleast_2d(np.asarray(ari, dtype= float))
+    acld = np.asarray(acld, dtype= float)
+    dcld = np.asarray(dcld, dtype= float)
+    m, n = arp.shape
+    # Correct for possible power backflow into array
+    bad = (arp <= 0) | (arv <= 0) | (ari <= 0)
+    arp = np.where(bad, 0.0, arp)
+    arv = np.where(bad, 0.0, arv)
+    ari = np.where(bad, 0.0, ari)
+    invFlg = parms['invFlg']
+    bnkFlg = parms['bnkFlg']
+    chgFlg = parms['chgFlg']
+    if state is None:
+        state = {}
+    soc = np.full(m, float(state.get('soc', 1.0)))
+    cur_cap = state.get('cur_cap', None)
+    # A bank capacity of nan stands for one not yet assigned
+    cur_cap = np.full(m, np.nan if cur_cap is None else float(cur_cap))
+    bnk_vo = np.full(m, float(state.get('bnk_vo', 0)))
+    tot_cycles = np.full(m, float(state.get('tot_cycles', 0)))
+    if not chgFlg and not invFlg:
+        ok = (dcld > 0.0) & (arp > 0.0)
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            PO = np.where(ok, _pmin(arp, dcld), 0.0)
+            PS = np.where(ok, PO/dcld, 0.0)
+        return {'PO': PO, 'PS': PS, 'cycles': tot_cycles}
+    # Hours are stepped through in turn, so hold them in rows
+    arp = np.ascontiguousarray(arp.T)
+    arv = np.ascontiguousarray(arv.T)
+    ari = np.ascontiguousarray(ari.T)
+    PO = np.zeros((n, m))
+    PS = np.zeros((n, m))
+    stdbyPwr = parms['stdbyPwr']
+    eff = parms['eff']
+    pvmxv = parms['pvmxv']
+    pvmxi = parms['pvmxi']
+    VmxChg = parms['VmxChg']
+    ImxDchg = parms['ImxDchg']
+    mppt = parms['cntlType'] == 'MPPT'
+    totUsrLd = dcld + acld
+    sysLd = np.full(n, float(stdbyPwr))
+    if invFlg:
+        paco = parms['Paco']
+        pdco = parms['Pdco']
+        sysLd = sysLd + np.where(acld > 0,
+                                 (1+ acld*((pdco - paco)/paco))/0.9637, 0.0)
+    sysLd = ((totUsrLd + sysLd)/eff) - totUsrLd
+    pload = totUsrLd + sysLd
+    if bnkFlg:
+        soc_min = 1 - (parms['doc']/100)
+        bnk_cap = parms['bnk_cap']
+        bnk_vnom = parms['bnk_vnom']
+        bat_eff = parms['bat_eff']
+        mx_dod = state.get('max_dischg_dod', None)
+        if mx_dod is None:
+            mx_dod = parms['b_mxDoD']
+
+    with np.errstate(divide= 'ignore', invalid= 'ignore'):
+        for tindx in range(n):
+            ArP = arp[tindx]
+            ArV = arv[tindx]
+            ArI = ari[tindx]
+            tot = totUsrLd[tindx]
+            sld = sysLd[tindx]
+            pld = pload[tindx]
+            vout = _pmin(ArV, pvmxv)
+            iout = _pmin(ArI, pvmxi)
+            drain = ArP - pld*drain_margin
+            po = np.zeros(m)
+            ps = np.zeros(m)
+            if bnkFlg:
+                bank = (drain >= 0) | (soc > soc_min)
+            else:
+                bank = np.zeros(m, dtype= bool)
+
+            # A battery bank exists and it is usable for charging or discharging
+            if bank.any():
+                full = bank & (soc == 1)
+                bnk_vo[full] = bnk_vnom
+                bv = np.where(bnk_vo <= 0, 1, bnk_vo)
+                chg = bank & (drain >= 0)
+                vc = _pmin(vout, VmxChg)
+                if mppt:
+                    ic = _pmax(drain/vc, drain/(bv*1.2))
+                else:
+                    ic = _pmin(drain/vc, drain/(bv*1.2))
+                vout = np.where(chg, vc, vout)
+                iout = np.where(chg, ic, iout)
+                # Discharge Battery state
+                dsc = bank & (drain < 0)
+                rst = dsc & (np.isnan(cur_cap) | (soc == 1))
+                soc[rst] = 1
+                cur_cap[rst] = bnk_cap
+                bnk_vo[dsc & (soc == 1)] = bnk_vnom
+                fits = dsc & (np.abs(drain) <= bnk_cap*soc*bnk_vo)
+                idle = fits & ((vout == 0.0) | (iout == 0.0))
+                vout = np.where(idle, bv, vout)
+                iout = np.where(idle, _pmin(ImxDchg, -drain/vout), iout)
+                iout = np.where(fits, -1* iout, iout)
+                short = dsc & ~fits & ~(ArP < sld)
+                iout = np.where(short, -1 * ((ArP-sld)/vout), iout)
+                # update Bank State
+                old_soc = soc.copy()
+                new_soc = soc.copy()
+                flow = bank & (np.abs(iout) > 0)
+                rst = flow & (np.isnan(cur_cap) | (soc == 1))
+                soc[rst] = 1
+                cur_cap[rst] = bnk_cap
+                i_chg = _pmin(np.abs(iout), bnk_cap*soc)
+                i_chg = i_chg * (iout/np.abs(iout))
+                bd = np.where(flow, bnk_vo * i_chg, 0.0)
+                cap = np.where(flow, cur_cap + iout, cur_cap)
+                cap = np.where(flow & (cap > bnk_cap), bnk_cap, cap)
+                cur_cap = np.where(flow & (cap <= 0), 0, cap)
+                new_soc = np.where(flow, _pmin(cur_cap/bnk_cap, 1), new_soc)
+                assert (new_soc[flow] >= 0).all(), 'SOC is less than 0'
+                soc = np.where(flow, new_soc, soc)
+                bnk_vo[flow] = _soc_volts(soc[flow], bnk_vnom, bat_eff)
+                rst = bank & (np.isnan(cur_cap) | (soc == 1))
+                soc[rst] = 1
+                cur_cap[rst] = bnk_cap
+                bnk_vo[bank & (soc == 1)] = bnk_vnom
+                delta_soc = old_soc - new_soc
+                tot_cycles = np.where(bank & (delta_soc < 0), tot_cycles +
+                                      (np.abs(delta_soc)*100)/(2*mx_dod),
+                                      tot_cycles)
+                pb = np.where(ArP - bd -pld >= 0.0, pld,
+                              np.where(ArP - bd - sld >= 0, ArP - sld, 0.0))
+                po = np.where(bank, pb, po)
+                if tot > 0:
+                    ps = np.where(bank, po/pld, ps)
+
+            # No battery exists or battery can't be discharged further
+            nob = ~bank
+            if nob.any():
+                vn = _pmin(vout, VmxChg)
+                inn = _pmin(iout, ImxDchg)
+                if mppt:
+                    inn = _pmax(inn, ImxDchg)
+                pout = _pmin(_pmin(ArP, vn*inn), pld)
+                if tot > 0:
+                    po = np.where(nob & (ArP > 0), pout, po)
+                    ps = np.where(nob & (ArP > pld), pout/pld, ps)
+            PO[tindx] = po
+            PS[tindx] = ps
+            if bnkFlg:
+                # Available power is refreshed every hour, as the bank does
+                rst = np.isnan(cur_cap) | (soc == 1)
+                soc[rst] = 1
+                cur_cap[rst] = bnk_cap
+                bnk_vo[soc == 1] = bnk_vnom
+    # Realizations are returned in rows, so that their sums don't depend on
+    # the number dispatched together
+    return {'PO': np.ascontiguousarray(PO.T), 'PS': np.ascontiguousarray(PS.T),
+            'cycles': tot_cycles}
+
+
+def system_loads(parms, acld, dcld):
+    """ Return the array of hourly total loads, the user AC & DC load plus
+        the load imposed by the charge controller & inverter, as computed
+        by dispatch_power_flows """
+    acld = np.asarray(acld, dtype= float)
+    dcld = np.asarray(dcld, dtype= float)
+    totUsrLd = dcld + acld
+    if not parms['chgFlg'] and not parms['invFlg']:
+        return totUsrLd
+    sysLd = np.full(len(totUsrLd), float(parms['stdbyPwr']))
+    if parms['invFlg']:
+        paco = parms['Paco']
+        pdco = parms['Pdco']
+        sysLd = sysLd + np.where(acld > 0,
+                                 (1+ acld*((pdco - paco)/paco))/0.9637, 0.0)
+    sysLd = ((totUsrLd + sysLd)/parms['eff']) - totUsrLd
+    return totUsrLd + sysLd
+
+
+def bank_drawdowns(arp, pload):
+    """ Return the energy drawn from a bank at the end of each hour, for a
+        bank which starts full, absorbs the surplus of arp over pload (with
+        the drain_margin) up to full and supplies every shortfall.  As in
+        the dispatch, no charging loss is applied.  The cumulative balance
+        is computed once and the drawdown is its distance below the running
+        peak """
+    net = (np.asarray(arp, dtype= float) -
+           np.asarray(pload, dtype= float)*drain_margin)
+    lvl = np.cumsum(net)
+    return np.maximum.accumulate(np.maximum(lvl, 0.0)) - lvl
+
+
+def size_bank_energy(parms, arp, acld, dcld, target= 1.0):
+    """ Return the minimum usable bank energy (Wh) for which no more than
+        (1 - target) of the demand hours are left unserved, using the hourly
+        energy balance of Array power against the system loads.  An hour
+        relying on the bank is counted as served when the drawdown it
+        causes is within the usable energy, which slightly overstates the
+        energy needed once the bank has run out """
+    arp = np.maximum(np.asarray(arp, dtype= float), 0.0)
+    pload = system_loads(parms, acld, dcld)
+    demand = (np.asarray(acld, dtype= float) +
+              np.asarray(dcld, dtype= float)) > 0
+    ndmnd = int(demand.sum())
+    if ndmnd == 0:
+        return 0.0
+    allowed = ndmnd - int(np.ceil(target*ndmnd - 1e-9))
+    dd = bank_drawdowns(arp, pload)
+    need = dd[demand & (arp < pload*drain_margin)]
+    if len(need) <= allowed:
+        return 0.0
+    k = len(need) - allowed - 1
+    return float(np.partition(need, k)[k])
+
+
+def main():
+    print('PVDispatch Load Check')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,833 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 22:10:31 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        PVForms.py
+  Purpose:     Provides the data entry forms of the Solar PV System
+               components.  The forms are kept apart from the components
+               so that the components (and the SimulationEngine) may be
+               used on systems without tkinter, each component imports its
+               form only when the form is displayed
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+from tkinter import *
+from FormBuilder import DataForm
+
+
+class SiteForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),               
+                'lbl_proj':self.create_label(self.src.get_attrb('proj'),
+                                            row= 2, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
+                'proj': self.create_entry(self.src.get_attrb('proj'),
+                                           row= 2, column= 2, sticky=(EW), 
+                                           name= self.src.get_attrb_name('proj'),
+                                           justify= CENTER, columnspan = 4),               
+                'lbl_clnt': self.create_label(self.src.get_attrb('client'),
+                                            row= 2, column= 7, justify= RIGHT ),
+                'client': self.create_entry(self.src.get_attrb('client'),
+                                           row= 2, column= 8, sticky=(EW), 
+                                           justify= CENTER, columnspan= 3),               
+                'spc22': self.create_space(10, row= 2, column= 12, sticky= (EW)),
+                'spc23': self.create_space(10, row= 2, column= 13, sticky= (EW)),                
+                'lbl_desc': self.create_label(self.src.get_attrb('p_desc'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
+                'p_desc': self.create_entry(self.src.get_attrb('p_desc'),
+                                           row= 3, column= 2, sticky=(EW), 
+                                           justify= LEFT, columnspan= 10) ,              
+                'blank2': self.create_space(40, row= 4, column= 0, sticky=(EW),
+                                           columnspan= 10),               
+                'lbl_city': self.create_label(self.src.get_attrb('city'),
+                                            row= 5, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
+                'city': self.create_entry(self.src.get_attrb('city'),
+                                           row= 5, column= 2, sticky=(EW), 
+                                           justify= CENTER, columnspan= 3) ,              
+                'spc52': self.create_space(5, row= 5, column= 5, sticky= (EW)),
+                'lbl_cntry': self.create_label(self.src.get_attrb('cntry'),
+                                            row= 5, column= 7, justify= CENTER,
+                                            sticky= (EW)),
+                'cntry': self.create_dropdown(self.src.get_attrb('cntry'),
+                                           row= 5, column= 8, sticky=(EW), 
+                                           justify= CENTER, columnspan= 4,
+                                           validate= 'focusout',
+                                           validatecommand= self.src.validate_country_setting),                
+                'blank3': self.create_space(40, row= 6, column= 0, sticky=(EW),
+                                           columnspan= 10),        
+                'lbl_lat': self.create_label(self.src.get_attrb('lat'),
+                                            row= 8, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc81': self.create_space(2, row= 8, column= 2, sticky= (EW)),
+                'lat': self.create_entry(self.src.get_attrb('lat'),
+                                           row= 8, column= 3, sticky=(EW), 
+                                           justify= CENTER, width=10,
+                                           On_change= self.src.on_form_change,
+                                           validate= 'focusout',
+                                           validatecommand= self.src.validate_lat_lon_setting),
+                'spc82': self.create_space(2, row= 8, column= 5, sticky= (EW)),
+                'lbl_lon': self.create_label(self.src.get_attrb('lon'),
+                                            row= 8, column= 5, justify= RIGHT,
+                                            width= 10),
+#                'spc83': self.create_space(2, row= 8, column= 6, sticky= (EW)),
+                'lon': self.create_entry(self.src.get_attrb('lon'),
+                                           row= 8, column= 7, sticky=(EW), 
+                                           justify= CENTER, width=10,
+                                           validate= 'focusout',
+                                           validatecommand= self.src.validate_lat_lon_setting),               
+                 'lbl_elev': self.create_label(self.src.get_attrb('elev'),
+                                            row= 8, column= 11, justify= RIGHT),
+                 'elev': self.create_entry(self.src.get_attrb('elev'),
+                                           row= 8, column= 12, sticky=(EW), 
+                                           justify= CENTER, width=10),               
+                'lbl_tz': self.create_label(self.src.get_attrb('tz'),
+                                            row= 9, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc91': self.create_space(2, row= 9, column= 2, sticky= (EW)),
+                'tz': self.create_entry(self.src.get_attrb('tz'),
+                                           row= 9, column= 3, sticky=(EW), 
+                                           justify= CENTER, width=5,
+                                           On_change= self.src.on_form_change),
+                'spc92': self.create_space(2, row= 9, column= 5, sticky= (EW)),
+                'lbl_gv': self.create_label(self.src.get_attrb('gv'),
+                                            row= 9, column= 5, justify= RIGHT),
+#                'spc93': self.create_space(2, row= 9, column= 6, sticky= (EW)),
+                'gv': self.create_entry(self.src.get_attrb('gv'),
+                                           row= 9, column= 7, sticky=(EW), 
+                                           justify= CENTER, width=5),               
+                 'lbl_gf': self.create_label(self.src.get_attrb('gf'),
+                                            row= 9, column= 11, justify= RIGHT),
+                 'gf': self.create_entry(self.src.get_attrb('gf'),
+                                           row= 9, column= 12, sticky=(EW), 
+                                           justify= CENTER, width=5),               
+                  'blank4': self.create_space(40, row= 10, column= 0, sticky=(EW),
+                                           columnspan= 10)               
+                }
+
+
+class ArrayForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 0, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                'lbl_tilt':self.create_label(self.src.get_attrb('tilt'),
+                                            row= 1, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc11': self.create_space(2, row= 2, column= 1, sticky= (EW)),
+                'tilt': self.create_entry(self.src.get_attrb('tilt'),
+                                           row= 1, column= 2, sticky=(EW),
+                                           justify= CENTER),
+                'spc13': self.create_space(30, row= 1, column= 3, sticky= (EW)),                                                          
+                'lbl_azm':self.create_label(self.src.get_attrb('azimuth'),
+                                            row= 1, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc15': self.create_space(2, row= 1, column= 5, sticky= (EW)),
+                'azimuth': self.create_entry(self.src.get_attrb('azimuth'),
+                                           row= 1, column= 6, sticky=(EW),
+                                           justify= CENTER),               
+                'blank2': self.create_space(40, row= 2, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                'lbl_mc':self.create_label(self.src.get_attrb('mtg_cnfg'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
+                'mtg_cnfg': self.create_dropdown(self.src.get_attrb('mtg_cnfg'),
+                                           row= 3, column= 2, sticky=(EW), 
+                                           columnspan = 4, width = 40),
+                'lbl_ms':self.create_label(self.src.get_attrb('mtg_spc'),
+                                            row= 4, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc41': self.create_space(2, row= 4, column= 1, sticky= (EW)),
+                'mtg_spc': self.create_entry(self.src.get_attrb('mtg_spc'),
+                                           row= 4, column= 2, sticky=(EW),
+                                           justify= CENTER),
+                'spc43': self.create_space(30, row= 4, column= 3, sticky= (EW)),                                                          
+                'lbl_mh':self.create_label(self.src.get_attrb('mtg_hgt'),
+                                            row= 4, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc45': self.create_space(2, row= 4, column= 5, sticky= (EW)),
+                'mtg_hgt': self.create_entry(self.src.get_attrb('mtg_hgt'),
+                                           row= 4, column= 6, sticky=(EW),
+                                           justify= CENTER),               
+                'lbl_gc':self.create_label(self.src.get_attrb('gnd_cnd'),
+                                            row= 5, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
+                'gnd_cnd': self.create_dropdown(self.src.get_attrb('gnd_cnd'),
+                                           row= 5, column= 2, validate= 'focusout',
+                                           validatecommand= self.src.validate_gnd_cnd_setting),                                                         
+                'spc53': self.create_space(2, row= 5, column= 3, sticky= (EW)),
+                'lbl_alb':self.create_label(self.src.get_attrb('albedo'),
+                                            row= 5, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc55': self.create_space(2, row= 5, column= 5, sticky= (EW)),
+                'albedo': self.create_entry(self.src.get_attrb('albedo'),
+                                           row= 5, column= 6, sticky=(EW),
+                                           justify= CENTER),                                                             
+                'blank3': self.create_space(40, row= 6, column= 0, sticky=(EW),
+                                           columnspan= 10),
+
+                'lbl_uis':self.create_label(self.src.get_attrb('uis'),
+                                            row= 7, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
+                'uis': self.create_entry(self.src.get_attrb('uis'),
+                                           row= 7, column= 2, sticky=(EW),
+                                           justify= CENTER, validate= 'focusout',
+                                           validatecommand= self.src.validate_size_setting),
+                'spc73': self.create_space(30, row= 7, column= 3, sticky= (EW)),                                                          
+                'lbl_sip':self.create_label(self.src.get_attrb('sip'),
+                                            row= 7, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc75': self.create_space(2, row= 7, column= 5, sticky= (EW)),
+                'sip': self.create_entry(self.src.get_attrb('sip'),
+                                           row= 7, column= 6, sticky=(EW),
+                                           justify= CENTER, validate= 'focusout',
+                                           validatecommand= self.src.validate_size_setting),               
+                'lbl_tp':self.create_label(self.src.get_attrb('ary_tpnl'),
+                                            row= 8, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc81': self.create_space(2, row= 8, column= 1, sticky= (EW)),
+                'ary_tpnl': self.create_entry(self.src.get_attrb('ary_tpnl'),
+                                           row= 8, column= 2, sticky=(EW),
+                                           justify= CENTER),
+                'lbl_vmp':self.create_label(self.src.get_attrb('ary_Vmp'),
+                                            row= 9, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc91': self.create_space(2, row= 9, column= 1, sticky= (EW)),
+                'ary_Vmp': self.create_entry(self.src.get_attrb('ary_Vmp'),
+                                           row= 9, column= 2, sticky=(EW),
+                                           justify= CENTER),
+                'spc93': self.create_space(30, row= 9, column= 3, sticky= (EW)),                                                          
+                'lbl_imp':self.create_label(self.src.get_attrb('ary_Imp'),
+                                            row= 9, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc95': self.create_space(2, row= 9, column= 5, sticky= (EW)),
+                'ary_Imp': self.create_entry(self.src.get_attrb('ary_Imp'),
+                                           row= 9, column= 6, sticky=(EW),
+                                           justify= CENTER),               
+                
+                }
+
+
+class BankForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                # Row 2
+                'lbl_doa':self.create_label(self.src.get_attrb('doa'),
+                                            row= 2, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
+                'doa': self.create_entry(self.src.get_attrb('doa'),
+                                           row= 2, column= 2, sticky=(EW),
+                                           justify= CENTER),
+                'spc23': self.create_space(5, row= 2, column= 3, sticky= (EW)),
+                'lbl_doc': self.create_label(self.src.get_attrb('doc'),
+                                            row= 2, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc25': self.create_space(2, row= 2, column= 5, sticky= (EW)),
+                'doc': self.create_entry(self.src.get_attrb('doc'),
+                                           row= 2, column= 6, sticky=(EW),
+                                           justify= CENTER),
+                'spc27': self.create_space(5, row= 2, column= 7, sticky= (EW)),
+                # Row 3
+                'lbl_uis': self.create_label(self.src.get_attrb('bnk_uis'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
+                'bnk_uis': self.create_entry(self.src.get_attrb('bnk_uis'),
+                                           row= 3, column= 2, sticky=(EW),
+                                           justify= CENTER, validate= 'focusout',
+                                           validatecommand= self.src.validate_size_setting),
+                'spc33': self.create_space(2, row= 3, column= 3, sticky= (EW)),
+                'lbl_sip': self.create_label(self.src.get_attrb('bnk_sip'),
+                                            row= 3, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+                'spc35': self.create_space(2, row= 3, column= 5, sticky= (EW)),
+                'bnk_sip': self.create_entry(self.src.get_attrb('bnk_sip'),
+                                           row= 3, column= 6, sticky=(EW),
+                                           justify= CENTER, validate= 'focusout',
+                                           validatecommand= self.src.validate_size_setting),
+                'spc37': self.create_space(2, row= 3, column= 7, sticky= (EW)),
+                # Row 4
+                'blank1': self.create_space(40, row= 4, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                # Row 5
+                'lbl_tbats': self.create_label(self.src.get_attrb('bnk_tbats'),
+                                            row= 5, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
+                'bnk_tbats': self.create_entry(self.src.get_attrb('bnk_tbats'),
+                                           row= 5, column= 2, sticky=(EW),
+                                           justify= CENTER) ,
+                # Row 6
+                'lbl_cap': self.create_label(self.src.get_attrb('bnk_cap'),
+                                            row= 6, column= 0, justify= RIGHT,
+                                            width= 40, sticky= (EW), columnspan= 3),
+                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
+                'bnk_cap': self.create_entry(self.src.get_attrb('bnk_cap'),
+                                           row= 6, column= 2, sticky=(EW),
+                                           justify= CENTER) ,
+                'spc63': self.create_space(2, row= 6, column= 3, sticky= (EW)),
+                'lbl_vo': self.create_label(self.src.get_attrb('bnk_vo'),
+                                            row= 6, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+                'spc65': self.create_space(2, row= 6, column= 5, sticky= (EW)),
+                'bnk_vo': self.create_entry(self.src.get_attrb('bnk_vo'),
+                                           row= 6, column= 6, sticky=(EW),
+                                           justify= CENTER) ,
+                # Row 7
+                 'blank2': self.create_space(40, row= 7, column= 0, sticky=(EW),
+                                           columnspan= 10)
+
+                }
+
+
+class BatteryForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),               
+                'lbl_mfg':self.create_label(self.src.get_attrb('b_mfg'),
+                                            row= 2, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
+                'b_mfg': self.create_entry(self.src.get_attrb('b_mfg'),
+                                           row= 2, column= 2, sticky=(EW), 
+                                           name= self.src.get_attrb_name('b_mfg'),
+                                           justify= CENTER),               
+                'spc22': self.create_space(5, row= 2, column= 3, sticky= (EW)),
+                'lbl_mdl': self.create_label(self.src.get_attrb('b_mdl'),
+                                            row= 2, column= 5, justify= RIGHT,
+                                            sticky= (EW)),
+#                'spc23': self.create_space(2, row= 2, column= 5, sticky= (EW)),
+                'b_mdl': self.create_entry(self.src.get_attrb('b_mdl'),
+                                           row= 2, column= 6, sticky=(EW), 
+                                           justify= CENTER),               
+                'spc24': self.create_space(5, row= 2, column= 7, sticky= (EW)),
+                'lbl_typ': self.create_label(self.src.get_attrb('b_typ'),
+                                            row= 2, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc25': self.create_space(2, row= 2, column= 9, sticky= (EW)),
+                'b_typ': self.create_dropdown(self.src.get_attrb('b_typ'),
+                                           row= 2, column= 10, sticky=(EW), 
+                                           justify= CENTER),               
+                'lbl_desc': self.create_label(self.src.get_attrb('b_desc'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
+                'b_desc': self.create_entry(self.src.get_attrb('b_desc'),
+                                           row= 3, column= 2, sticky=(EW), 
+                                           justify= LEFT, columnspan= 9) ,              
+                'lbl_ir': self.create_label(self.src.get_attrb('b_ir'),
+                                            row= 4, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 4, column= 2, sticky= (EW)),
+                'b_ir': self.create_entry(self.src.get_attrb('b_ir'),
+                                           row= 4, column= 3, sticky=(EW), 
+                                           justify= CENTER) ,              
+                 'lbl_nv': self.create_label(self.src.get_attrb('b_nomv'),
+                                            row= 4, column= 7, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 4, column= 2, sticky= (EW)),
+                'b_nomv': self.create_entry(self.src.get_attrb('b_nomv'),
+                                           row= 4, column= 10, sticky=(EW), 
+                                           justify= CENTER,
+                                           On_change= self.src.on_form_change),                
+                'lbl_cap': self.create_label(self.src.get_attrb('b_rcap'),
+                                            row= 5, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_rcap': self.create_entry(self.src.get_attrb('b_rcap'),
+                                           row= 5, column= 3, sticky=(EW), 
+                                           justify= CENTER,
+                                           On_change= self.src.on_form_change),
+                 'lbl_hrs': self.create_label(self.src.get_attrb('b_rhrs'),
+                                            row= 5, column= 7, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_rhrs': self.create_entry(self.src.get_attrb('b_rhrs'),
+                                           row= 5, column= 10, sticky=(EW), 
+                                           justify= CENTER),               
+ 
+                'lbl_tc': self.create_label(self.src.get_attrb('b_tmpc'),
+                                            row= 6, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_tmpc': self.create_entry(self.src.get_attrb('b_tmpc'),
+                                           row= 6, column= 3, sticky=(EW), 
+                                           justify= CENTER) ,              
+                 'lbl_st': self.create_label(self.src.get_attrb('b_stdTemp'),
+                                            row= 6, column= 7, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_stdTemp': self.create_entry(self.src.get_attrb('b_stdTemp'),
+                                           row= 6, column= 10, sticky=(EW), 
+                                           justify= CENTER),               
+ 
+                'lbl_mxdc': self.create_label(self.src.get_attrb('b_mxDschg'),
+                                            row= 7, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_mxDschg': self.create_entry(self.src.get_attrb('b_mxDschg'),
+                                           row= 7, column= 3, sticky=(EW), 
+                                           justify= CENTER) ,              
+                 'lbl_mxDoD': self.create_label(self.src.get_attrb('b_mxDoD'),
+                                            row= 7, column= 7, justify= RIGHT,
+                                            sticky= (EW), columnspan= 3),
+#                'spc41': self.create_space(2, row= 5, column= 2, sticky= (EW)),
+                'b_mxDoD': self.create_entry(self.src.get_attrb('b_mxDoD'),
+                                           row= 7, column= 10, sticky=(EW), 
+                                           justify= CENTER),               
+
+                'blank1': self.create_space(40, row= 8, column= 0, sticky=(EW),
+                                           columnspan= 10)               
+            
+                }
+
+
+class PanelForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                'lbl_mfg':self.create_label(self.src.get_attrb('m_mfg'),
+                                            row= 2, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 3),
+                'spc21': self.create_space(2, row= 2, column= 4, sticky= (EW)),
+                'm_mfg': self.create_dropdown(self.src.get_attrb('m_mfg'),
+                                           row= 2, column= 5, sticky=(EW),
+                                           name= self.src.get_attrb_name('m_mfg'),
+                                           width= 45, justify= CENTER, columnspan= 5,
+                                           validate= 'focusin',
+                                           validatecommand= self.src.validate_mfg_setting),
+                'lbl_mdl': self.create_label(self.src.get_attrb('m_mdl'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            columnspan = 3),
+                'spc35': self.create_space(2, row= 3, column= 5, sticky= (EW)),
+                'm_mdl': self.create_dropdown(self.src.get_attrb('m_mdl'),
+                                           row= 3, column= 5, sticky=(EW),
+                                           justify= CENTER, width= 35, columnspan= 5,
+                                           validate= 'focusin',
+                                           validatecommand= self.src.validate_mdl_setting),
+                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
+                                            row= 4, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc41': self.create_space(2, row= 4, column= 1, sticky= (EW)),
+                'Name': self.create_entry(self.src.get_attrb('Name'),
+                                           row= 4, column= 2, sticky=(EW),
+                                           justify= LEFT, columnspan= 8) ,
+
+                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
+                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
+                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
+                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
+                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
+                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
+                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
+                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
+                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
+                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
+                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
+
+                'lbl_PTC':self.create_label(self.src.get_attrb('PTC'),
+                                             row= 6, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
+                'PTC': self.create_entry(self.src.get_attrb('PTC'),
+                                             row= 6, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'spc62': self.create_space(2, row= 6, column= 3, sticky= (EW)),
+               'lbl_vmp': self.create_label(self.src.get_attrb('V_mp_ref'),
+                                             row= 6, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'V_mp_ref': self.create_entry(self.src.get_attrb('V_mp_ref'),
+                                             row= 6, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_imp':self.create_label(self.src.get_attrb('I_mp_ref'),
+                                             row= 6, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc71': self.create_space(2, row= 6, column= 9, sticky= (EW)),
+                'I_mp_ref': self.create_entry(self.src.get_attrb('I_mp_ref'),
+                                             row= 6, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+               'lbl_voc': self.create_label(self.src.get_attrb('V_oc_ref'),
+                                             row= 7, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+               'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
+                'V_oc_ref': self.create_entry(self.src.get_attrb('V_oc_ref'),
+                                             row= 7, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_isc': self.create_label(self.src.get_attrb('I_sc_ref'),
+                                             row= 7, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'I_sc_ref': self.create_entry(self.src.get_attrb('I_sc_ref'),
+                                             row= 7, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_tech': self.create_label(self.src.get_attrb('Technology'),
+                                             row= 7, column= 8, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'Technology': self.create_entry(self.src.get_attrb('Technology'),
+                                             row= 7, column= 10, justify= CENTER,
+                                            sticky= (EW)),
+
+              'lbl_rs': self.create_label(self.src.get_attrb('R_s'),
+                                             row= 8, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'R_s': self.create_entry(self.src.get_attrb('R_s'),
+                                             row= 8, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_rsh': self.create_label(self.src.get_attrb('R_sh_ref'),
+                                             row= 8, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'R_sh_ref': self.create_entry(self.src.get_attrb('R_sh_ref'),
+                                             row= 8, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_noct':self.create_label(self.src.get_attrb('T_NOCT'),
+                                             row= 8, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+               'spc71': self.create_space(2, row= 8, column= 9, sticky= (EW)),
+                'T_NOCT': self.create_entry(self.src.get_attrb('T_NOCT'),
+                                             row= 8, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_ac': self.create_label(self.src.get_attrb('A_c'),
+                                             row= 9, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'A_c': self.create_entry(self.src.get_attrb('A_c'),
+                                             row= 9, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_ns': self.create_label(self.src.get_attrb('N_s'),
+                                             row= 9, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'N_s': self.create_entry(self.src.get_attrb('N_s'),
+                                             row= 9, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_bipv':self.create_label(self.src.get_attrb('BIPV'),
+                                             row= 9, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+                'BIPV': self.create_entry(self.src.get_attrb('BIPV'),
+                                             row= 9, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_asc': self.create_label(self.src.get_attrb('alpha_sc'),
+                                             row= 10, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'alpha_sc': self.create_entry(self.src.get_attrb('alpha_sc'),
+                                             row= 10, column= 2, justify= LEFT,
+                                            sticky= (EW), width= 20),
+               'lbl_boc': self.create_label(self.src.get_attrb('beta_oc'),
+                                             row= 10, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'beta_oc': self.create_entry(self.src.get_attrb('beta_oc'),
+                                             row= 10, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_aref':self.create_label(self.src.get_attrb('a_ref'),
+                                             row= 10, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+#               'spc71': self.create_space(2, row= 11, column= 1, sticky= (EW)),
+                'a_ref': self.create_entry(self.src.get_attrb('a_ref'),
+                                             row= 10, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+#               'spc72': self.create_space(2, row= 11, column= 3, sticky= (EW)),
+               'lbl_ilref': self.create_label(self.src.get_attrb('I_L_ref'),
+                                             row= 11, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+#               'spc62': self.create_space(2, row= 6, column= 5, sticky= (EW)),
+                'I_L_ref': self.create_entry(self.src.get_attrb('I_L_ref'),
+                                             row= 11, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_ioref': self.create_label(self.src.get_attrb('I_o_ref'),
+                                             row= 11, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'I_o_ref': self.create_entry(self.src.get_attrb('I_o_ref'),
+                                             row= 11, column= 6, justify= LEFT,
+                                            sticky= (EW), width= 20),
+
+                'lbl_adj':self.create_label(self.src.get_attrb('Adjust'),
+                                             row= 11, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+#               'spc71': self.create_space(2, row= 12, column= 1, sticky= (EW)),
+                'Adjust': self.create_entry(self.src.get_attrb('Adjust'),
+                                             row= 11, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+#               'spc72': self.create_space(2, row= 12, column= 3, sticky= (EW)),
+               'lbl_gmr': self.create_label(self.src.get_attrb('gamma_r'),
+                                             row= 12, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+#               'spc62': self.create_space(2, row= 6, column= 5, sticky= (EW)),
+                'gamma_r': self.create_entry(self.src.get_attrb('gamma_r'),
+                                             row= 12, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+
+                'blank4': self.create_space(40, row= 15, column= 0, sticky=(EW),
+                                           columnspan= 10)
+                }
+
+
+class InverterForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                'lbl_mfg':self.create_label(self.src.get_attrb('i_mfg'),
+                                            row= 2, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 3),
+                'spc21': self.create_space(2, row= 2, column= 4, sticky= (EW)),
+                'i_mfg': self.create_dropdown(self.src.get_attrb('i_mfg'),
+                                           row= 2, column= 5, sticky=(EW),
+                                           width= 45, justify= CENTER, columnspan= 5,
+                                           validate= 'focusin',
+                                           validatecommand= self.src.validate_mfg_setting),
+                'lbl_mdl': self.create_label(self.src.get_attrb('i_mdl'),
+                                            row= 3, column= 0, justify= RIGHT,
+                                            columnspan = 3),
+                'spc31': self.create_space(2, row= 3, column= 5, sticky= (EW)),
+                'i_mdl': self.create_dropdown(self.src.get_attrb('i_mdl'),
+                                           row= 3, column= 5, sticky=(EW),
+                                           justify= CENTER, width= 35, columnspan= 5,
+                                           validate= 'focusin',
+                                           validatecommand= self.src.validate_mdl_setting),
+                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
+                                            row= 4, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc31': self.create_space(2, row= 4, column= 1, sticky= (EW)),
+                'Name': self.create_entry(self.src.get_attrb('Name'),
+                                           row= 4, column= 2, sticky=(EW),
+                                           justify= LEFT, columnspan= 8) ,
+
+                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
+                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
+                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
+                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
+                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
+                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
+                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
+                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
+                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
+                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
+                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
+
+                'lbl_paco':self.create_label(self.src.get_attrb('Paco'),
+                                             row= 6, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
+                'Paco': self.create_entry(self.src.get_attrb('Paco'),
+                                             row= 6, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'spc62': self.create_space(2, row= 6, column= 3, sticky= (EW)),
+               'lbl_pdco': self.create_label(self.src.get_attrb('Pdco'),
+                                             row= 6, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'Pdco': self.create_entry(self.src.get_attrb('Pdco'),
+                                             row= 6, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_pnt':self.create_label(self.src.get_attrb('Pnt'),
+                                             row= 6, column= 8, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc71': self.create_space(2, row= 6, column= 9, sticky= (EW)),
+                'Pnt': self.create_entry(self.src.get_attrb('Pnt'),
+                                             row= 6, column= 10, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_vac': self.create_label(self.src.get_attrb('Vac'),
+                                             row= 7, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+               'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
+                'Vac': self.create_entry(self.src.get_attrb('Vac'),
+                                             row= 7, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_vdc': self.create_label(self.src.get_attrb('Vdco'),
+                                             row= 7, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+               'Vdco': self.create_entry(self.src.get_attrb('Vdco'),
+                                             row= 7, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+              'lbl_vdmx': self.create_label(self.src.get_attrb('Vdcmax'),
+                                             row= 8, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+               'Vdcmax': self.create_entry(self.src.get_attrb('Vdcmax'),
+                                             row= 8, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_idmx': self.create_label(self.src.get_attrb('Idcmax'),
+                                             row= 8, column= 4, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'Idcmax': self.create_entry(self.src.get_attrb('Idcmax'),
+                                             row= 8, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_mplow': self.create_label(self.src.get_attrb('Mppt_low'),
+                                             row= 9, column= 0, justify= RIGHT,
+                                            sticky= (EW), columnspan = 2),
+                'Mppt_low': self.create_entry(self.src.get_attrb('Mppt_low'),
+                                             row= 9, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'lbl_mphgh': self.create_label(self.src.get_attrb('Mppt_high'),
+                                             row= 9, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'Mppt_high': self.create_entry(self.src.get_attrb('Mppt_high'),
+                                             row= 9, column= 6, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'blank4': self.create_space(40, row= 15, column= 0, sticky=(EW),
+                                           columnspan= 10)
+                }
+
+
+class ChgCntlForm(DataForm):
+    def __init__(self, parent_frame, data_src, **kargs):
+        DataForm.__init__(self, parent_frame, data_src, **kargs)
+
+    def define_layout(self):
+        self.wdg_dict = {
+                 'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
+                                           columnspan= 10),
+                'lbl_mfg':self.create_label(self.src.get_attrb('c_mfg'),
+                                            row= 2, column= 0, justify= LEFT,
+                                            sticky= (EW)),
+                'c_mfg': self.create_entry(self.src.get_attrb('c_mfg'),
+                                           row= 2, column= 1, sticky=(EW),
+                                           width= 25, justify= CENTER, columnspan= 5),
+                'lbl_mdl': self.create_label(self.src.get_attrb('c_mdl'),
+                                            row= 3, column= 0, justify= LEFT),
+                'c_mdl': self.create_entry(self.src.get_attrb('c_mdl'),
+                                           row= 3, column= 1, sticky=(EW),
+                                           justify= CENTER, width= 25, columnspan= 3),
+                'lbl_typ': self.create_label(self.src.get_attrb('c_type'),
+                                            row= 3, column= 7, justify= RIGHT),
+                'c_type': self.create_dropdown(self.src.get_attrb('c_type'),
+                                           row= 3, column= 8, sticky=(EW),
+                                           justify= CENTER, width= 10),
+                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
+                                            row= 4, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc31': self.create_space(2, row= 4, column= 1, sticky= (EW)),
+                'Name': self.create_entry(self.src.get_attrb('Name'),
+                                           row= 4, column= 2, sticky=(EW),
+                                           justify= LEFT, columnspan= 8) ,
+
+                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
+                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
+                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
+                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
+                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
+                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
+                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
+                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
+                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
+                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
+                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
+
+                'lbl_mxv':self.create_label(self.src.get_attrb('c_pvmxv'),
+                                             row= 6, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
+                'c_pvmxv': self.create_entry(self.src.get_attrb('c_pvmxv'),
+                                             row= 6, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+               'spc63': self.create_space(2, row= 6, column= 3, sticky= (EW)),
+               'lbl_isc': self.create_label(self.src.get_attrb('c_pvmxi'),
+                                             row= 6, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+               'c_pvmxi': self.create_entry(self.src.get_attrb('c_pvmxi'),
+                                             row= 6, column= 5, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_bv':self.create_label(self.src.get_attrb('c_bvnom'),
+                                             row= 7, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
+                'c_bvnom': self.create_entry(self.src.get_attrb('c_bvnom'),
+                                             row= 7, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+                'lbl_mvchg':self.create_label(self.src.get_attrb('c_mvchg'),
+                                             row= 7, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'c_mvchg': self.create_entry(self.src.get_attrb('c_mvchg'),
+                                             row= 7, column= 5, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+                'lbl_michg':self.create_label(self.src.get_attrb('c_michg'),
+                                             row= 8, column= 0, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc81': self.create_space(2, row= 8, column= 1, sticky= (EW)),
+                'c_michg': self.create_entry(self.src.get_attrb('c_michg'),
+                                             row= 8, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_mvdchg':self.create_label(self.src.get_attrb('c_midschg'),
+                                             row= 8, column= 4, justify= RIGHT,
+                                            sticky= (EW)),
+                'c_midschg': self.create_entry(self.src.get_attrb('c_midschg'),
+                                             row= 8, column= 5, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+               'lbl_tmpc': self.create_label(self.src.get_attrb('c_tmpc'),
+                                             row= 9, column= 0, justify= RIGHT,
+                                            sticky= (W)),
+                'spc91': self.create_space(2, row= 9, column= 1, sticky= (EW)),
+                'c_tmpc': self.create_entry(self.src.get_attrb('c_tmpc'),
+                                             row= 9, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_tmpr':self.create_label(self.src.get_attrb('c_tmpr'),
+                                             row= 9, column=4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc94': self.create_space(2, row= 9, column= 5, sticky= (EW)),
+                'c_tmpr': self.create_entry(self.src.get_attrb('c_tmpr'),
+                                             row= 9, column= 5, justify= CENTER,
+                                            sticky= (EW), width= 10),
+
+               'lbl_sPow': self.create_label(self.src.get_attrb('c_cnsmpt'),
+                                             row= 10, column= 0, justify= RIGHT,
+                                            sticky= (W)),
+                'spc101': self.create_space(2, row= 10, column= 1, sticky= (EW)),
+                'c_cnsmpt': self.create_entry(self.src.get_attrb('c_cnsmpt'),
+                                             row= 10, column= 2, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                'lbl_eff':self.create_label(self.src.get_attrb('c_eff'),
+                                             row= 10, column=4, justify= RIGHT,
+                                            sticky= (EW)),
+                'spc104': self.create_space(2, row= 10, column= 5, sticky= (EW)),
+                'c_eff': self.create_entry(self.src.get_attrb('c_eff'),
+                                             row= 10, column= 5, justify= CENTER,
+                                            sticky= (EW), width= 10),
+                }
+
+def main():
+    print('PVForms Load Check')
+
+
+if __name__ == '__main__':
+    main()
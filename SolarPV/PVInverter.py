@@ -4,6 +4,7 @@
 Created on Thu Oct  4 17:37:01 2018
 Modified on 02/22/2019 for version 0.1.0
 Modified on 3/4/2019 for issue #17
+Modified on 10/17/2026 to move the data entry form to PVForms
 
 
 @author: Bob Hentz
@@ -21,7 +22,6 @@ Modified on 3/4/2019 for issue #17
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from FormBuilder import *
 from PVUtilities import *
 from Component import *
 from FieldClasses import data_field, option_field
@@ -135,121 +135,13 @@ class PVInverter(Component):
 
     def display_input_form(self, parent_frame):
         """ Generate the data entry form """
+        from tkinter import GROOVE
+        from PVForms import InverterForm
         self.parent_frame = parent_frame
         self.form = InverterForm(parent_frame, self, row=1, column=1,  width= 300, height= 300,
                       borderwidth= 5, relief= GROOVE, padx= 10, pady= 10, ipadx= 5, ipady= 5)
         return self.form
 
-class InverterForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                'lbl_mfg':self.create_label(self.src.get_attrb('i_mfg'),
-                                            row= 2, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 3),
-                'spc21': self.create_space(2, row= 2, column= 4, sticky= (EW)),
-                'i_mfg': self.create_dropdown(self.src.get_attrb('i_mfg'),
-                                           row= 2, column= 5, sticky=(EW),
-                                           width= 45, justify= CENTER, columnspan= 5,
-                                           validate= 'focusin',
-                                           validatecommand= self.src.validate_mfg_setting),
-                'lbl_mdl': self.create_label(self.src.get_attrb('i_mdl'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            columnspan = 3),
-                'spc31': self.create_space(2, row= 3, column= 5, sticky= (EW)),
-                'i_mdl': self.create_dropdown(self.src.get_attrb('i_mdl'),
-                                           row= 3, column= 5, sticky=(EW),
-                                           justify= CENTER, width= 35, columnspan= 5,
-                                           validate= 'focusin',
-                                           validatecommand= self.src.validate_mdl_setting),
-                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
-                                            row= 4, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc31': self.create_space(2, row= 4, column= 1, sticky= (EW)),
-                'Name': self.create_entry(self.src.get_attrb('Name'),
-                                           row= 4, column= 2, sticky=(EW),
-                                           justify= LEFT, columnspan= 8) ,
-
-                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
-                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
-                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
-                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
-                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
-                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
-                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
-                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
-                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
-                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
-                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
-
-                'lbl_paco':self.create_label(self.src.get_attrb('Paco'),
-                                             row= 6, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
-                'Paco': self.create_entry(self.src.get_attrb('Paco'),
-                                             row= 6, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'spc62': self.create_space(2, row= 6, column= 3, sticky= (EW)),
-               'lbl_pdco': self.create_label(self.src.get_attrb('Pdco'),
-                                             row= 6, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'Pdco': self.create_entry(self.src.get_attrb('Pdco'),
-                                             row= 6, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_pnt':self.create_label(self.src.get_attrb('Pnt'),
-                                             row= 6, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc71': self.create_space(2, row= 6, column= 9, sticky= (EW)),
-                'Pnt': self.create_entry(self.src.get_attrb('Pnt'),
-                                             row= 6, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_vac': self.create_label(self.src.get_attrb('Vac'),
-                                             row= 7, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-               'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
-                'Vac': self.create_entry(self.src.get_attrb('Vac'),
-                                             row= 7, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_vdc': self.create_label(self.src.get_attrb('Vdco'),
-                                             row= 7, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-               'Vdco': self.create_entry(self.src.get_attrb('Vdco'),
-                                             row= 7, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-              'lbl_vdmx': self.create_label(self.src.get_attrb('Vdcmax'),
-                                             row= 8, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-               'Vdcmax': self.create_entry(self.src.get_attrb('Vdcmax'),
-                                             row= 8, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_idmx': self.create_label(self.src.get_attrb('Idcmax'),
-                                             row= 8, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'Idcmax': self.create_entry(self.src.get_attrb('Idcmax'),
-                                             row= 8, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_mplow': self.create_label(self.src.get_attrb('Mppt_low'),
-                                             row= 9, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'Mppt_low': self.create_entry(self.src.get_attrb('Mppt_low'),
-                                             row= 9, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_mphgh': self.create_label(self.src.get_attrb('Mppt_high'),
-                                             row= 9, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'Mppt_high': self.create_entry(self.src.get_attrb('Mppt_high'),
-                                             row= 9, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'blank4': self.create_space(40, row= 15, column= 0, sticky=(EW),
-                                           columnspan= 10)
-                }
-
-
-
 def main():
     print ('Inverter Definition Check')
 
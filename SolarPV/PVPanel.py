@@ -4,6 +4,7 @@
 Created on Tue Oct  2 12:40:59 2018
 Modified on 02/22/2019 for version 0.1.0
 Modified on 3/4/2019 for issue #17
+Modified on 10/17/2026 to move the data entry form to PVForms
 
 @author: Bob Hentz
 
@@ -21,9 +22,7 @@ Modified on 3/4/2019 for issue #17
  -------------------------------------------------------------------------------
 """
 #from PVUtilities import *
-from tkinter import *
 from Component import Component
-from FormBuilder import DataForm
 from FieldClasses import data_field, option_field
 
 class PVPanel(Component):
@@ -134,6 +133,8 @@ class PVPanel(Component):
 
 
     def display_input_form(self, parent_frame):
+        from tkinter import GROOVE
+        from PVForms import PanelForm
         self.parent_frame = parent_frame
         self.form = PanelForm(parent_frame, self, row=1, column=1,  width= 300, height= 300,
                       borderwidth= 5, relief= GROOVE, padx= 10, pady= 10, ipadx= 5, ipady= 5)
@@ -141,189 +142,6 @@ class PVPanel(Component):
 
 
 #Define the data entry form for the Solar Panel
-class PanelForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),
-                'lbl_mfg':self.create_label(self.src.get_attrb('m_mfg'),
-                                            row= 2, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 3),
-                'spc21': self.create_space(2, row= 2, column= 4, sticky= (EW)),
-                'm_mfg': self.create_dropdown(self.src.get_attrb('m_mfg'),
-                                           row= 2, column= 5, sticky=(EW),
-                                           name= self.src.get_attrb_name('m_mfg'),
-                                           width= 45, justify= CENTER, columnspan= 5,
-                                           validate= 'focusin',
-                                           validatecommand= self.src.validate_mfg_setting),
-                'lbl_mdl': self.create_label(self.src.get_attrb('m_mdl'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            columnspan = 3),
-                'spc35': self.create_space(2, row= 3, column= 5, sticky= (EW)),
-                'm_mdl': self.create_dropdown(self.src.get_attrb('m_mdl'),
-                                           row= 3, column= 5, sticky=(EW),
-                                           justify= CENTER, width= 35, columnspan= 5,
-                                           validate= 'focusin',
-                                           validatecommand= self.src.validate_mdl_setting),
-                'lbl_desc': self.create_label(self.src.get_attrb('Name'),
-                                            row= 4, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc41': self.create_space(2, row= 4, column= 1, sticky= (EW)),
-                'Name': self.create_entry(self.src.get_attrb('Name'),
-                                           row= 4, column= 2, sticky=(EW),
-                                           justify= LEFT, columnspan= 8) ,
-
-                'col40': self.create_space(10, row= 5, column= 0, sticky= (EW)),
-                'col41': self.create_space(10, row= 5, column= 1, sticky= (EW)),
-                'col42': self.create_space(10, row= 5, column= 2, sticky= (EW)),
-                'col43': self.create_space(10, row= 5, column= 3, sticky= (EW)),
-                'col44': self.create_space(10, row= 5, column= 4, sticky= (EW)),
-                'col45': self.create_space(10, row= 5, column= 5, sticky= (EW)),
-                'col46': self.create_space(10, row= 5, column= 6, sticky= (EW)),
-                'col47': self.create_space(10, row= 5, column= 7, sticky= (EW)),
-                'col48': self.create_space(10, row= 5, column= 8, sticky= (EW)),
-                'col49': self.create_space(10, row= 5, column= 9, sticky= (EW)),
-                'col410': self.create_space(10, row= 5, column= 10, sticky= (EW)),
-
-                'lbl_PTC':self.create_label(self.src.get_attrb('PTC'),
-                                             row= 6, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc61': self.create_space(2, row= 6, column= 1, sticky= (EW)),
-                'PTC': self.create_entry(self.src.get_attrb('PTC'),
-                                             row= 6, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'spc62': self.create_space(2, row= 6, column= 3, sticky= (EW)),
-               'lbl_vmp': self.create_label(self.src.get_attrb('V_mp_ref'),
-                                             row= 6, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'V_mp_ref': self.create_entry(self.src.get_attrb('V_mp_ref'),
-                                             row= 6, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_imp':self.create_label(self.src.get_attrb('I_mp_ref'),
-                                             row= 6, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc71': self.create_space(2, row= 6, column= 9, sticky= (EW)),
-                'I_mp_ref': self.create_entry(self.src.get_attrb('I_mp_ref'),
-                                             row= 6, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-               'lbl_voc': self.create_label(self.src.get_attrb('V_oc_ref'),
-                                             row= 7, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-               'spc71': self.create_space(2, row= 7, column= 1, sticky= (EW)),
-                'V_oc_ref': self.create_entry(self.src.get_attrb('V_oc_ref'),
-                                             row= 7, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_isc': self.create_label(self.src.get_attrb('I_sc_ref'),
-                                             row= 7, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'I_sc_ref': self.create_entry(self.src.get_attrb('I_sc_ref'),
-                                             row= 7, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_tech': self.create_label(self.src.get_attrb('Technology'),
-                                             row= 7, column= 8, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'Technology': self.create_entry(self.src.get_attrb('Technology'),
-                                             row= 7, column= 10, justify= CENTER,
-                                            sticky= (EW)),
-
-              'lbl_rs': self.create_label(self.src.get_attrb('R_s'),
-                                             row= 8, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'R_s': self.create_entry(self.src.get_attrb('R_s'),
-                                             row= 8, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_rsh': self.create_label(self.src.get_attrb('R_sh_ref'),
-                                             row= 8, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'R_sh_ref': self.create_entry(self.src.get_attrb('R_sh_ref'),
-                                             row= 8, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_noct':self.create_label(self.src.get_attrb('T_NOCT'),
-                                             row= 8, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-               'spc71': self.create_space(2, row= 8, column= 9, sticky= (EW)),
-                'T_NOCT': self.create_entry(self.src.get_attrb('T_NOCT'),
-                                             row= 8, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_ac': self.create_label(self.src.get_attrb('A_c'),
-                                             row= 9, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'A_c': self.create_entry(self.src.get_attrb('A_c'),
-                                             row= 9, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_ns': self.create_label(self.src.get_attrb('N_s'),
-                                             row= 9, column= 4, justify= RIGHT,
-                                            sticky= (EW)),
-                'N_s': self.create_entry(self.src.get_attrb('N_s'),
-                                             row= 9, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_bipv':self.create_label(self.src.get_attrb('BIPV'),
-                                             row= 9, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-                'BIPV': self.create_entry(self.src.get_attrb('BIPV'),
-                                             row= 9, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_asc': self.create_label(self.src.get_attrb('alpha_sc'),
-                                             row= 10, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'alpha_sc': self.create_entry(self.src.get_attrb('alpha_sc'),
-                                             row= 10, column= 2, justify= LEFT,
-                                            sticky= (EW), width= 20),
-               'lbl_boc': self.create_label(self.src.get_attrb('beta_oc'),
-                                             row= 10, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'beta_oc': self.create_entry(self.src.get_attrb('beta_oc'),
-                                             row= 10, column= 6, justify= CENTER,
-                                            sticky= (EW), width= 10),
-                'lbl_aref':self.create_label(self.src.get_attrb('a_ref'),
-                                             row= 10, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-#               'spc71': self.create_space(2, row= 11, column= 1, sticky= (EW)),
-                'a_ref': self.create_entry(self.src.get_attrb('a_ref'),
-                                             row= 10, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-#               'spc72': self.create_space(2, row= 11, column= 3, sticky= (EW)),
-               'lbl_ilref': self.create_label(self.src.get_attrb('I_L_ref'),
-                                             row= 11, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-#               'spc62': self.create_space(2, row= 6, column= 5, sticky= (EW)),
-                'I_L_ref': self.create_entry(self.src.get_attrb('I_L_ref'),
-                                             row= 11, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-               'lbl_ioref': self.create_label(self.src.get_attrb('I_o_ref'),
-                                             row= 11, column= 4, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-                'I_o_ref': self.create_entry(self.src.get_attrb('I_o_ref'),
-                                             row= 11, column= 6, justify= LEFT,
-                                            sticky= (EW), width= 20),
-
-                'lbl_adj':self.create_label(self.src.get_attrb('Adjust'),
-                                             row= 11, column= 8, justify= RIGHT,
-                                            sticky= (EW)),
-#               'spc71': self.create_space(2, row= 12, column= 1, sticky= (EW)),
-                'Adjust': self.create_entry(self.src.get_attrb('Adjust'),
-                                             row= 11, column= 10, justify= CENTER,
-                                            sticky= (EW), width= 10),
-#               'spc72': self.create_space(2, row= 12, column= 3, sticky= (EW)),
-               'lbl_gmr': self.create_label(self.src.get_attrb('gamma_r'),
-                                             row= 12, column= 0, justify= RIGHT,
-                                            sticky= (EW), columnspan = 2),
-#               'spc62': self.create_space(2, row= 6, column= 5, sticky= (EW)),
-                'gamma_r': self.create_entry(self.src.get_attrb('gamma_r'),
-                                             row= 12, column= 2, justify= CENTER,
-                                            sticky= (EW), width= 10),
-
-
-                'blank4': self.create_space(40, row= 15, column= 0, sticky=(EW),
-                                           columnspan= 10)
-                }
-
-
-
 def main():
     print ('PVPanel Definition Check')
 
@@ -4,6 +4,13 @@
 Created on Sun Sep 30 11:10:12 2018
 Modified on 11/27/2018 to clean up comments
 Modified on 02/22/2019 for version 0.1.0
+Modified on 10/17/2026 to vectorize the hourly temperature & wind model
+Modified on 10/17/2026 to retrieve elevation data in the background
+Modified on 10/17/2026 to share the solar geometry of the site
+Modified on 10/17/2026 to find sun times once per day
+Modified on 10/17/2026 to refresh atmospherics when the site moves
+Modified on 10/17/2026 to move the data entry form to PVForms
+Modified on 10/17/2026 to keep manual elevation & time zone edits
 
 @author: Bob Hentz
 -------------------------------------------------------------------------------
@@ -17,18 +24,16 @@ Modified on 02/22/2019 for version 0.1.0
                or FITNESS FOR A PARTICULAR PURPOSE.
  -------------------------------------------------------------------------------
 """
-from tkinter import *
+import warnings
 import pandas as pd
 import numpy as np
-from guiFrames import ask_question, popup_notification
-from PVUtilities import dfcell_is_empty, hourly_temp, hourly_speed
+from PVUtilities import (dfcell_is_empty, convert_times_to_dec_hrs,
+                         diurnal_temp, diurnal_speed)
 from Component import Component
-from NasaData import getSiteElevation, LoadNasaData
-from FormBuilder import DataForm
+from NasaData import getSiteElevation, LoadNasaData, get_daily_stat
 from FieldClasses import data_field, option_field
 from pvlib.location import Location
-#from pvlib.solarposition import get_sun_rise_set_transit
-from pvlib.solarposition import sun_rise_set_transit_spa
+from SolarGeometry import get_solar_geometry
 
 from DataFrame import *
 
@@ -39,10 +44,16 @@ class PVSite(Component):
 
     def __init__(self, master, **kargs):
         self.curloc = None
+        self.loc_key = None
         self.air_temp = None
         self.wind_spd = None
         self.atmospherics = None
+        self.atmo_key = None      # (lat, lon) the atmospherics are for,
+                                  # None adopts them for the current site
         self.suntimes = None
+        self.elev_lookup = None   # ((lat, lon), elevation data) of last lookup
+        self.elev_task = None     # ((lat, lon), task) of lookup in progress
+        self.elev_key = None      # (lat, lon) elevation & time zone are for
         Component.__init__(self, master, 'Site Definition', **kargs)
         self.print_order = ['proj', 'client', 'p_desc', 'city', 
                             'cntry', 'lat', 'lon', 'elev', 'tz',
@@ -81,17 +92,24 @@ class PVSite(Component):
         return True, ''
  
     def get_location(self):
-        """ Create & return a PVLIB Location Instance """
-        if self.curloc is None:
-            mtghgt = self.master.ary.read_attrb('mtg_hgt')
-            self.curloc = Location(self.read_attrb('lat'), 
-                            self.read_attrb('lon'), 
+        """ Create & return a PVLIB Location Instance, recreated whenever
+            the site coordinates, elevation or time zone change """
+        mtghgt = self.master.ary.read_attrb('mtg_hgt')
+        lkey = (self.read_attrb('lat'), self.read_attrb('lon'),
+                self.read_attrb('tz'), self.read_attrb('elev') + mtghgt,
+                '{0}, {1}'.format(self.read_attrb('city'),
+                                  self.read_attrb('cntry')))
+        if self.curloc is None or self.loc_key != lkey:
+            self.curloc = Location(lkey[0], lkey[1],
                             #Sets Valid TZ information for Location
-                            tz= f"Etc/GMT{-self.read_attrb('tz'):+}", 
-                            altitude= self.read_attrb('elev') + mtghgt, 
-                            name= '{0}, {1}'.format(self.read_attrb('city'), 
-                                   self.read_attrb('cntry')))
+                            tz= f"Etc/GMT{-lkey[2]:+}", 
+                            altitude= lkey[3], name= lkey[4])
+            self.loc_key = lkey
         return self.curloc
+
+    def get_geometry(self, times):
+        """ Return the shared SolarGeometry of the site over times """
+        return get_solar_geometry(self.get_location(), times)
     
     def validate_country_setting(self):        
         """ Update Grid Voltage & Frequency based on valid country selection """
@@ -109,6 +127,7 @@ class PVSite(Component):
             gaf = osrc[osrc.index.values == val]["Alt-Freq"].values[0]
             if not dfcell_is_empty(gav):
                 s = 'Two Grid Voltages {0} V or {1} V, Select {0} V?'.format(gv, gav)
+                from guiFrames import ask_question
                 if not ask_question('Multiple Grid Voltages', s, parent= self.form ):
                     gv = gav
                     gf = gaf                                        
@@ -128,16 +147,45 @@ class PVSite(Component):
         except:
             return False
 
-#TODO Implement retrieve elevation data functionality when focusin and elev cell is 0.0
     def retrieve_elevation(self, lat, lon):
-        elvdat =  popup_notification(self.form, 
-                        'Retrieving Elevation Data, Please wait', 
-                        getSiteElevation, lat, lon)
-        if elvdat[2] is not None:
-            self.set_attribute('elev',elvdat[2])
+        """ Look up the elevation & time zone for lat, lon without blocking
+            the GUI, reusing the result of the last successful lookup.
+            Nothing is done if they were already applied for lat, lon so
+            that manual edits of elev & tz are kept """
+        key = (float(lat), float(lon))
+        if key == self.elev_key or (self.elev_task is not None and
+                                    self.elev_task[0] == key):
+            return
+        if self.elev_lookup is not None and self.elev_lookup[0] == key:
+            self.apply_elevation(self.elev_lookup[1], key)
+            return
+        if self.elev_task is not None:
+            self.elev_task[1].cancel()
+
+        def on_result(elvdat, error):
+            self.elev_task = None
+            if error is None and elvdat is not None and elvdat[2] is not None:
+                self.elev_lookup = (key, elvdat)
+                self.apply_elevation(elvdat, key)
+
+        from guiFrames import run_in_background
+        self.elev_task = (key, run_in_background(self.form, getSiteElevation,
+                                                 key[0], key[1],
+                                                 callback= on_result))
+
+    def apply_elevation(self, elvdat, key):
+        """ Update elevation & time zone from a getSiteElevation result
+            for the (lat, lon) key """
+        from tkinter import TclError
+        self.elev_key = key
+        self.set_attribute('elev',elvdat[2])
+        self.set_attribute('tz',round(elvdat[0]/15.0,0))
+        try:
             self.form.wdg_dict['elev'].set_val()
-            self.set_attribute('tz',round(elvdat[0]/15.0,0))
             self.form.wdg_dict['tz'].set_val()
+        except TclError:
+            # Form was closed before the lookup completed
+            pass
         
     def validate_lat_lon_setting(self):
         latval = self.form.wdg_dict['lat'].get_val()
@@ -146,23 +194,26 @@ class PVSite(Component):
         lonval = self.form.wdg_dict['lon'].get_val()
         if lonval == '':
             lonval = 0.0
-        elvval = self.form.wdg_dict['elev'].get_val()
-        if elvval == '':
-            elvval = 0.0
-        if self.curloc is None and self._Lentry_valid(latval) and self._Lentry_valid(lonval):
-           self.retrieve_elevation(latval, lonval)
-        elif self.curloc is not None and self._Lentry_valid(latval) and self._Lentry_valid(lonval):
-            if self.curloc[1] != latval or self.curloc[0] != lonval:
-                self.retrieve_elevation(latval, lonval)
-        return True                
-            
+        if self._Lentry_valid(latval) and self._Lentry_valid(lonval):
+            self.retrieve_elevation(latval, lonval)
+        return True
 
     def display_input_form(self, parent_frame):
+        from tkinter import GROOVE
+        from PVForms import SiteForm
         self.parent_frame = parent_frame
         self.form = SiteForm(parent_frame, self, row=1, column=1,  width= 300, height= 300,
                       borderwidth= 5, relief= GROOVE, padx= 10, pady= 10, ipadx= 5, ipady= 5)
+        self.form.bind('<Destroy>', self.on_form_destroy, add= '+')
         return self.form
 
+    def on_form_destroy(self, event):
+        """ Abandon an elevation lookup in progress when its form is closed,
+            so that the site may be looked up again """
+        if event.widget is self.form and self.elev_task is not None:
+            self.elev_task[1].cancel()
+            self.elev_task = None
+
     def get_air_temp(self, times, stat_win):
         """ Get The site specific temperature estimates """
         if self.air_temp is None:
@@ -176,69 +227,72 @@ class PVSite(Component):
         return self.wind_spd
 
     def get_sun_times(self, times):
-        """ Create a DataFrame with SunRise & Sunset Times for each
-            of the 365 days in a year   """           
-        if self.suntimes is None:
-            lt = self.read_attrb('lat')
-            ln = self.read_attrb('lon')
-            #st = get_sun_rise_set_transit(times, lt, ln)
-            st = sun_rise_set_transit_spa(times, lt, ln)
-            sunup = []
-            sundwn = []
-            transit = []
-            doy = []
-            for i in range(365):
-                sunup.append(st.iloc[i*24]['sunrise'])
-                sundwn.append(st.iloc[i*24]['sunset'])
-                transit.append(st.iloc[i*24]['transit'])
-                doy.append(times[i*24].date())
-            df_dict = {'Sunrise': sunup,
-                       'Sunset':sundwn,
-                       'Transit':transit}
-            self.suntimes = pd.DataFrame(data= df_dict, index= doy)
+        """ Create a DataFrame with SunRise, Sunset & Transit Times for each
+            day spanned by times, indexed by date.  The times are computed
+            once per day by the site's SolarGeometry """
+        st = self.get_geometry(times).get_sun_times()
+        suns = st[['sunrise', 'sunset', 'transit']].copy()
+        suns.columns = ['Sunrise', 'Sunset', 'Transit']
+        suns.index = st.index.date
+        self.suntimes = suns
         return self.suntimes
         
     
+    def get_diurnal_times(self, times):
+        """ Return the day of year index of times together with the decimal
+            hours of times, and of the sunrise & sunset of their day, used
+            by the diurnal temperature & wind speed models """
+        # Sun times depend only on the local date, so find them once per day
+        geom = self.get_geometry(times)
+        dpos = geom.get_day_positions()
+        sunlight = geom.get_sun_times()
+        # Current time is measured in UTC hours, as the hourly_temp &
+        # hourly_speed models have always done
+        current = convert_times_to_dec_hrs(times.tz_convert('UTC'))
+        sunrise = convert_times_to_dec_hrs(sunlight.iloc[:, 0])[dpos]
+        sunset = convert_times_to_dec_hrs(sunlight.iloc[:, 1])[dpos]
+        doy = np.asarray(times.dayofyear) - 1
+        return doy, current, sunrise, sunset
+
     def get_atmospherics(self, times, stat_win):
         """ Using NASA meteorlogical data create wind & temp dataframes """
         self.air_temp = None
         self.wind_spd = None
         lt = self.read_attrb('lat')
         ln = self.read_attrb('lon')
+        if self.atmo_key is not None and self.atmo_key != (lt, ln):
+            # Site has moved since the atmospherics were retrieved
+            self.atmospherics = None
+        self.atmo_key = (lt, ln)
         if self.atmospherics is None:
-            self.atmospherics = popup_notification(stat_win, 
-                        'Retrieving Atmospheric Data, Please Wait', 
-                        LoadNasaData, lt,ln)
-            if len(self.atmospherics) == 0:
+            if stat_win is None:
+                self.atmospherics = LoadNasaData(lt, ln)
+            else:
+                from guiFrames import popup_notification
+                self.atmospherics = popup_notification(stat_win,
+                            'Retrieving Atmospheric Data, Please Wait',
+                            LoadNasaData, lt,ln)
+            if self.atmospherics is None or len(self.atmospherics) == 0:
+                # Retrieval failed or was cancelled
                 wm = 'Failed to load Atmospheric data, using fixed temp and wind speed'
-                stat_win.show_message(wm, 'Warning')
+                if stat_win is not None:
+                    stat_win.show_message(wm, 'Warning')
+                else:
+                    warnings.warn(wm)
                 self.air_temp = PVSite.default_temp
                 self.wind_spd = PVSite.default_wind_spd                
         if self.air_temp is None and self.wind_spd is None and self.atmospherics is not None:
-            # Build Arrays of Temps & Wind Speed by Hour            
-            temp =np.zeros([len(times)])
-            speed = np.zeros(len(times))
-            #sunlight = get_sun_rise_set_transit(times, lt, ln)
-            sunlight = sun_rise_set_transit_spa(times, lt, ln)
-            sunindx = list(sunlight.index.values)
-            avt = self.atmospherics['T10M']['S-Mean'].values
-            mxt = self.atmospherics['T10M_MAX']['S-Mean'].values
-            mnt = self.atmospherics['T10M_MIN']['S-Mean'].values
-            avw = self.atmospherics['WS10M']['S-Mean'].values
-            mxw = self.atmospherics['WS10M_MAX']['S-Mean'].values
-            mnw = self.atmospherics['WS10M_MIN']['S-Mean'].values
-            for indx in range(len(sunindx)):
-                doy = indx//24
-                sunrise= sunlight.iloc[indx, 0]
-                sunset =  sunlight.iloc[indx, 1]
-                transit =  sunlight.iloc[indx, 2]
-                current =  np.datetime_as_string(sunindx[indx])
-                temp[indx] = hourly_temp(avt[indx//24], mxt[indx//24], 
-                                       mnt[indx//24], current,
-                                       sunrise, sunset, transit)
-                speed[indx] = hourly_speed(avw[indx//24], mxw[indx//24], 
-                                        mnw[indx//24], current, sunrise, 
-                                        sunset, transit)
+            # Build Arrays of Temps & Wind Speed by Hour
+            doy, current, sunrise, sunset = self.get_diurnal_times(times)
+            atm = self.atmospherics
+            temp = diurnal_temp(get_daily_stat(atm, 'T10M', 'S-Mean')[doy],
+                                get_daily_stat(atm, 'T10M_MAX', 'S-Mean')[doy],
+                                get_daily_stat(atm, 'T10M_MIN', 'S-Mean')[doy],
+                                current, sunrise, sunset)
+            speed = diurnal_speed(get_daily_stat(atm, 'WS10M', 'S-Mean')[doy],
+                                  get_daily_stat(atm, 'WS10M_MAX', 'S-Mean')[doy],
+                                  get_daily_stat(atm, 'WS10M_MIN', 'S-Mean')[doy],
+                                  current, sunrise, sunset)
             self.air_temp = pd.DataFrame(data= temp, index= times, 
                                          columns=['Air_Temp'])
             self.wind_spd = pd.DataFrame(data= speed, index= times, 
@@ -247,105 +301,6 @@ class PVSite(Component):
 
 
 
-class SiteForm(DataForm):
-    def __init__(self, parent_frame, data_src, **kargs):
-        DataForm.__init__(self, parent_frame, data_src, **kargs)
-
-    def define_layout(self):
-        self.wdg_dict = {
-                'blank1': self.create_space(40, row= 1, column= 0, sticky=(EW),
-                                           columnspan= 10),               
-                'lbl_proj':self.create_label(self.src.get_attrb('proj'),
-                                            row= 2, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc21': self.create_space(2, row= 2, column= 1, sticky= (EW)),
-                'proj': self.create_entry(self.src.get_attrb('proj'),
-                                           row= 2, column= 2, sticky=(EW), 
-                                           name= self.src.get_attrb_name('proj'),
-                                           justify= CENTER, columnspan = 4),               
-                'lbl_clnt': self.create_label(self.src.get_attrb('client'),
-                                            row= 2, column= 7, justify= RIGHT ),
-                'client': self.create_entry(self.src.get_attrb('client'),
-                                           row= 2, column= 8, sticky=(EW), 
-                                           justify= CENTER, columnspan= 3),               
-                'spc22': self.create_space(10, row= 2, column= 12, sticky= (EW)),
-                'spc23': self.create_space(10, row= 2, column= 13, sticky= (EW)),                
-                'lbl_desc': self.create_label(self.src.get_attrb('p_desc'),
-                                            row= 3, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc31': self.create_space(2, row= 3, column= 1, sticky= (EW)),
-                'p_desc': self.create_entry(self.src.get_attrb('p_desc'),
-                                           row= 3, column= 2, sticky=(EW), 
-                                           justify= LEFT, columnspan= 10) ,              
-                'blank2': self.create_space(40, row= 4, column= 0, sticky=(EW),
-                                           columnspan= 10),               
-                'lbl_city': self.create_label(self.src.get_attrb('city'),
-                                            row= 5, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc51': self.create_space(2, row= 5, column= 1, sticky= (EW)),
-                'city': self.create_entry(self.src.get_attrb('city'),
-                                           row= 5, column= 2, sticky=(EW), 
-                                           justify= CENTER, columnspan= 3) ,              
-                'spc52': self.create_space(5, row= 5, column= 5, sticky= (EW)),
-                'lbl_cntry': self.create_label(self.src.get_attrb('cntry'),
-                                            row= 5, column= 7, justify= CENTER,
-                                            sticky= (EW)),
-                'cntry': self.create_dropdown(self.src.get_attrb('cntry'),
-                                           row= 5, column= 8, sticky=(EW), 
-                                           justify= CENTER, columnspan= 4,
-                                           validate= 'focusout',
-                                           validatecommand= self.src.validate_country_setting),                
-                'blank3': self.create_space(40, row= 6, column= 0, sticky=(EW),
-                                           columnspan= 10),        
-                'lbl_lat': self.create_label(self.src.get_attrb('lat'),
-                                            row= 8, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc81': self.create_space(2, row= 8, column= 2, sticky= (EW)),
-                'lat': self.create_entry(self.src.get_attrb('lat'),
-                                           row= 8, column= 3, sticky=(EW), 
-                                           justify= CENTER, width=10,
-                                           On_change= self.src.on_form_change,
-                                           validate= 'focusout',
-                                           validatecommand= self.src.validate_lat_lon_setting),
-                'spc82': self.create_space(2, row= 8, column= 5, sticky= (EW)),
-                'lbl_lon': self.create_label(self.src.get_attrb('lon'),
-                                            row= 8, column= 5, justify= RIGHT,
-                                            width= 10),
-#                'spc83': self.create_space(2, row= 8, column= 6, sticky= (EW)),
-                'lon': self.create_entry(self.src.get_attrb('lon'),
-                                           row= 8, column= 7, sticky=(EW), 
-                                           justify= CENTER, width=10,
-                                           validate= 'focusout',
-                                           validatecommand= self.src.validate_lat_lon_setting),               
-                 'lbl_elev': self.create_label(self.src.get_attrb('elev'),
-                                            row= 8, column= 11, justify= RIGHT),
-                 'elev': self.create_entry(self.src.get_attrb('elev'),
-                                           row= 8, column= 12, sticky=(EW), 
-                                           justify= CENTER, width=10),               
-                'lbl_tz': self.create_label(self.src.get_attrb('tz'),
-                                            row= 9, column= 0, justify= RIGHT,
-                                            sticky= (EW)),
-                'spc91': self.create_space(2, row= 9, column= 2, sticky= (EW)),
-                'tz': self.create_entry(self.src.get_attrb('tz'),
-                                           row= 9, column= 3, sticky=(EW), 
-                                           justify= CENTER, width=5,
-                                           On_change= self.src.on_form_change),
-                'spc92': self.create_space(2, row= 9, column= 5, sticky= (EW)),
-                'lbl_gv': self.create_label(self.src.get_attrb('gv'),
-                                            row= 9, column= 5, justify= RIGHT),
-#                'spc93': self.create_space(2, row= 9, column= 6, sticky= (EW)),
-                'gv': self.create_entry(self.src.get_attrb('gv'),
-                                           row= 9, column= 7, sticky=(EW), 
-                                           justify= CENTER, width=5),               
-                 'lbl_gf': self.create_label(self.src.get_attrb('gf'),
-                                            row= 9, column= 11, justify= RIGHT),
-                 'gf': self.create_entry(self.src.get_attrb('gf'),
-                                           row= 9, column= 12, sticky=(EW), 
-                                           justify= CENTER, width=5),               
-                  'blank4': self.create_space(40, row= 10, column= 0, sticky=(EW),
-                                           columnspan= 10)               
-                }
-
 def main():
     print ('PVSite Definition Check')
     
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 13:40:51 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        PVTrace.py
+  Purpose:     Stream the hour by hour results of a simulation run to disk
+               for performance review & debugging
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import json
+import numpy as np
+import pandas as pd
+
+# Columns available for tracing, in report order
+trace_columns = ['Indx', 'ArP', 'ArV', 'ArI', 'dcLd', 'acLd', 'ttLd',
+                 'PO', 'PS', 'DE', 'SL', 'BP', 'BD', 'BS', 'EM']
+
+# File suffix for each of the supported trace formats
+trace_formats = {'text': '.txt', 'csv': '.csv', 'binary': '.trc'}
+
+_magic = b'SPVTRACE1\n'
+
+
+class TraceWriter:
+    """ Writes blocks of per-hour trace records to a file using a buffered
+        'text' (tab separated report), 'csv' or 'binary' format.  Only every
+        sample'th record and the requested columns are written.  The binary
+        format holds the numeric columns as float64 rows and can be read back
+        with read_trace """
+    def __init__(self, filename, fmt= 'text', columns= None, sample= 1,
+                 bufsize= 1 << 16):
+        if fmt not in trace_formats:
+            raise ValueError('Unknown trace format: {0}'.format(fmt))
+        if columns is None:
+            columns = trace_columns
+        bad = [c for c in columns if c not in trace_columns]
+        if bad:
+            raise ValueError('Unknown trace columns: {0}'.format(bad))
+        self.fmt = fmt
+        self.sample = max(int(sample), 1)
+        self.columns = [c for c in trace_columns if c in columns]
+        if fmt == 'binary':
+            # Error messages can't be held in a float record
+            self.columns = [c for c in self.columns if c != 'EM']
+        self.filename = filename
+        self.rows = 0
+        self.fo = open(filename, 'wb', buffering= bufsize)
+        self._write_header()
+
+    def _write_header(self):
+        if self.fmt == 'binary':
+            self.fo.write(_magic)
+            self.fo.write(json.dumps(self.columns).encode('ascii') + b'\n')
+        elif self.fmt == 'csv':
+            self.fo.write((','.join(self.columns) + '\n').encode('utf-8'))
+        else:
+            hdr = ['{0:^6}'.format(c) for c in self.columns]
+            self.fo.write(('\t'.join(hdr) + '\n').encode('utf-8'))
+
+    def write_block(self, start, block):
+        """ Write a block of records, block is a dict of equal length arrays
+            keyed by column name (Indx & ttLd are derived if absent) and
+            start is the index of the first record in the block """
+        n = len(next(iter(block.values())))
+        indx = np.arange(start, start + n)
+        keep = indx % self.sample == 0
+        if not keep.any():
+            return
+        cols = dict()
+        for c in self.columns:
+            if c == 'Indx':
+                cols[c] = indx[keep]
+            elif c == 'ttLd' and c not in block:
+                cols[c] = (np.asarray(block['dcLd']) +
+                           np.asarray(block['acLd']))[keep]
+            else:
+                cols[c] = np.asarray(block[c])[keep]
+        self.rows += int(keep.sum())
+        if self.fmt == 'binary':
+            rec = np.column_stack([cols[c].astype('<f8') for c in self.columns])
+            self.fo.write(rec.tobytes())
+            return
+        if self.fmt == 'csv':
+            specs = {c: '' if c in ('Indx', 'EM') else ':.6g'
+                     for c in self.columns}
+            sep = ','
+            if 'EM' in cols:
+                cols['EM'] = np.array(['"' + str(m).replace('"', '""') + '"'
+                                       for m in cols['EM']], dtype=object)
+        else:
+            specs = {c: ':06' if c == 'Indx' else
+                     ('' if c == 'EM' else ':6.2f') for c in self.columns}
+            sep = '\t'
+        fmt = sep.join('{' + str(k) + specs[c] + '}'
+                       for k, c in enumerate(self.columns)) + '\n'
+        lines = [fmt.format(*r) for r in zip(*[cols[c].tolist()
+                                               for c in self.columns])]
+        self.fo.write(''.join(lines).encode('utf-8'))
+
+    def close(self):
+        """ Flush & close the trace file """
+        if self.fo is not None:
+            self.fo.close()
+            self.fo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_trace(filename):
+    """ Return the contents of a trace file as a DataFrame """
+    with open(filename, 'rb') as fi:
+        if fi.read(len(_magic)) == _magic:
+            cols = json.loads(fi.readline().decode('ascii'))
+            data = np.frombuffer(fi.read(), dtype='<f8')
+            return pd.DataFrame(data.reshape(-1, len(cols)), columns= cols)
+    sep = ',' if filename.endswith(trace_formats['csv']) else '\t'
+    df = pd.read_csv(filename, sep= sep, keep_default_na= False)
+    df.columns = [c.strip() for c in df.columns]
+    return df
+
+
+def main():
+    print('PVTrace Load Check')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,9 @@ Modified on 11/27/2018 to clean up comments
 Modified   Wed Dec  5 2018 (Fix Issue 2, Handle DC Loads)
 Modified on 02/25/2019 for version 0.1.0
 Modified on Wed 01/20/2021 to add computeOutputResults
+Modified on 10/17/2026 to vectorize & cache the calendar indices and loads
+Modified on 10/17/2026 to build monthly summaries from a single daily pass
+Modified on 10/17/2026 to scale the output of one module to an array
 
 @author: Bob Hentz
 -------------------------------------------------------------------------------
@@ -62,75 +65,114 @@ def convert_to_dec_hrs(time):
     h += time.second/3600.0
     return h
 
+def convert_times_to_dec_hrs(ts):
+    """ Returns a Numpy Array of the decimal Hour for each time in
+        a Panda DateTimeIndex or Series of Timestamps """
+    ts = pd.DatetimeIndex(ts)
+    h = np.asarray(ts.hour, dtype= float)*1.0
+    h += np.asarray(ts.minute, dtype= float)/60.0
+    h += np.asarray(ts.second, dtype= float)/3600.0
+    return h
+
 def month_timestamp(ts):
     """ Produces an Numpy Array of the Integer Month
         from a Panda DateTimeIndex Series """
-    k = list()
-    for t in ts:
-        k.append(t.month)
-    return np.array(k)
+    return np.asarray(pd.DatetimeIndex(ts).month)
 
 def doy_timestamp(ts):
     """ Produces an Numpy Array of the Integer Day Of Year
         from a Panda DateTimeIndex Series """
-    k = list()
-    for t in ts:
-        k.append(t.dayofyear)
-    return np.array(k)
+    return np.asarray(pd.DatetimeIndex(ts).dayofyear)
 
 def dom_timestamp(ts):
     """ Produces an Numpy Array of the Integer Day Of Month
         from a Panda DateTimeIndex Series """
-    k = list()
-    mon = -1
-    doy = -1
-    dom = 0
-    for t in ts:
-        m = t.month
-        if mon != m:
-            dom = 1
-            doy = t.dayofyear
-            mon = m
-        elif t.dayofyear != doy:
-            dom += 1
-            doy = t.dayofyear
-        k.append(dom)
-    return np.array(k)
-
-def create_time_indices(tm_z):
-    """ Create Base Dataframe indicies for use in running simulations """
-    now = date.today()
-    baseyear = now.year-2
-    if baseyear%4 == 0:
-        # Don't use leap year
-        baseyear -= 1
-    st = '{0}0101T0000{1:+}'.format(baseyear, tm_z)
-    nt = '{0}1231T2300{1:+}'.format(baseyear, tm_z)
-    times = pd.date_range(start= st,
-                             end= nt,
-                             freq='H')
-
-    months = month_timestamp(times).astype(int)
-    days_of_year = doy_timestamp(times).astype(int)
-    days_of_month = dom_timestamp(times).astype(int)
-    timedf = pd.DataFrame({'Month':months,
-                             'DayofYear': days_of_year,
-                             'DayofMonth': days_of_month},
-                        index = times)
-
-    return timedf
+    return np.asarray(pd.DatetimeIndex(ts).day)
+
+# Calendar DataFrames built by create_time_indices keyed on (year, tz, freq)
+_calendar_cache = dict()
+
+def create_time_indices(tm_z, year= None, freq= 'h'):
+    """ Create Base Dataframe indicies for use in running simulations.
+        Covers a full non leap year (by default 2 years prior to the
+        current one) at the specified frequency """
+    if year is None:
+        now = date.today()
+        year = now.year-2
+        if year%4 == 0:
+            # Don't use leap year
+            year -= 1
+    ky = (year, tm_z, freq)
+    if ky not in _calendar_cache:
+        st = '{0}0101T0000{1:+}'.format(year, tm_z)
+        nt = '{0}1231T2359{1:+}'.format(year, tm_z)
+        times = pd.date_range(start= st, end= nt, freq= freq)
+        _calendar_cache[ky] = pd.DataFrame({
+                                'Month': month_timestamp(times).astype(int),
+                                'DayofYear': doy_timestamp(times).astype(int),
+                                'DayofMonth': dom_timestamp(times).astype(int)},
+                                index = times)
+    return _calendar_cache[ky].copy()
+
+# Expanded loads built by hourly_load keyed on the load values & time index
+_load_cache = dict()
 
 def hourly_load(times, load):
-    """ Create a Data Frame of Hourly Load in Watts"""
+    """ Create a Data Frame of Hourly Load in Watts by repeating the
+        load profile (24 hourly rows, or any longer multi-day profile)
+        over times """
+    vals = np.column_stack([np.asarray(load['AC'], dtype= float),
+                            np.asarray(load['DC'], dtype= float),
+                            np.asarray(load['Total'], dtype= float)])
     lngth = len(times)
-    hlc = np.zeros((lngth, 3))
-    for i in range(lngth):
-        hlc[i, 0] = load['AC'].iloc[i%24]
-        hlc[i, 1] = load['DC'].iloc[i%24]
-        hlc[i, 2] = load['Total'].iloc[i%24]
-    return pd.DataFrame(data=hlc, index=times, 
+    ky = (vals.tobytes(), lngth, times[0], times[-1]) if lngth > 0 else None
+    if ky not in _load_cache:
+        if len(_load_cache) >= 8:
+            _load_cache.clear()
+        _load_cache[ky] = vals.take(np.arange(lngth) % len(vals), axis= 0)
+    return pd.DataFrame(data=_load_cache[ky].copy(), index=times,
                         columns=['AC_Load', 'DC_Load', 'Total_Load'])
-                
+
+def scale_module_output(module_out, uis, sip):
+    """ Return the output of an array of uis modules in series by sip
+        strings in parallel given the output of a single module, scaled
+        as pvlib's scale_voltage_current_power does """
+    rslt = module_out.copy()
+    vcols = [c for c in ['v_mp', 'v_oc'] if c in rslt.columns]
+    icols = [c for c in ['i_mp', 'i_x', 'i_xx', 'i_sc'] if c in rslt.columns]
+    rslt[vcols] *= uis
+    rslt[icols] *= sip
+    rslt['p_mp'] *= uis * sip
+    return rslt
+
+def combine_array_outputs(array_outs):
+    """ Combine a list of array performance results (each providing 'v_mp',
+        'i_mp' & 'p_mp' over the same time index) into a unified output.
+        Arrays are merged in list order, wherever the accumulated output
+        and the next array both produce power:
+            Array Voltage (AV) = min of the two voltages
+            Array Current (AI) = sum (ac(i)*AV/av(i))
+            Array Power (AP) = AV * AI
+        otherwise the output of whichever array produces power is used.
+        Returns a tuple of numpy arrays (AV, AI, AP) """
+    av = np.array(array_outs[0]['v_mp'], dtype= float)
+    ai = np.array(array_outs[0]['i_mp'], dtype= float)
+    ap = np.array(array_outs[0]['p_mp'], dtype= float)
+    for sec_array in array_outs[1:]:
+        sv = np.asarray(sec_array['v_mp'], dtype= float)
+        si = np.asarray(sec_array['i_mp'], dtype= float)
+        sp = np.asarray(sec_array['p_mp'], dtype= float)
+        both = (ap > 0) & (sp > 0)
+        scnd = ~both & (sp > 0)
+        with np.errstate(divide= 'ignore', invalid= 'ignore'):
+            v_out = np.minimum(av, sv)
+            i_out = ai*(v_out/av) + si*(v_out/sv)
+            p_out = v_out*i_out
+        av = np.where(both, v_out, np.where(scnd, sv, av))
+        ai = np.where(both, i_out, np.where(scnd, si, ai))
+        ap = np.where(both, p_out, np.where(scnd, sp, ap))
+    return av, ai, ap
+
 def hourly_temp(avT, maxT, minT, cur_t, rise_t, set_t, trans_t, offset= 2):
     """ Estimate hourly temperature for cur_t of day
         assumes, temp follows sine curve, with max temp at
@@ -156,6 +198,18 @@ def hourly_speed(avS, maxS, minS, cur_t, rise_t, set_t, trans_t, offset= 2):
     d_spd = (maxS - minS) 
     return abs(avS - d_spd*math.sin(2*np.pi*(ct-pkhr)/24))
        
+def diurnal_temp(avT, maxT, minT, cur_h, rise_h, set_h, offset= 2):
+    """ Array form of hourly_temp, all arguments may be Numpy Arrays
+        with the times given in decimal hours """
+    pkhr = rise_h + 0.5*set_h + offset
+    return avT + (maxT - minT)*np.sin(2*np.pi*((cur_h-pkhr)/24))
+
+def diurnal_speed(avS, maxS, minS, cur_h, rise_h, set_h, offset= 2):
+    """ Array form of hourly_speed, all arguments may be Numpy Arrays
+        with the times given in decimal hours """
+    pkhr = rise_h + 0.5*set_h + offset
+    return np.abs(avS - (maxS - minS)*np.sin(2*np.pi*(cur_h-pkhr)/24))
+
 def read_resource(filename, dirptr):
     """ Method to retrieve data from the resources csv file and generate a 
         Panadas Dataframe of the contents """
@@ -174,62 +228,83 @@ def read_web_resource(url, dirptr, filename):
     except requests.exceptions.ConnectionError:
         return False
 
-def build_monthly_summary(df, select_value):
-    """ Summarizes df contents for select_value parameter
-        over an entire year """    
+def build_daily_summary(df, columns):
+    """ Returns a Dataframe indexed by DayofYear containing the daily totals
+        of the listed df columns together with the Month & number of Hours
+        contained in each day """
+    grp = df.groupby('DayofYear')
+    rslt = grp[columns].sum()
+    rslt['Month'] = grp['Month'].first()
+    rslt['Hours'] = grp.size()
+    return rslt
+
+def summarize_monthly(daily, select_value):
+    """ Summarizes the daily totals of select_value contained in daily
+        (see build_daily_summary) by month """
     month_list = np.array(['Jan', 'Feb', 'Mar', 'Apr',
                            'May', 'Jun', 'Jul', 'Aug',
                            'Sep', 'Oct', 'Nov', 'Dec'])
     dat_list = np.zeros([12,5])
+    vals = daily[select_value].values
+    mnths = daily['Month'].values
+    hrs = daily['Hours'].values
     for indx in range(12):
-        smpl_df = df.loc[df['Month'] == indx+1]
-        vals = smpl_df[select_value].groupby(smpl_df['DayofMonth']).sum()
-        dat_list[indx][0] = vals.sum()
-        dat_list[indx][1] = vals.mean()
-        dat_list[indx][2] = vals.max()
-        dat_list[indx][3] = vals.min()
-        dat_list[indx][4] = len(smpl_df)/24
-    rslt = pd.DataFrame(dat_list, month_list, 
-                        columns=['Total {0}'.format(select_value), 
-                                 'Avg {0}'.format(select_value), 
-                                 'Best {0}'.format(select_value), 
+        mask = mnths == indx+1
+        mvals = vals[mask]
+        if len(mvals) == 0:
+            dat_list[indx][1:4] = np.nan
+        else:
+            dat_list[indx][0] = mvals.sum()
+            dat_list[indx][1] = dat_list[indx][0]/len(mvals)
+            dat_list[indx][2] = mvals.max()
+            dat_list[indx][3] = mvals.min()
+        dat_list[indx][4] = hrs[mask].sum()/24
+    rslt = pd.DataFrame(dat_list, month_list,
+                        columns=['Total {0}'.format(select_value),
+                                 'Avg {0}'.format(select_value),
+                                 'Best {0}'.format(select_value),
                                  'Worst {0}'.format(select_value),
                                  'Days' ])
     rslt.index.name= 'Months'
     return rslt
 
+def build_monthly_summary(df, select_value):
+    """ Summarizes df contents for select_value parameter
+        over an entire year """
+    return summarize_monthly(build_daily_summary(df, [select_value]),
+                             select_value)
+
 
-def build_monthly_performance(df, param):
+def build_monthly_performance(df, param, daily= None):
     """ Using the dataframe df create Monthly Synopsis of
         system performance  for selected param 
         return 3 part tuple containing:
             resulting array, 
             best day designator,
             worst day designator
+        daily may provide the result of build_daily_summary for df
     """
-    rslt = []    
-    rslt.append( build_monthly_summary(df, param))
-    rslt.append( find_best_doy(df, param))
-    rslt.append( find_worst_doy(df, param))
+    if daily is None:
+        daily = build_daily_summary(df, [param])
+    rslt = []
+    rslt.append( summarize_monthly(daily, param))
+    rslt.append( int(daily[param].idxmax()))
+    rslt.append( int(daily[param].idxmin()))
     return rslt
 
 def find_worst_doy(df, select_value):
     """ returns a day_of_year where select_value is a minimum """
     rslt_df = df[select_value].groupby(df['DayofYear']).sum()
-    mn = rslt_df.min()
-    for indx in range(len(rslt_df)):
-        if rslt_df.iloc[indx] == mn:
-            return indx + 1
-    raise IndexError('No worst day value found')
+    if rslt_df.count() == 0:
+        raise IndexError('No worst day value found')
+    return int(rslt_df.idxmin())
     
 def find_best_doy(df, select_value):
     """ returns a day_of_year where select_value is a maximum """
     rslt_df = df[select_value].groupby(df['DayofYear']).sum()
-    mx = rslt_df.max()
-    for indx in range(len(rslt_df)):
-        if rslt_df.iloc[indx] == mx:
-            return indx + 1
-    raise IndexError('No best day value found')
+    if rslt_df.count() == 0:
+        raise IndexError('No best day value found')
+    return int(rslt_df.idxmax())
    
 def computOutputResults(attrb_dict,  ArP, ArV, ArI, acLd, dcLd, wkDict):
     """Computes the controlled Voltage & current output used to either power
@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 09:12:44 2026
+Modified on 10/17/2026 to recompute only the stages affected by a change
+Modified on 10/17/2026 to size the battery bank for a service target
+Modified on 10/17/2026 to size the array for a service target
+Modified on 10/17/2026 to detect attribute changes made by the entry forms
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        SPVEngine.py
+  Purpose:     Implement the simulation logic of the SPVSim Application
+               independent of the GUI, so that a project can be analyzed
+               on systems without a display
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+              This program is distributed WITHOUT ANY WARRANTY;
+              without even the implied warranty of MERCHANTABILITY
+              or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+
+from datetime import datetime
+import os.path
+import pickle
+import sys
+import numpy as np
+import pandas as pd
+
+from PVSite import PVSite
+from PVBattery import PVBattery
+from PVBatBank import PVBatBank
+from PVPanel import PVPanel
+from PVArray import PVArray
+from PVInverter import PVInverter
+from PVChgControl import PVChgControl
+from SiteLoad import SiteLoad
+from PVUtilities import (read_resource, hourly_load, create_time_indices,
+                         build_monthly_performance, build_daily_summary,
+                         combine_array_outputs, scale_module_output)
+from PVDispatch import (resolve_dispatch_parameters, dispatch_power_flows,
+                        size_bank_energy)
+from PVTrace import TraceWriter, trace_formats
+from Component import same_value
+
+""" Simulation stages in execution order, each with the stages it depends
+    upon.  A stage is recomputed when it, or any stage upstream of it, has
+    been marked dirty since it last ran """
+stage_dependencies = {'site': [],
+                      'weather': ['site'],
+                      'geometry': ['site'],
+                      'array': ['weather', 'geometry'],
+                      'combine': ['array'],
+                      'load': ['site'],
+                      'dispatch': ['combine', 'load'],
+                      'summaries': ['dispatch']}
+stage_order = list(stage_dependencies.keys())
+
+# Site attributes defining the location & time zone
+site_location_attrbs = ['lat', 'lon', 'elev', 'tz']
+
+class SimulationEngine:
+    """ Builds the components of a Solar PV System and performs the
+        system analysis without requiring a display """
+    def __init__(self, filename= None, wdir= None):
+        self.dirty_stages = set(stage_order)
+        self.load_version = None     # load frame version used by 'load' stage
+        self.attrb_values = dict()   # component attributes used by the stages
+        self.debug = False
+        self.perf_rept = False       # Stream hourly results to a trace file
+        self.trace_format = 'text'   # 'text', 'csv' or 'binary'
+        self.trace_columns = None    # list of PVTrace.trace_columns or None for all
+        self.trace_sample = 1        # write every trace_sample'th hour
+        self.cache_arrays = True     # reuse array performance for same inputs
+        self.errflg = False
+        self.wdir = os.getcwd() if wdir is None else wdir
+        self.mdldir = os.path.join(self.wdir, 'Models')
+        self.rscdir = os.path.join(self.wdir, 'Resources')
+        self.rptdir = os.path.join(self.wdir, 'Reports')
+        self.countries = read_resource('Countries.csv', self.rscdir)
+        self.modules = read_resource('CEC Modules.csv', self.rscdir)
+        self.inverters = read_resource('CEC Inverters.csv', self.rscdir)
+        self.sdw = None      # System Description Window
+        self.rdw = None      # Results Display Window
+        self.stw = None      # Status Reporting Window
+
+        self.array_list = list()
+        self.filename = None         # Complete path to Current File
+        self.site = PVSite(self)
+        self.bat = PVBattery(self)
+        self.pnl = PVPanel(self)
+        self.ary = self.create_solar_array(self)
+        self.array_list.append(self.ary)
+        self.sec_ary = self.create_solar_array(self)
+        self.array_list.append(self.sec_ary)
+        self.bnk = PVBatBank(self)
+        self.bnk.uses(self.bat)
+        self.inv = PVInverter(self)
+        self.load = SiteLoad(self)
+        self.chgc = PVChgControl(self)
+        self.loc = None
+        self.times = None
+        self.array_outs = None  # Output of each defined array by hour
+        self.array_comb = None  # The combined Array Output by hour
+        self.site_load = None   # The Site Load by hour
+        self.array_out = None   # The Solar Array Output & Load by hour
+        self.power_flow = None
+        self.mnthly_array_perfm = None
+        self.mnthly_pwr_perfm = None
+        self.daily_array_perfm = None   # Daily totals of array_out
+        self.daily_pwr_perfm = None     # Daily totals of power_flow
+        self.outfile = None
+        if filename is not None:
+            self.filename = filename
+            self.read_file(filename)
+
+    def show_status(self, msg, style= None):
+        """ Report msg in the Status Window if one exists """
+        if self.stw is not None:
+            self.stw.show_message(msg, style)
+
+    def write_file(self, fn):
+        """ Write DataDict to specified file  """
+        dd = {'fn': self.filename,
+              'atoms': self.site.atmospherics,
+              'site': self.site.args,
+              'bat': self.bat.args,
+              'pnl': self.pnl.args,
+              'ary': self.ary.args,
+              'ary_2':self.sec_ary.args,
+              'bnk': self.bnk.args,
+              'inv': self.inv.args,
+              'load': self.load.export_frame(),
+              'chgr': self.chgc.args
+              }
+
+        fo = open(fn, 'wb')
+        pickle.dump(dd, fo)
+        fo.close()
+
+    def read_file(self, fn):
+        """ Read specified file into DataDict """
+        fo = open(fn, 'rb')
+        dd = pickle.load(fo)
+        fo.close()
+        self.filename = dd.pop('fn', None)
+        self.site.atmospherics = dd.pop('atoms', None)
+        load_in = dd.pop('load', None)
+        if load_in is not None:
+            self.load.purge_frame()
+            if type(load_in) is dict:
+                self.load.import_frame(load_in)
+            # This test is for backwards compatability
+            else:
+                ldi = load_in.df.to_dict('Index')
+                self.load.import_frame(ldi)
+        if self.load.master is None:
+            self.load.master = self
+        self.site.write_parameters(dd.pop('site', None))
+        self.bat.write_parameters(dd.pop('bat', None))
+        self.pnl.write_parameters(dd.pop('pnl', None))
+        self.ary.write_parameters(dd.pop('ary', None))
+        self.sec_ary.write_parameters(dd.pop('ary_2', None))
+        self.bnk.write_parameters(dd.pop('bnk', None))
+        self.inv.write_parameters(dd.pop('inv', None))
+        self.chgc.write_parameters(dd.pop('chgr', None))
+        self.site.atmo_key = None
+        # Saved elevation & time zone are kept until the site is moved
+        self.site.elev_key = (self.site.read_attrb('lat'),
+                              self.site.read_attrb('lon'))
+        self.invalidate_stages()
+
+    def create_solar_array(self, src):
+        sa = PVArray(src)
+        sa.uses(self.pnl)
+        return sa
+
+    def component_changed(self, cmp, attr):
+        """ Mark the stages affected by a change to attr of cmp dirty """
+        if cmp is self.site:
+            if attr in site_location_attrbs:
+                self.invalidate_stages('site')
+        elif cmp is self.ary and attr == 'mtg_hgt':
+            # Mounting height sets the altitude of the location
+            self.invalidate_stages('geometry')
+        elif cmp in self.array_list or cmp is self.pnl:
+            self.invalidate_stages('array')
+        elif cmp is self.inv:
+            self.invalidate_stages('array', 'dispatch')
+        elif cmp in (self.bnk, self.bat, self.chgc):
+            self.invalidate_stages('dispatch')
+        else:
+            self.invalidate_stages()
+
+    def invalidate_stages(self, *stages):
+        """ Mark stages (all if none given) and every stage downstream of
+            them dirty """
+        pending = list(stages) if len(stages) > 0 else list(stage_order)
+        while len(pending) > 0:
+            stg = pending.pop()
+            if stg not in self.dirty_stages:
+                self.dirty_stages.add(stg)
+                pending.extend(s for s in stage_order
+                               if stg in stage_dependencies[s])
+
+    def tracked_components(self):
+        """ Return the list of components whose attributes feed the stages """
+        return ([self.site, self.bat, self.pnl] + self.array_list +
+                [self.bnk, self.inv, self.chgc])
+
+    def detect_changes(self):
+        """ Mark the stages affected by attributes which changed without
+            passing through set_attribute (such as by the entry forms)
+            dirty, comparing with the values used by the last update """
+        for indx, cmp in enumerate(self.tracked_components()):
+            cur = cmp.get_parameters()
+            prev = self.attrb_values.get(indx)
+            if prev is not None:
+                for ky, val in cur.items():
+                    if ky not in prev or not same_value(prev[ky], val):
+                        self.component_changed(cmp, ky)
+            self.attrb_values[indx] = cur
+
+    def update_stages(self):
+        """ Recompute the dirty stages in order """
+        self.detect_changes()
+        if self.load_version != self.load.get_version():
+            self.invalidate_stages('load')
+        if self.perf_rept:
+            # The trace is written as the power flows are computed
+            self.invalidate_stages('dispatch')
+        for stg in stage_order:
+            if stg in self.dirty_stages:
+                getattr(self, 'update_' + stg)()
+                self.dirty_stages.discard(stg)
+
+    def update_site(self):
+        """ Locate the site & build the time index """
+        self.loc = self.site.get_location()
+        self.times = create_time_indices(self.site.read_attrb('tz'))
+
+    def update_weather(self):
+        """ Build the hourly air temperature & wind speed """
+        self.site.get_atmospherics(self.times.index, self.stw)
+
+    def update_geometry(self):
+        """ Compute the solar geometry shared by the arrays """
+        geom = self.site.get_geometry(self.times.index)
+        geom.get_clearsky()
+        geom.get_dni_extra()
+
+    def update_array(self):
+        """ Compute the performance of each array """
+        self.array_outs = self.define_arrays()
+
+    def update_combine(self):
+        """ Combine the array outputs """
+        self.array_comb = self.combine_arrays(self.array_outs)
+        self.show_status('Panel Analysis Completed')
+
+    def update_load(self):
+        """ Expand the load profile over the time index """
+        self.load_version = self.load.get_version()
+        self.site_load = hourly_load(self.times.index,
+                                     self.load.get_load_profile())
+
+    def update_dispatch(self):
+        """ Distribute the array power to the load & bank """
+        self.errflg = False
+        self.show_status('Starting Power Analysis')
+        self.array_out = self.array_comb.join(self.site_load)
+        if self.bnk.is_defined():
+            self.bnk.initialize_bank()
+        self.power_flow = self.compute_powerFlows()
+
+    def update_summaries(self):
+        """ Build the daily & monthly performance summaries """
+        self.daily_array_perfm = build_daily_summary(self.array_out,
+                                                     ['ArrayPower'])
+        self.mnthly_array_perfm = build_monthly_performance(self.array_out,
+                                        'ArrayPower', self.daily_array_perfm)
+        dl = np.array([self.load.get_daily_load()]*12)
+        dlf = pd.DataFrame({'Daily Load':dl},
+                           index=self.mnthly_array_perfm[0].index.values)
+        self.mnthly_array_perfm[0] = self.mnthly_array_perfm[0].join(dlf)
+        self.daily_pwr_perfm = build_daily_summary(self.power_flow,
+                                ['PowerOut', 'ArrayPower', 'Service',
+                                 'BatDrain', 'Total_Load'])
+        self.mnthly_pwr_perfm = build_monthly_performance(self.power_flow,
+                                        'PowerOut', self.daily_pwr_perfm)
+        self.mnthly_pwr_perfm[0] = self.mnthly_pwr_perfm[0].join(dlf)
+
+    def define_arrays(self):
+        """ Return a list of the performance of the primary array and each
+            other defined array """
+        outs = [self.array_list[0].define_array_performance(self.times.index,
+                                        self.site, self.inv, self.stw,
+                                        self.cache_arrays)]
+        for ar in range(1, len(self.array_list)):
+            if self.array_list[ar].is_defined():
+                outs.append(self.array_list[ar].define_array_performance(
+                                self.times.index, self.site, self.inv,
+                                self.stw, self.cache_arrays))
+        return outs
+
+    def combine_arrays(self, outs):
+        """ Combine primary & secondary array outputs to from a unified output
+            using individual array outputs to include the following:
+                Array Voltage (AV) = mim voltage for all arrays
+                Array Current (AI) = sum (ac(i)*AV/av(i))
+                Array Power (AP) = AV * AC
+        """
+        volts, amps, pwr = combine_array_outputs(outs)
+        rslt = pd.DataFrame({'ArrayVolts':volts,
+                             'ArrayCurrent':amps,
+                             'ArrayPower':pwr},
+                              index = self.times.index)
+        return rslt.assign(Month= self.times['Month'],
+                           DayofMonth= self.times['DayofMonth'],
+                           DayofYear= self.times['DayofYear'])
+
+    def compute_powerFlows(self):
+        """ Computes the distribution of Array power to loads and
+            a battery bank if it exists.  Returns a DataFrame containing
+            performance data
+            """
+        sysParms = resolve_dispatch_parameters(self.inv, self.chgc, self.bnk)
+        bflg = sysParms['bnkFlg']
+        ArP = self.array_out['ArrayPower'].values
+        ArV = self.array_out['ArrayVolts'].values
+        ArI = self.array_out['ArrayCurrent'].values
+        dcLd = self.array_out['DC_Load'].values
+        acLd = self.array_out['AC_Load'].values
+        flows = dispatch_power_flows(sysParms, ArP, ArV, ArI, acLd, dcLd,
+                                    self.bnk.get_dispatch_state())
+        if bflg:
+            self.bnk.set_dispatch_state(flows['state'])
+        PO = flows['PO']  # amount of total load satisfied
+        PS = flows['PS']  # fraction of load satisfied Power_out/TotLoad
+        DE = flows['DE']  # amount of Array Power used to provide load
+        BS = flows['BS']  # battery soc
+        BD = flows['BD']  # power drawn from battery
+        BP = flows['BP']  # remaining amount of usable Battery Power
+        SL = flows['SL']  # load imposed by system chgCntlr * inverter
+        EM = flows['EM']  # recorded error messages
+        if self.debug and flows['first_error'] is not None:
+            tindx, errfrm = flows['first_error']
+            self.errflg = True
+            self.show_status('After {0} days '.format(1 + tindx//24) +
+                             errfrm[0], errfrm[1])
+        if self.perf_rept:
+            self.write_trace({'ArP': ArP, 'ArV': ArV, 'ArI': ArI,
+                              'dcLd': dcLd, 'acLd': acLd, 'PO': PO,
+                              'PS': PS, 'DE': DE, 'SL': SL, 'BP': BP,
+                              'BD': BD, 'BS': BS, 'EM': EM})
+
+        # Create the DataFrame
+        rslt = pd.DataFrame({'PowerOut': PO,
+                             'ArrayPower': self.array_out['ArrayPower'],
+                           'Service': PS,
+                           'DelvrEff': DE,
+                           'BatSoc': BS,
+                           'BatDrain': BD,
+                           'BatPwr': BP
+                           }, index = self.times.index)
+
+        rslt = rslt.assign(Month= self.times['Month'],
+                                     DayofMonth= self.times['DayofMonth'],
+                                 DayofYear= self.times['DayofYear'])
+        rslt = rslt.join(self.site_load)
+        return rslt
+
+    def run_simulation(self):
+        """ Perform System Analysis and return a dict containing the
+            'array_out' & 'power_flow' frames together with the
+            'array_perfm' & 'pwr_perfm' monthly summaries and the
+            'array_daily' & 'pwr_daily' daily totals,
+            returns None if the base error check fails """
+        if not self.perform_base_error_check():
+            return None
+        rt = datetime.now()
+        ft = 'run_{0}_{1:02}_{2}_{3:02}{4:02}{5:02}{6}'
+        self.outfile = ft.format(rt.year, rt.month, rt.day,
+                                 rt.hour, rt.minute, rt.second,
+                                 trace_formats[self.trace_format])
+        self.show_status('Starting System Analysis')
+        self.update_stages()
+        if self.errflg == False:
+            self.show_status('Power Analysis Completed')
+        return {'array_out': self.array_out,
+                'power_flow': self.power_flow,
+                'array_perfm': self.mnthly_array_perfm,
+                'pwr_perfm': self.mnthly_pwr_perfm,
+                'array_daily': self.daily_array_perfm,
+                'pwr_daily': self.daily_pwr_perfm}
+
+    def get_service_summary(self):
+        """ Return a dict summarizing how well the design serves the load:
+              'service_hrs' - hours per year the load is satisfied
+              'demand_hrs'  - hours per year the load demands power
+              'service'     - fraction of demand hours satisfied
+              'cycles'      - annual battery charging cycles (None if no bank)
+              'max_cycles'  - specified battery lifetime cycles """
+        if self.power_flow is None:
+            return None
+        srvchrs = self.power_flow['Service'].sum()
+        dmndhrs = self.load.get_demand_hours()*365
+        smry = {'service_hrs': srvchrs, 'demand_hrs': dmndhrs,
+                'service': srvchrs/dmndhrs if dmndhrs > 0 else None,
+                'cycles': None, 'max_cycles': None}
+        if self.bnk.is_defined():
+            smry['cycles'] = self.bnk.tot_cycles
+            smry['max_cycles'] = self.bnk.max_dischg_cycles
+        return smry
+
+    def size_battery_bank(self, target= 1.0, confirm= True, max_steps= 20):
+        """ Return a dict giving the usable bank energy 'usable_wh' and the
+            strings in parallel 'bnk_sip' needed to serve target of the
+            demand hours, estimated from the energy balance of the current
+            design in one pass.  If confirm, 'bnk_sip' is then adjusted (by
+            at most max_steps) to the smallest number of strings meeting
+            target with the dispatch kernel, or beyond which more strings
+            don't improve the service.  The kernel's 'service' (None if there
+            is no demand) is included together with whether the target was
+            'met'.
+            Returns None if the design can't be analyzed or has no bank """
+        if not self.bnk.is_defined():
+            return None
+        if self.array_out is None or len(self.dirty_stages) > 0:
+            if self.run_simulation() is None:
+                return None
+        parms = resolve_dispatch_parameters(self.inv, self.chgc, self.bnk)
+        ArP = self.array_out['ArrayPower'].values
+        acLd = self.array_out['AC_Load'].values
+        dcLd = self.array_out['DC_Load'].values
+        uwh = size_bank_energy(parms, ArP, acLd, dcLd, target)
+        rslt = {'usable_wh': uwh, 'bnk_sip': self.bnk.strings_for_energy(uwh)}
+        if not confirm:
+            return rslt
+        dmndhrs = self.load.get_demand_hours()*365
+        if dmndhrs == 0:
+            # Without demand any bank serves the load
+            rslt.update(service= None, met= True)
+            return rslt
+        rcap = self.bnk.parts[0].read_attrb('b_rcap')
+        ArV = self.array_out['ArrayVolts'].values
+        ArI = self.array_out['ArrayCurrent'].values
+
+        def service(sip):
+            parms['bnk_cap'] = sip*rcap
+            flows = dispatch_power_flows(parms, ArP, ArV, ArI, acLd, dcLd,
+                            self.bnk.initial_dispatch_state(parms['bnk_cap']))
+            return flows['PS'].sum()/dmndhrs
+
+        sip = rslt['bnk_sip']
+        srvc = service(sip)
+        for stp in range(max_steps):
+            if srvc >= target:
+                if sip == 1:
+                    break
+                lower = service(sip - 1)
+                if lower < target:
+                    break
+                sip, srvc = sip - 1, lower
+            else:
+                upper = service(sip + 1)
+                if upper <= srvc:
+                    # The bank no longer limits the service
+                    break
+                sip, srvc = sip + 1, upper
+        rslt.update(bnk_sip= sip, service= srvc, met= srvc >= target)
+        return rslt
+
+    def size_array(self, target= 0.99, array= 0, uis= None, max_sip= 64):
+        """ Return a dict giving the array (index into array_list) size with
+            the fewest modules whose service meets target, as 'uis', 'sip',
+            'modules' & 'service', whether the target was 'met' and the
+            number of 'evaluations' of the dispatch kernel.
+            The output of one module is computed once and scaled to each
+            candidate size.  As service can only grow with the number of
+            strings, the strings in parallel are found by bisection for each
+            units in series (or only uis if given).  Sizes whose open circuit
+            voltage exceeds the inverter or charge controller PV voltage
+            limits, or whose short circuit current exceeds the charge
+            controller PV current limit, are excluded, as are more than
+            max_sip strings.  If no size meets target, the one giving the
+            best service is returned, without demand the smallest size is.
+            Returns None if the design can't be analyzed or no size is
+            within the limits """
+        if self.array_out is None or len(self.dirty_stages) > 0:
+            if self.run_simulation() is None:
+                return None
+        ary = self.array_list[array]
+        defined = [0] + [i for i in range(1, len(self.array_list))
+                         if self.array_list[i].is_defined()]
+        if array not in defined:
+            return None
+        pos = defined.index(array)
+        pnl = ary.parts[0]
+        voc = pnl.read_attrb('V_oc_ref')
+        isc = pnl.read_attrb('I_sc_ref')
+        parms = resolve_dispatch_parameters(self.inv, self.chgc, self.bnk)
+        vlims = []
+        if parms['chgFlg']:
+            vlims.append(self.chgc.read_attrb('c_pvmxv'))
+        if parms['invFlg']:
+            vlims.append(self.inv.read_attrb('Vdcmax'))
+
+        def within_limits(u, n):
+            if parms['invFlg'] and u*voc > self.inv.read_attrb('Vdcmax'):
+                return False
+            return (not parms['chgFlg'] or
+                    self.chgc.check_array_limits(u*voc, n*isc)[0])
+
+        if uis is not None:
+            uis_list = [uis]
+        elif len(vlims) > 0 and voc > 0:
+            uis_list = list(range(1, int(min(vlims)//voc) + 2))
+        else:
+            uis_list = [ary.read_attrb('uis')]
+        uis_list = [u for u in uis_list if within_limits(u, 1)]
+        sip_max = max_sip
+        while sip_max >= 1 and len(uis_list) > 0 and not within_limits(
+                                                        uis_list[0], sip_max):
+            sip_max -= 1
+        if len(uis_list) == 0 or sip_max < 1:
+            return None
+        dmndhrs = self.load.get_demand_hours()*365
+        if dmndhrs == 0:
+            u = uis_list[0]
+            return {'uis': u, 'sip': 1, 'modules': u, 'service': None,
+                    'met': True, 'evaluations': 0}
+        mdl_out = ary.define_module_performance(self.times.index, self.site,
+                                                self.stw, self.cache_arrays)
+        state = None
+        if parms['bnkFlg']:
+            state = self.bnk.initial_dispatch_state(parms['bnk_cap'])
+        acLd = self.site_load['AC_Load'].values
+        dcLd = self.site_load['DC_Load'].values
+        evals = [0]
+
+        def service(u, n):
+            outs = list(self.array_outs)
+            outs[pos] = scale_module_output(mdl_out, u, n)
+            volts, amps, pwr = combine_array_outputs(outs)
+            flows = dispatch_power_flows(parms, pwr, volts, amps, acLd, dcLd,
+                                         None if state is None else dict(state))
+            evals[0] += 1
+            return flows['PS'].sum()/dmndhrs
+
+        best = None
+        for u in uis_list:
+            hi = sip_max
+            if best is not None and best['met']:
+                # Only sizes with fewer modules than the best can improve it
+                hi = min(hi, (best['modules'] - 1)//u)
+                if hi < 1:
+                    continue
+            srvc = service(u, hi)
+            if srvc < target:
+                if best is None or (not best['met'] and
+                                    srvc > best['service']):
+                    best = {'uis': u, 'sip': hi, 'modules': u*hi,
+                            'service': srvc, 'met': False}
+                continue
+            lo = 0
+            while hi - lo > 1:
+                mid = (lo + hi)//2
+                smid = service(u, mid)
+                if smid >= target:
+                    hi, srvc = mid, smid
+                else:
+                    lo = mid
+            if best is None or not best['met'] or u*hi < best['modules']:
+                best = {'uis': u, 'sip': hi, 'modules': u*hi,
+                        'service': srvc, 'met': True}
+        best['evaluations'] = evals[0]
+        return best
+
+    def write_trace(self, cols):
+        """ Stream the hourly values in cols to the trace file, using the
+            trace_format, trace_columns & trace_sample settings """
+        # Correct for possible power backflow into array, as the dispatch does
+        bkflw = (cols['ArP'] <= 0) | (cols['ArV'] <= 0) | (cols['ArI'] <= 0)
+        for ky in ['ArP', 'ArV', 'ArI']:
+            cols[ky] = np.where(bkflw, 0.0, cols[ky])
+        blksz = 24*31
+        with TraceWriter(self.outfile, self.trace_format, self.trace_columns,
+                         self.trace_sample) as trc:
+            for strt in range(0, len(cols['PO']), blksz):
+                trc.write_block(strt, {ky: vl[strt:strt+blksz]
+                                       for ky, vl in cols.items()})
+
+    def perform_base_error_check(self):
+        """ method to conduct basic error checks
+            returns True if and only if no errors are found """
+        # Tests for Site Definition """
+        bflg = False
+        invflg = False
+
+        if not self.site.check_definition():
+            return False
+
+        #Tests for panel & Array definition
+        if not self.ary.check_definition():
+            return False
+
+        # Tests for proper inverter definition """
+        if sum(self.load.get_load_profile()['AC']) > 0:
+            if not self.inv.check_definition():
+                return False
+            else:
+                invflg = True
+
+        if self.bnk.is_defined():
+            bflg = True
+
+        """Tests for Charge Controller definition
+           (only read if an inverter or battery is defined) """
+        if bflg and not invflg and not self.chgc.check_definition():
+            return False
+
+        return True
+
+
+def main():
+    """ Analyze the project file named on the command line without a GUI """
+    if len(sys.argv) < 2:
+        print('Usage: SPVEngine.py project_file.spv')
+        return
+    eng = SimulationEngine(sys.argv[1])
+    try:
+        rslt = eng.run_simulation()
+    except AttributeError as err:
+        print('Fatal Error: {0}'.format(err))
+        return
+    if rslt is None:
+        print('Project definition is incomplete, analysis not performed')
+        return
+    print(eng.mnthly_pwr_perfm[0])
+    smry = eng.get_service_summary()
+    if smry['service'] is not None:
+        print('System Design provides Power to Load {0:.2f}% of the time'.format(
+                smry['service']*100))
+
+if __name__ == '__main__':
+    main()
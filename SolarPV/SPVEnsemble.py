@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 21:36:18 2026
+Modified on 10/17/2026 to take the cell temperature from the drawn weather
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        SPVEnsemble.py
+  Purpose:     Evaluate a design over an ensemble of weather realizations
+               drawn from the NASA daily statistics (S-Mean & STDV) of the
+               site, rather than the single year of mean weather used by a
+               simulation run.  The realizations of an ensemble are held as
+               (realization x hour) arrays and pass through the module model
+               & dispatch together, a block of realizations at a time so
+               that the working storage stays within a memory cap.  Results
+               are summarized by their mean, P50 & P90 values.
+
+               Usage:
+                   python SPVEnsemble.py Models/site.spv --members 200
+                          --seed 1 --out ensemble.csv
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import argparse
+from math import sqrt
+import numpy as np
+import pandas as pd
+
+from NasaData import get_daily_stat
+from PVDispatch import resolve_dispatch_parameters, dispatch_ensemble
+from PVUtilities import combine_array_outputs, diurnal_temp, diurnal_speed
+
+# Daily statistics drawn for each realization, as average, max & min.  The
+# three of each group share one anomaly
+temp_parms = ['T10M', 'T10M_MAX', 'T10M_MIN']
+wind_parms = ['WS10M', 'WS10M_MAX', 'WS10M_MIN']
+
+# Correlation of a daily anomaly with that of the previous day & of the
+# temperature anomaly with the wind speed anomaly of the same day
+day_correlation = 0.6
+temp_wind_correlation = -0.2
+
+# Realizations are evaluated in blocks of at most MaxBytes working storage
+MaxBytes = 256*1024*1024
+
+# Module output of each array for each realization
+module_columns = ['i_mp', 'v_mp', 'p_mp']
+
+# Most float arrays held while modeling the modules of an array, the cell
+# temperatures & their single diode parameters & results
+module_working = 14
+
+# Columns reported for each realization
+result_columns = ['array_kwh', 'delivered_kwh', 'service', 'loss_of_load',
+                  'unserved_hrs', 'cycles']
+
+# Columns for which larger values are worse, their P90 is exceeded by 10%
+# of the realizations rather than by 90%
+upper_tail = ['loss_of_load', 'unserved_hrs', 'cycles']
+
+
+def bytes_per_hour(arrays):
+    """ Return the working storage of a realization for each hour simulated
+        by a design with arrays (the number of arrays), the most float
+        (realization x hour) arrays held at once by run_ensemble:
+          while drawing - the air temperature, wind speed, array outputs &
+                          module_working for the array being modeled
+          while combining - the array outputs, their combination & its
+                            temporaries
+          while dispatching - the combination, its backflow corrected &
+                              transposed copies and 'PO' & 'PS' """
+    ncols = len(module_columns)
+    cols = max(2 + ncols*arrays + module_working, ncols*arrays + 2*ncols,
+               3*ncols + 2)
+    return np.dtype(float).itemsize*cols
+
+
+def draw_anomalies(members, days, seed= 0, day_corr= day_correlation,
+                   tw_corr= temp_wind_correlation):
+    """ Return (temp, wind) the (realization x days) arrays of standard
+        normal daily anomalies for the realizations numbered in members.
+        Each follows a lag one autoregression over the days with correlation
+        day_corr and the wind anomalies have correlation tw_corr with the
+        temperature anomalies.  A realization's anomalies depend only on
+        seed & its number, not on the members drawn with it """
+    noise = np.array([np.random.RandomState([seed, m]).standard_normal(
+                                                    (2, days)) for m in members])
+    shocks = [noise[:, 0, :],
+              tw_corr*noise[:, 0, :] + sqrt(1 - tw_corr**2)*noise[:, 1, :]]
+    rslt = []
+    for shk in shocks:
+        anom = np.empty_like(shk)
+        anom[:, 0] = shk[:, 0]
+        for d in range(1, days):
+            anom[:, d] = day_corr*anom[:, d-1] + sqrt(1 - day_corr**2)*shk[:, d]
+        rslt.append(anom)
+    return tuple(rslt)
+
+
+def draw_hourly_weather(stats, anomalies, doy, current, sunrise, sunset):
+    """ Return (air_temps, wnd_spds) the (realization x hours) arrays of the
+        hourly air temperature & wind speed of the realizations given by
+        anomalies (from draw_anomalies).  stats holds (S-Mean, STDV) arrays
+        of each of temp_parms & wind_parms by day and doy, current, sunrise
+        & sunset are as returned by PVSite.get_diurnal_times.  Wind speeds
+        are kept positive by diurnal_speed, as for the site's weather """
+    zt, zw = anomalies
+    avT, mxT, mnT = [stats[p][0] + stats[p][1]*zt for p in temp_parms]
+    mxT = np.maximum(mxT, mnT)
+    avS, mxS, mnS = [stats[p][0] + stats[p][1]*zw for p in wind_parms]
+    mxS = np.maximum(mxS, mnS)
+    air_temps = diurnal_temp(avT[:, doy], mxT[:, doy], mnT[:, doy],
+                             current, sunrise, sunset)
+    wnd_spds = diurnal_speed(avS[:, doy], mxS[:, doy], mnS[:, doy],
+                             current, sunrise, sunset)
+    return air_temps, wnd_spds
+
+
+def run_ensemble(eng, members= 100, seed= 0, max_bytes= MaxBytes,
+                 day_corr= day_correlation, tw_corr= temp_wind_correlation):
+    """ Return a DataFrame with a row of result_columns for each of members
+        weather realizations of the design held by eng (a SimulationEngine),
+        evaluated in blocks within max_bytes of working storage.  The cell
+        temperature of the modules departs from the NOCT of a simulation
+        run as the weather of each realization departs from that of the
+        site (see PVArray.define_module_ensemble).
+        Returns None if the design can't be analyzed """
+    if eng.array_out is None or len(eng.dirty_stages) > 0:
+        if eng.run_simulation() is None:
+            return None
+    site = eng.site
+    atmo = site.atmospherics
+    if atmo is None or any(p not in atmo for p in temp_parms + wind_parms):
+        raise ValueError('The site has no daily atmospheric statistics')
+    times = eng.times.index
+    doy, current, sunrise, sunset = site.get_diurnal_times(times)
+    stats = {p: (get_daily_stat(atmo, p, 'S-Mean'),
+                 get_daily_stat(atmo, p, 'STDV'))
+             for p in temp_parms + wind_parms}
+    days = len(stats[temp_parms[0]][0])
+    arrays = [eng.array_list[0]] + [a for a in eng.array_list[1:]
+                                    if a.is_defined()]
+    parms = resolve_dispatch_parameters(eng.inv, eng.chgc, eng.bnk)
+    state = None
+    if parms['bnkFlg']:
+        state = eng.bnk.initial_dispatch_state(parms['bnk_cap'])
+    acLd = eng.site_load['AC_Load'].values
+    dcLd = eng.site_load['DC_Load'].values
+    dmndhrs = eng.load.get_demand_hours()*365
+    block = max(1, int(max_bytes//(len(times)*bytes_per_hour(len(arrays)))))
+    tables = []
+    for first in range(0, members, block):
+        mbrs = list(range(first, min(first + block, members)))
+        air_temps, wnd_spds = draw_hourly_weather(stats,
+                                    draw_anomalies(mbrs, days, seed, day_corr,
+                                                   tw_corr),
+                                    doy, current, sunrise, sunset)
+        outs = []
+        for ary in arrays:
+            mdl = ary.define_module_ensemble(times, site, eng.stw,
+                                             air_temps, wnd_spds)
+            uis = ary.read_attrb('uis')
+            sip = ary.read_attrb('sip')
+            outs.append({'v_mp': mdl['v_mp']*uis, 'i_mp': mdl['i_mp']*sip,
+                         'p_mp': mdl['p_mp']*(uis*sip)})
+        del air_temps, wnd_spds
+        volts, amps, pwr = combine_array_outputs(outs)
+        del outs
+        flows = dispatch_ensemble(parms, pwr, volts, amps, acLd, dcLd, state)
+        srvchrs = flows['PS'].sum(axis= 1)
+        service = srvchrs/dmndhrs if dmndhrs > 0 else np.full(len(mbrs), np.nan)
+        tables.append(pd.DataFrame({
+                'array_kwh': pwr.sum(axis= 1)/1000,
+                'delivered_kwh': flows['PO'].sum(axis= 1)/1000,
+                'service': service,
+                'loss_of_load': 1 - service,
+                'unserved_hrs': dmndhrs - srvchrs,
+                'cycles': flows['cycles'] if parms['bnkFlg'] else np.nan},
+                index= pd.Index(mbrs, name= 'Member'), columns= result_columns))
+    return pd.concat(tables)
+
+
+def summarize_ensemble(table):
+    """ Return a DataFrame of the 'mean', 'std', 'P50' & 'P90' of each
+        column of an ensemble table from run_ensemble.  P90 is the value
+        met or bettered by 90% of the realizations """
+    cols = [c for c in result_columns if c in table.columns]
+    p90 = [table[c].quantile(0.9 if c in upper_tail else 0.1) for c in cols]
+    return pd.DataFrame([table[cols].mean(), table[cols].std(),
+                         table[cols].quantile(0.5), pd.Series(p90, index= cols)],
+                        index= ['mean', 'std', 'P50', 'P90'])
+
+
+def main():
+    from SPVSweep import load_project
+    prs = argparse.ArgumentParser(description= 'Evaluate a Solar PV project '
+                                  'over an ensemble of weather realizations')
+    prs.add_argument('project', help= 'saved project file')
+    prs.add_argument('--members', type= int, default= 100)
+    prs.add_argument('--seed', type= int, default= 0)
+    prs.add_argument('--max-mb', type= float, default= MaxBytes/(1024*1024),
+                     help= 'working storage limit in megabytes')
+    prs.add_argument('--wdir', default= None,
+                     help= 'directory holding Resources, defaults to this one')
+    prs.add_argument('--out', default= None,
+                     help= 'file to receive the result of each realization')
+    args = prs.parse_args()
+    eng = load_project(args.project, args.wdir)
+    table = run_ensemble(eng, args.members, args.seed,
+                         int(args.max_mb*1024*1024))
+    if table is None:
+        prs.error('the project design is incomplete')
+    if args.out is not None:
+        table.to_csv(args.out)
+    print(summarize_ensemble(table).to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 20:14:06 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        SPVSweep.py
+  Purpose:     Evaluate a saved project over grids of array tilt, azimuth,
+               units in series & strings in parallel.  Variants are run on a
+               pool of processes, each holding one SimulationEngine, so the
+               climatology is retrieved once and the solar geometry is
+               computed once per process.  Results are appended to a CSV
+               file as they complete, so an interrupted sweep resumes where
+               it stopped.
+
+               Usage:
+                   python SPVSweep.py Models/site.spv --tilt 10 15 20
+                          --sip 2 3 4 --out sweep.csv
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import argparse
+import io
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+from SPVEngine import SimulationEngine
+from PVUtilities import create_time_indices
+
+# Array attributes which may be swept, in variant order
+sweep_parameters = ['tilt', 'azimuth', 'uis', 'sip']
+
+# Columns reported for each variant
+result_columns = ['array_kwh', 'delivered_kwh', 'service', 'service_hrs',
+                  'cycles', 'status']
+
+
+def build_variants(grid):
+    """ Return the list of variant dicts formed by the product of the
+        value lists in grid, in a repeatable order """
+    keys = [k for k in sweep_parameters if k in grid]
+    bad = [k for k in grid if k not in sweep_parameters]
+    if bad:
+        raise ValueError('Parameters cannot be swept: {0}'.format(bad))
+    return [dict(zip(keys, vals))
+            for vals in itertools.product(*[list(grid[k]) for k in keys])]
+
+
+def apply_variant(eng, variant, array= 0):
+    """ Set the attributes of variant on array (index into eng.array_list)
+        together with those derived from them """
+    ary = eng.array_list[array]
+    for ky, val in variant.items():
+        ary.set_attribute(ky, val)
+    uis = ary.read_attrb('uis')
+    sip = ary.read_attrb('sip')
+    ary.set_attribute('ary_tpnl', uis * sip)
+    if len(ary.parts) > 0:
+        pnl = ary.parts[0]
+        ary.set_attribute('ary_Vmp', uis * pnl.read_attrb('V_mp_ref'))
+        ary.set_attribute('ary_Imp', sip * pnl.read_attrb('I_mp_ref'))
+
+
+def evaluate_variant(eng, variant, array= 0):
+    """ Apply variant to eng, run the simulation & return a dict of the
+        result_columns """
+    rslt = dict.fromkeys(result_columns)
+    try:
+        apply_variant(eng, variant, array)
+        if eng.run_simulation() is None:
+            rslt['status'] = 'Design is incomplete'
+            return rslt
+    except (AttributeError, ValueError) as err:
+        rslt['status'] = str(err)
+        return rslt
+    smry = eng.get_service_summary()
+    rslt['array_kwh'] = eng.power_flow['ArrayPower'].sum()/1000
+    rslt['delivered_kwh'] = eng.power_flow['PowerOut'].sum()/1000
+    rslt['service'] = smry['service']
+    rslt['service_hrs'] = smry['service_hrs']
+    rslt['cycles'] = smry['cycles']
+    rslt['status'] = 'ok'
+    return rslt
+
+
+def load_project(project, wdir= None):
+    """ Return a SimulationEngine holding project, with its atmospherics
+        retrieved if the project did not include them """
+    if wdir is None:
+        wdir = os.path.dirname(os.path.abspath(__file__))
+    eng = SimulationEngine(project, wdir)
+    if eng.site.atmospherics is None:
+        times = create_time_indices(eng.site.read_attrb('tz'))
+        eng.site.get_atmospherics(times.index, None)
+    return eng
+
+
+_worker_engine = None
+
+def _init_worker(project, wdir, atmospherics):
+    global _worker_engine
+    _worker_engine = SimulationEngine(project, wdir)
+    _worker_engine.site.atmospherics = atmospherics
+
+def _run_variant(indx, variant, array):
+    return indx, evaluate_variant(_worker_engine, variant, array)
+
+
+def read_results(results_file, variants):
+    """ Return the rows of a previous run of this sweep held in
+        results_file, keyed by variant index.  A row left incomplete by an
+        interrupted sweep is ignored """
+    if results_file is None or not os.path.exists(results_file):
+        return dict()
+    with open(results_file, newline= '') as fi:
+        text = fi.read()
+    text = text[:text.rfind('\n') + 1]
+    if text.count('\n') < 2:
+        return dict()
+    prev = pd.read_csv(io.StringIO(text), keep_default_na= False,
+                       na_values= [''], float_precision= 'round_trip')
+    done = dict()
+    for row in prev.to_dict('records'):
+        indx = int(row['variant'])
+        if indx >= len(variants) or any(row[k] != v for k, v in
+                                        variants[indx].items()):
+            raise ValueError('{0} holds results of a different sweep'.format(
+                                results_file))
+        done[indx] = row
+    return done
+
+
+def run_sweep(project, grid, results_file= None, array= 0, max_workers= None,
+              wdir= None):
+    """ Evaluate project for every variant of grid (a dict of value lists
+        keyed by sweep_parameters) applied to array, using up to
+        max_workers processes.  Completed variants found in results_file
+        are not rerun and new results are appended to it as they finish.
+        Returns a DataFrame with a row per variant in variant order """
+    variants = build_variants(grid)
+    done = read_results(results_file, variants)
+    todo = [i for i in range(len(variants)) if i not in done]
+    cols = ['variant'] + list(variants[0].keys()) + result_columns
+    if len(todo) > 0:
+        eng = load_project(project, wdir)
+        fo = None
+        if results_file is not None:
+            # Rewrite the completed rows, dropping any incomplete one
+            pd.DataFrame([done[i] for i in sorted(done)], columns= cols
+                         ).to_csv(results_file, index= False)
+            fo = open(results_file, 'a', newline= '')
+        try:
+            with ProcessPoolExecutor(max_workers, initializer= _init_worker,
+                                     initargs= (project, eng.wdir,
+                                                eng.site.atmospherics)) as ex:
+                futs = [ex.submit(_run_variant, i, variants[i], array)
+                        for i in todo]
+                for fut in as_completed(futs):
+                    indx, rslt = fut.result()
+                    row = dict(variant= indx, **variants[indx], **rslt)
+                    done[indx] = row
+                    if fo is not None:
+                        pd.DataFrame([row], columns= cols).to_csv(
+                                fo, header= False, index= False)
+                        fo.flush()
+        finally:
+            if fo is not None:
+                fo.close()
+    table = pd.DataFrame([done[i] for i in sorted(done)], columns= cols)
+    table = table.astype({c: float for c in result_columns if c != 'status'})
+    if results_file is not None:
+        table.to_csv(results_file, index= False)
+    return table
+
+
+def main():
+    prs = argparse.ArgumentParser(description= 'Sweep array configurations '
+                                  'of a Solar PV project')
+    prs.add_argument('project', help= 'saved project file')
+    prs.add_argument('--tilt', type= float, nargs= '+')
+    prs.add_argument('--azimuth', type= float, nargs= '+')
+    prs.add_argument('--uis', type= int, nargs= '+')
+    prs.add_argument('--sip', type= int, nargs= '+')
+    prs.add_argument('--array', type= int, default= 1, choices= [1, 2],
+                     help= 'array to vary, primary (1) or secondary (2)')
+    prs.add_argument('--workers', type= int, default= None)
+    prs.add_argument('--wdir', default= None,
+                     help= 'directory holding Resources, defaults to this one')
+    prs.add_argument('--out', default= 'sweep.csv',
+                     help= 'results file, an existing one is resumed')
+    args = prs.parse_args()
+    grid = {k: getattr(args, k) for k in sweep_parameters
+            if getattr(args, k) is not None}
+    if len(grid) == 0:
+        prs.error('at least one of --tilt, --azimuth, --uis or --sip is required')
+    table = run_sweep(args.project, grid, args.out, args.array - 1,
+                      args.workers, args.wdir)
+    print(table.to_string(index= False))
+
+
+if __name__ == '__main__':
+    main()
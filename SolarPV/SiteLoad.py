@@ -7,6 +7,8 @@ Modified   Wed Dec  5 2018 (Fix Issue 2, Handle DC Loads)
 Modified on 02/22/2019 for version 0.1.0
 Modified on 04/11/2021 to address Issues #10, 12, & 13 related to improving 
             Site Load Definition performance and ease of use
+Modified on 10/17/2026 to cache & vectorize the load profile
+Modified on 10/17/2026 to load guiFrames only for the graphics
 
 @author: Bob Hentz
 
@@ -27,7 +29,6 @@ import numpy as np
 import pandas as pd
 import Parameters as sp
 from DataFrame import DataFrame
-import guiFrames as tbf
 
 def findindex(val):
     """ If val is a Column Label return the column index
@@ -45,6 +46,8 @@ class SiteLoad(DataFrame):
     def __init__(self, master= None):
         self.master = master
         DataFrame.__init__(self,   sp.load_fields, sp.load_field_types)
+        self.profile = None          # cached result of get_load_profile
+        self.profile_version = None  # frame version the profile reflects
 
     def addRow(self, typ, qty=None, uf=None, hrs=None, st=0, wts=None, 
                mde=None):
@@ -85,43 +88,58 @@ class SiteLoad(DataFrame):
     def get_load_profile(self):
         """ Return a Dataframe of hourly usage by AC, DC and Total Power
             for the given load over a 24 hour period """
-        ac_rslt = [0.0]*24
-        dc_rslt = [0.0]*24
-        tl_rslt = [0.0]*24
-        for dfrw in range(self.get_row_count()):
-            ac_mode = True
-            ldvals = self.get_row_by_index(dfrw)
-            if ldvals[sp.load_fields.index('Mode')] == 'DC':
-                ac_mode = False            
-            hr_wts = (ldvals[sp.load_fields.index('Qty')] *
-                      ldvals[sp.load_fields.index('Use Factor')] *
-                      ldvals[sp.load_fields.index('Watts')] )
-            st = ldvals[sp.load_fields.index('Start Hour')]
-            if type(st) is str or st is None:
-                st = 0
-            hpd = ldvals[sp.load_fields.index('Hours')]
-            if type(hpd) is str or hpd is None:
-                hpd = 24
-            et = hpd + st
-            for h in range(24):
-                if et < 24:
-                    if h >= st and h < et:
-                        if ac_mode:
-                            ac_rslt[h] += hr_wts
-                        else:
-                            dc_rslt[h] += hr_wts
-                else:
-                    if h >= st or h + 24 < et:
-                        if ac_mode:
-                            ac_rslt[h] += hr_wts
-                        else:
-                            dc_rslt[h] += hr_wts
-        for i in range(24):
-            tl_rslt[i] = ac_rslt[i] + dc_rslt[i]
-        return pd.DataFrame({'AC': ac_rslt, 'DC': dc_rslt, 'Total':tl_rslt})
+        if self.profile is None or self.profile_version != self.get_version():
+            self.profile = self.compute_load_profile()
+            self.profile_version = self.get_version()
+        return self.profile.copy()
+
+    def compute_load_profile(self):
+        """ Build the 24 hour load profile using a difference array of the
+            hours each load row starts & stops drawing power """
+        qty = self.get_column('Qty')
+        uf = self.get_column('Use Factor')
+        wts = self.get_column('Watts')
+        hr_wts = np.array([qty[r]*uf[r]*wts[r] for r in range(len(qty))],
+                          dtype= float)
+        st = np.array([0 if type(v) is str or v is None else v
+                       for v in self.get_column('Start Hour')], dtype= float)
+        hpd = np.array([24 if type(v) is str or v is None else v
+                        for v in self.get_column('Hours')], dtype= float)
+        dc_mode = np.array([m == 'DC' for m in self.get_column('Mode')],
+                           dtype= bool)
+        et = hpd + st
+        # A load is on for hours h where st <= h < et, wrapping past
+        # midnight when et >= 24
+        wrap = et >= 24
+        on = np.clip(np.ceil(st), 0, 24)
+        off = np.where(wrap, 24, np.maximum(on, np.clip(np.ceil(et), 0, 24)))
+        wrap_off = np.where(wrap, np.clip(np.ceil(et - 24), 0, 24), 0)
+        # Wrapped periods overlapping the start hour cover the whole day
+        full = wrap & (wrap_off >= on)
+        on = np.where(full, 0, on).astype(int)
+        wrap_off = np.where(full, 0, wrap_off).astype(int)
+        off = off.astype(int)
+        periods = [(on, off), (np.zeros_like(wrap_off), wrap_off)]
+        rslt = []
+        for mode in [~dc_mode, dc_mode]:
+            dlt = np.zeros(25)
+            cnt = np.zeros(25, dtype= int)
+            for strt, stp in periods:
+                sel = mode & (stp > strt)
+                np.add.at(dlt, strt[sel], hr_wts[sel])
+                np.add.at(dlt, stp[sel], -hr_wts[sel])
+                np.add.at(cnt, strt[sel], 1)
+                np.add.at(cnt, stp[sel], -1)
+            # hours without any active load are exactly zero
+            rslt.append(np.where(np.cumsum(cnt)[:24] > 0,
+                                 np.cumsum(dlt)[:24], 0.0))
+        ac_rslt, dc_rslt = rslt
+        return pd.DataFrame({'AC': ac_rslt, 'DC': dc_rslt,
+                             'Total': ac_rslt + dc_rslt})
 
     def show_load_profile(self, window):
         """ Build & display the load profile graphic """
+        import guiFrames as tbf
         elp = self.get_load_profile()
         dmd_hrs = len(elp.loc[elp['Total'] > 0])
         if dmd_hrs > 0:
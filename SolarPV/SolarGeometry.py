@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:02:44 2026
+
+@author: Bob Hentz
+-------------------------------------------------------------------------------
+  Name:        SolarGeometry.py
+  Purpose:     Compute the solar geometry of a site over a time index once
+               and share it between every consumer (array performance,
+               atmospherics & battery overview).  Entries are keyed on the
+               location coordinates, altitude & time zone together with the
+               time index, so a change to any of them yields a new entry
+
+  Copyright:   (c) Bob Hentz 2018
+  License:     GNU General Public License, version 3 (GPL-3.0)
+               This program is distributed WITHOUT ANY WARRANTY;
+               without even the implied warranty of MERCHANTABILITY
+               or FITNESS FOR A PARTICULAR PURPOSE.
+ -------------------------------------------------------------------------------
+"""
+import hashlib
+import numpy as np
+import pandas as pd
+from pvlib.irradiance import get_extra_radiation
+from pvlib.solarposition import sun_rise_set_transit_spa
+
+
+def values_digest(vals):
+    """ Return a short digest identifying an array of values """
+    if vals is None:
+        return None
+    if isinstance(vals, pd.DatetimeIndex):
+        return hashlib.sha1(vals.asi8.tobytes() +
+                            str(vals.tz).encode('utf-8')).hexdigest()
+    return hashlib.sha1(np.asarray(vals, dtype= float).tobytes()).hexdigest()
+
+
+class SolarGeometry:
+    """ Lazily computed solar geometry for a pvlib Location over times.
+        Solar position & airmass depend on the air temperature used for
+        refraction and are held for each temperature series requested """
+    def __init__(self, loc, times):
+        self.loc = loc
+        self.times = times
+        self.solpos = dict()
+        self.airmass = dict()
+        self.csky = dict()
+        self.dni_extra = None
+        self.suntimes = None
+        self.day_pos = None
+
+    def get_solarposition(self, temperature= 12):
+        """ Return the Location solar position for times """
+        ky = values_digest(temperature)
+        if ky not in self.solpos:
+            self.solpos[ky] = self.loc.get_solarposition(self.times,
+                                        pressure= None, temperature= temperature)
+        return self.solpos[ky]
+
+    def get_airmass(self, temperature= 12, model= 'kastenyoung1989'):
+        """ Return relative & absolute airmass for times """
+        ky = (values_digest(temperature), model)
+        if ky not in self.airmass:
+            self.airmass[ky] = self.loc.get_airmass(self.times,
+                                    solar_position= self.get_solarposition(
+                                                    temperature), model= model)
+        return self.airmass[ky]
+
+    def get_clearsky(self, model= 'ineichen'):
+        """ Return clear sky ghi, dni & dhi for times """
+        if model not in self.csky:
+            self.csky[model] = self.loc.get_clearsky(self.times, model= model)
+        return self.csky[model]
+
+    def get_dni_extra(self):
+        """ Return extraterrestrial DNI for times """
+        if self.dni_extra is None:
+            self.dni_extra = get_extra_radiation(self.times)
+        return self.dni_extra
+
+    def get_sun_times(self):
+        """ Return a DataFrame of 'sunrise', 'sunset' & 'transit' times
+            with a row for each day spanned by times """
+        if self.suntimes is None:
+            days = self.times.normalize()
+            dlst = days.drop_duplicates()
+            self.day_pos = dlst.get_indexer(days)
+            self.suntimes = sun_rise_set_transit_spa(dlst, self.loc.latitude,
+                                                     self.loc.longitude)
+        return self.suntimes
+
+    def get_day_positions(self):
+        """ Return the row of get_sun_times for each time in times """
+        self.get_sun_times()
+        return self.day_pos
+
+
+# SolarGeometry instances keyed on location & time index
+_geometry_cache = dict()
+
+def get_solar_geometry(loc, times):
+    """ Return the shared SolarGeometry for loc over times """
+    ky = (loc.latitude, loc.longitude, loc.altitude, str(loc.tz),
+          values_digest(times))
+    if ky not in _geometry_cache:
+        if len(_geometry_cache) >= 8:
+            _geometry_cache.clear()
+        _geometry_cache[ky] = SolarGeometry(loc, times)
+    return _geometry_cache[ky]
+
+
+def main():
+    print('SolarGeometry Load Check')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ Created on Tue Jul 10 11:07:02 2018
 Modified on 02/22/2019 for version 0.1.0
 Modified on 04/11/2021 to address Issues #10, 12, & 13 related to improving 
             Site Load Definition performance and ease of use
+Modified on 10/17/2026 to run long retrievals on a worker thread
 
 
 @author: Bob Hentz
@@ -24,6 +25,7 @@ Modified on 04/11/2021 to address Issues #10, 12, & 13 related to improving
 """
 
 
+import threading
 import tkinter as tk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
@@ -57,21 +59,90 @@ def entry_is_empty(data):
         return True
     return False
     
+class BackgroundTask:
+    """ Runs command(*command_args) on a worker thread.  The application
+        root polls for completion every poll_ms and then calls
+        callback(result, error) on the Tk thread, error being None or the
+        exception raised by command.  Polling on the root rather than on
+        parent keeps it alive when parent is destroyed first.  A cancelled
+        task never calls back """
+    def __init__(self, parent, command, *command_args, callback= None,
+                 poll_ms= 100):
+        self.root = parent.nametowidget('.')
+        self.callback = callback
+        self.poll_ms = poll_ms
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.done = threading.Event()
+        self.thread = threading.Thread(target= self._run,
+                                       args= (command, command_args),
+                                       daemon= True)
+        self.thread.start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _run(self, command, command_args):
+        try:
+            self.result = command(*command_args)
+        except Exception as err:
+            self.error = err
+        self.done.set()
+
+    def _poll(self):
+        if self.cancelled:
+            return
+        if not self.done.is_set():
+            self.root.after(self.poll_ms, self._poll)
+        elif self.callback is not None:
+            self.callback(self.result, self.error)
+
+    def cancel(self):
+        """ Abandon the task, its result will be ignored """
+        self.cancelled = True
+
+    def is_running(self):
+        """ Return True while the task is neither finished nor cancelled """
+        return not self.cancelled and not self.done.is_set()
+
+
+def run_in_background(parent, command, *command_args, callback= None):
+    """ Execute command(*command_args) without blocking the GUI and
+        deliver the results to callback(result, error) on the Tk thread.
+        Returns the BackgroundTask, which may be cancelled """
+    return BackgroundTask(parent, command, *command_args, callback= callback)
+
+
 def popup_notification(parent, message, command, *command_args, color= '#ffff80'):
     """ Create a popup notification to alert user to long running process
-        Execute the Process, clear the alert screen and return the process results """
-    rslts = None
+        Execute the Process on a worker thread while the GUI remains active,
+        clear the alert screen and return the process results, or None if
+        the user cancels the process """
     tplvl = tk.Toplevel()
     tplvl.lift()
     lbl = tk.Label(tplvl, text = message, padx= 5, pady=5, bd= 5, bg= color)
     lbl.pack(fill = "both", expand=True)
+    finished = tk.BooleanVar(tplvl, False)
+    outcome = {'result': None, 'error': None}
+
+    def on_done(result, error):
+        outcome['result'] = result
+        outcome['error'] = error
+        finished.set(True)
+
+    def on_cancel():
+        task.cancel()
+        finished.set(True)
+
+    tk.Button(tplvl, text= 'Cancel', command= on_cancel).pack(pady= 5)
+    tplvl.protocol('WM_DELETE_WINDOW', on_cancel)
     parent.update_idletasks()
-    if command_args is None:
-        rslts = command()
-    else:
-        rslts = command(*command_args)
+    task = run_in_background(tplvl, command, *command_args, callback= on_done)
+    # Process GUI events until the task completes or is cancelled
+    tplvl.wait_variable(finished)
     tplvl.destroy()
-    return  rslts   
+    if outcome['error'] is not None:
+        raise outcome['error']
+    return  outcome['result']
  
 def build_menubar(parent, menu_itms):
     """ Create a Menu bar and populate it's contents 
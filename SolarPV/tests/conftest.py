@@ -0,0 +1,127 @@
+""" Shared fixtures building a complete design in a SimulationEngine.
+    The CEC Modules resource is not distributed, so a working directory
+    holding one module is created for each test, and the atmospherics are
+    synthesized so that no network access is needed """
+import os
+import shutil
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+SRCDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SRCDIR not in sys.path:
+    sys.path.insert(0, SRCDIR)
+
+module_csv = """Name,Technology,Bifacial,STC,PTC,A_c,Length,Width,N_s,I_sc_ref,V_oc_ref,I_mp_ref,V_mp_ref,alpha_sc,beta_oc,T_NOCT,a_ref,I_L_ref,I_o_ref,R_s,R_sh_ref,Adjust,gamma_r,BIPV,Version,Date,Manufacturer,Model
+Units,,,,,m2,m,m,,A,V,A,V,A/K,V/K,C,V,A,A,Ohm,Ohm,%,%/K,,,,,
+[0],cec_material,lib_is_bifacial,,,cec_area,,,cec_n_s,cec_i_sc_ref,cec_v_oc_ref,cec_i_mp_ref,cec_v_mp_ref,cec_alpha_sc,cec_beta_oc,cec_t_noct,cec_a_ref,cec_i_l_ref,cec_i_o_ref,cec_r_s,cec_r_sh_ref,cec_adjust,cec_gamma_r,,,,,
+Canadian Solar Inc. CS6C-140P,Multi-c-Si,0,140.336,127.0,0.989000,1.485,0.666,36,8.400000,22.100000,7.840000,17.900000,0.005351,-0.080753,44.100000,0.944516,8.410069,5.695768e-10,0.183345,152.941925,4.013265,-0.453800,N,SAM 2018.11.11 r2,1/3/2019,Canadian Solar Inc.,CS6C-140P
+"""
+
+
+def synthetic_atmospherics(seed= 1):
+    """ Return daily statistics in the form LoadNasaData provides """
+    rng = np.random.RandomState(seed)
+    doy = np.arange(1, 366)
+    base = {'T10M': 22, 'T10M_MAX': 28, 'T10M_MIN': 15,
+            'WS10M': 3, 'WS10M_MAX': 6, 'WS10M_MIN': 2}
+    atmo = dict()
+    for ky, val in base.items():
+        mn = val + 3*np.sin(2*np.pi*doy/365) + rng.rand(365)
+        atmo[ky] = pd.DataFrame({'Min': mn - 2, 'Max': mn + 2, 'S-Mean': mn,
+                                 'STDV': 1 + rng.rand(365)},
+                                index= pd.Index(doy, name= 'DayofYear'))
+    return atmo
+
+
+def build_design(eng, bank= True, loads= True, inverter= True):
+    """ Define a two array system with a charge controller, (if inverter)
+        an inverter and (if bank) a battery bank serving a small site load """
+    site = eng.site
+    for ky, val in dict(lat= -1.2921, lon= 36.8219, elev= 1700.0, tz= 3,
+                        gv= 240, gf= 50, city= 'Nairobi',
+                        cntry= 'Kenya').items():
+        site.set_attribute(ky, val)
+    site.atmospherics = synthetic_atmospherics()
+    site.atmo_key = (site.read_attrb('lat'), site.read_attrb('lon'))
+    mods = eng.modules
+    pnl = eng.pnl
+    pnl.set_attribute('Name', mods.index[0])
+    pnl.set_attribute('m_mfg', mods['Manufacturer'].iloc[0])
+    pnl.set_attribute('m_mdl', mods['Model'].iloc[0])
+    for ky in pnl.args:
+        if ky in mods.columns:
+            pnl.set_attribute(ky, mods[ky].iloc[0])
+    for ary, (tilt, azm, uis, sip) in zip([eng.ary, eng.sec_ary],
+                                          [(15, 0, 2, 3), (20, 90, 2, 2)]):
+        for ky, val in dict(tilt= tilt, azimuth= azm,
+                            mtg_cnfg= 'open_rack_cell_glassback',
+                            gnd_cnd= 'Concrete', albedo= 0.3, uis= uis,
+                            sip= sip, mtg_hgt= 1.0).items():
+            ary.set_attribute(ky, val)
+        ary.set_attribute('ary_Vmp', uis*pnl.read_attrb('V_mp_ref'))
+        ary.set_attribute('ary_Imp', sip*pnl.read_attrb('I_mp_ref'))
+    if bank:
+        for ky, val in dict(b_mfg= 'X', b_mdl= 'Y', b_typ= 'AGM', b_nomv= 12.0,
+                            b_rcap= 200.0, b_rhrs= 20, b_ir= 0.01,
+                            b_stdTemp= 25.0, b_mxDschg= 1200,
+                            b_mxDoD= 50.0).items():
+            eng.bat.set_attribute(ky, val)
+        for ky, val in dict(doa= 2, doc= 60.0, bnk_uis= 2, bnk_sip= 2).items():
+            eng.bnk.set_attribute(ky, val)
+    if inverter:
+        invs = eng.inverters
+        irow = invs[(invs['Paco'] > 1500) & (invs['Paco'] < 3000)].iloc[0]
+        eng.inv.set_attribute('i_mfg', irow['Manufacturer'])
+        eng.inv.set_attribute('i_mdl', irow['Model'])
+        eng.inv.set_attribute('Name', irow.name)
+        for ky in eng.inv.args:
+            if ky in invs.columns:
+                eng.inv.set_attribute(ky, irow[ky])
+    for ky, val in dict(c_type= 'MPPT', c_pvmxv= 150.0, c_pvmxi= 60.0,
+                        c_bvnom= 24.0, c_mvchg= 28.0, c_michg= 40.0,
+                        c_midschg= 40.0, c_cnsmpt= 2.0, c_eff= 95.0).items():
+        eng.chgc.set_attribute(ky, val)
+    if loads:
+        for row in [['Light, LED', 15, 0.30, "", "", 5.0, 'AC'],
+                    ['Light, LED', 8, 0.85, 2, 6, 5.0, 'AC'],
+                    ['Well Pump DC, 1 HP', 1, 0.35, 12, 8, 500.0, 'DC'],
+                    ['Phone Charger', 10, 0.45, 12, 22, 2.0, 'DC'],
+                    ['Refrigerator, 18 cf', 2, 0.6, 24, 0, 125.0, 'AC'],
+                    ['TV LCD', 3, 0.9, 6, 19, 25.0, 'AC']]:
+            eng.load.add_new_row(row)
+    return eng
+
+
+@pytest.fixture
+def wdir(tmp_path, monkeypatch):
+    """ A working directory holding the application Resources """
+    rsc = tmp_path / 'Resources'
+    rsc.mkdir()
+    for fn in ['Countries.csv', 'CEC Inverters.csv']:
+        shutil.copy(os.path.join(SRCDIR, 'Resources', fn), str(rsc / fn))
+    (rsc / 'CEC Modules.csv').write_text(module_csv)
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+@pytest.fixture
+def nasa_cache(tmp_path, monkeypatch):
+    """ An empty NASA data cache, with the NASA request URL & cache restored
+        after the test and retries backing off briefly """
+    import NasaData
+    from PVCache import DiskCache
+    monkeypatch.setattr(NasaData, 'BaseURL', NasaData.BaseURL)
+    monkeypatch.setattr(NasaData, '_nasa_cache', NasaData._nasa_cache)
+    monkeypatch.setattr(NasaData, 'RetryBackoff', 0.001)
+    cache = DiskCache(str(tmp_path / 'NASA'))
+    NasaData.set_nasa_cache(cache)
+    return cache
+
+
+@pytest.fixture
+def engine(wdir):
+    """ A SimulationEngine holding a complete design with a battery bank """
+    from SPVEngine import SimulationEngine
+    return build_design(SimulationEngine(wdir= wdir))
@@ -0,0 +1,31 @@
+""" Sizing an array for a service target """
+import pytest
+
+
+@pytest.fixture
+def limited(engine):
+    """ The design with a charge controller admitting at most two modules
+        in series and two strings """
+    engine.chgc.set_attribute('c_pvmxv', 60.0)
+    engine.chgc.set_attribute('c_pvmxi', 20.0)
+    engine.ary.set_attribute('sip', 2)
+    return engine
+
+
+def within_limits(eng, rslt):
+    pnl = eng.pnl
+    return (rslt['uis']*pnl.read_attrb('V_oc_ref') <=
+            eng.chgc.read_attrb('c_pvmxv') and
+            rslt['sip']*pnl.read_attrb('I_sc_ref') <=
+            eng.chgc.read_attrb('c_pvmxi'))
+
+
+@pytest.mark.parametrize('target', [0.3, 0.999])
+def test_sizes_stay_within_pv_limits(limited, target):
+    rslt = limited.size_array(target)
+    assert within_limits(limited, rslt)
+
+
+def test_size_beyond_voltage_limit_is_refused(limited):
+    assert limited.size_array(0.5, uis= 2) is not None
+    assert limited.size_array(0.5, uis= 3) is None
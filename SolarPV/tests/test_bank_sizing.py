@@ -0,0 +1,45 @@
+""" Sizing the battery bank for a service target """
+import pytest
+from SPVEngine import SimulationEngine
+from conftest import build_design
+
+
+@pytest.fixture
+def dc_engine(wdir):
+    """ A DC system without inverter, the bank limiting its service """
+    eng = build_design(SimulationEngine(wdir= wdir), loads= False,
+                       inverter= False)
+    eng.bat.set_attribute('b_rcap', 20.0)
+    for row in [['Light, LED', 10, 0.30, 18, 6, 5.0, 'DC'],
+                ['Phone Charger', 10, 0.45, 12, 22, 2.0, 'DC'],
+                ['Refrigerator, 18 cf', 1, 0.6, 24, 0, 125.0, 'DC']]:
+        eng.load.add_new_row(row)
+    return eng
+
+
+def service_with_strings(eng, sip):
+    eng.bnk.set_attribute('bnk_sip', sip)
+    eng.run_simulation()
+    return eng.get_service_summary()['service']
+
+
+@pytest.mark.parametrize('target', [0.6, 0.8, 0.95])
+def test_estimated_bank_meets_target(dc_engine, target):
+    rslt = dc_engine.size_battery_bank(target, confirm= False)
+    assert service_with_strings(dc_engine, rslt['bnk_sip']) >= target
+
+
+def test_confirmed_bank_is_smallest(dc_engine):
+    rslt = dc_engine.size_battery_bank(0.8)
+    assert rslt['met']
+    sip = rslt['bnk_sip']
+    assert service_with_strings(dc_engine, sip) == rslt['service']
+    assert service_with_strings(dc_engine, sip - 1) < 0.8
+
+
+def test_no_demand_needs_no_bank(wdir):
+    eng = build_design(SimulationEngine(wdir= wdir), loads= False,
+                       inverter= False)
+    rslt = eng.size_battery_bank(0.9)
+    assert rslt['bnk_sip'] == 1
+    assert rslt['service'] is None and rslt['met']
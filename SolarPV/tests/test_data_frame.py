@@ -0,0 +1,35 @@
+""" Frame contents survive export & import as a project file does """
+import pickle
+import pandas as pd
+from SiteLoad import SiteLoad
+from test_site_load import Rows
+
+
+def test_export_import_round_trip():
+    load = SiteLoad()
+    load.add_rows(Rows)
+    load.set_cell_value([2, load.get_col_indx('Hours')], '')
+    saved = pickle.loads(pickle.dumps(load.export_frame()))
+    copy = SiteLoad()
+    copy.add_new_row(Rows[0])
+    copy.purge_frame()
+    version = copy.get_version()
+    copy.import_frame(saved)
+    assert copy.get_version() > version
+    assert copy.get_shape() == load.get_shape()
+    for r in range(load.get_row_count()):
+        assert copy.get_row_by_index(r) == load.get_row_by_index(r)
+    assert copy.get_dataframe().equals(load.get_dataframe())
+    assert copy.get_load_profile().equals(load.get_load_profile())
+
+
+def test_import_of_pandas_export():
+    """ Projects saved before the column store hold a DataFrame's
+        to_dict('index'), which may lack columns added since """
+    df = pd.DataFrame(Rows, columns= SiteLoad().get_headers())
+    saved = df.drop(columns= ['Mode']).to_dict('index')
+    load = SiteLoad()
+    load.import_frame(saved)
+    assert load.get_column('Mode') == [''] * len(Rows)
+    assert load.get_column('Qty') == [r[1] for r in Rows]
+    assert load.get_column('Start Hour') == [r[4] for r in Rows]
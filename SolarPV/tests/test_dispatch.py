@@ -0,0 +1,67 @@
+""" The dispatch kernels reproduce PVUtilities.computOutputResults """
+import numpy as np
+import pytest
+from SPVEngine import SimulationEngine
+from PVDispatch import (resolve_dispatch_parameters, dispatch_power_flows,
+                        dispatch_ensemble, system_loads)
+from PVUtilities import computOutputResults
+from conftest import build_design
+
+# Hours compared, enough for the bank to be drained & recharged
+Hours = 24*60
+
+
+def legacy_power_flows(eng, arp, arv, ari, acld, dcld):
+    """ The hourly loop of computOutputResults used before PVDispatch """
+    bflg = eng.bnk.is_defined()
+    rslt = {ky: np.zeros(len(arp)) for ky in ['PO', 'PS', 'DE', 'BS', 'BD',
+                                               'BP']}
+    rslt['EM'] = np.empty(len(arp), dtype= object)
+    for tindx in range(len(arp)):
+        wkDict = dict()
+        ArP, ArV, ArI = arp[tindx], arv[tindx], ari[tindx]
+        if ArP <= 0 or ArV <= 0 or ArI <= 0:
+            ArP = ArV = ArI = 0.0
+        computOutputResults({'Inv': eng.inv, 'Chg': eng.chgc, 'Bnk': eng.bnk},
+                            ArP, ArV, ArI, acld[tindx], dcld[tindx], wkDict)
+        for ky in ['PO', 'PS', 'DE']:
+            rslt[ky][tindx] = wkDict.pop(ky, 0.0)
+        if bflg:
+            rslt['BS'][tindx] = wkDict.pop('BS', eng.bnk.get_soc())*100
+            rslt['BD'][tindx] = wkDict.pop('BD', 0.0)
+            rslt['BP'][tindx] = wkDict.pop('BP', eng.bnk.current_power())
+        rslt['EM'][tindx] = ''
+        if 'Error' in wkDict:
+            rslt['EM'][tindx] = ('After {0} days '.format(1 + tindx//24) +
+                                 wkDict['Error'][0].replace('\n', ' '))
+    return rslt
+
+
+@pytest.mark.parametrize('bank, inverter, c_type', [
+        (True, True, 'MPPT'), (True, True, 'PWM'), (False, True, 'MPPT'),
+        (True, False, 'MPPT'), (True, True, ''), (False, False, '')])
+def test_kernels_match_computOutputResults(wdir, bank, inverter, c_type):
+    eng = build_design(SimulationEngine(wdir= wdir), bank= bank)
+    eng.run_simulation()
+    if not inverter:
+        eng.inv.set_attribute('i_mfg', '')
+    eng.chgc.set_attribute('c_type', c_type)
+    ao = eng.array_out.iloc[:Hours]
+    cols = [ao[c].values for c in ['ArrayPower', 'ArrayVolts', 'ArrayCurrent',
+                                   'AC_Load', 'DC_Load']]
+    parms = resolve_dispatch_parameters(eng.inv, eng.chgc, eng.bnk)
+    start = eng.bnk.get_dispatch_state()
+    flows = dispatch_power_flows(parms, *cols, dict(start))
+    batch = dispatch_ensemble(parms, *[np.vstack([c, c]) for c in cols[:3]],
+                              *cols[3:], dict(start))
+    old = legacy_power_flows(eng, *cols)
+    for ky in ['PO', 'PS', 'DE', 'BS', 'BD', 'BP', 'EM']:
+        assert np.array_equal(flows[ky], old[ky]), ky
+    if bank:
+        assert flows['state'] == eng.bnk.get_dispatch_state()
+        assert (flows['BS'] < 100).any()
+    for ky in ['PO', 'PS']:
+        assert np.array_equal(batch[ky], np.vstack([old[ky], old[ky]])), ky
+    usrld = cols[3] + cols[4]
+    assert np.allclose(flows['SL'], system_loads(parms, cols[3], cols[4]) -
+                       usrld if (parms['chgFlg'] or parms['invFlg']) else 0.0)
@@ -0,0 +1,48 @@
+""" Tests of the recomputation of the simulation stages after a change """
+from SPVEngine import SimulationEngine
+from conftest import build_design
+
+
+def fresh_run(wdir, cmp, attr, val):
+    """ Return a new engine run with attr of component cmp set to val """
+    eng = build_design(SimulationEngine(wdir= wdir))
+    getattr(eng, cmp).set_attribute(attr, val)
+    eng.run_simulation()
+    return eng
+
+
+def test_unchanged_design_is_not_recomputed(engine):
+    engine.run_simulation()
+    outs = engine.array_outs
+    engine.run_simulation()
+    assert engine.array_outs is outs
+
+
+def test_form_edit_of_array_recomputes_array(engine, wdir):
+    engine.run_simulation()
+    # Entry forms & table cells write the field directly
+    engine.ary.args['tilt'].write_data(35)
+    engine.run_simulation()
+    ref = fresh_run(wdir, 'ary', 'tilt', 35)
+    assert engine.array_out.equals(ref.array_out)
+    assert engine.power_flow.equals(ref.power_flow)
+
+
+def test_form_edit_of_bank_recomputes_dispatch(engine, wdir):
+    engine.run_simulation()
+    outs = engine.array_outs
+    engine.bnk.args['doc'].write_data(40.0)
+    engine.run_simulation()
+    assert engine.array_outs is outs
+    ref = fresh_run(wdir, 'bnk', 'doc', 40.0)
+    assert engine.power_flow.equals(ref.power_flow)
+    assert engine.bnk.tot_cycles == ref.bnk.tot_cycles
+
+
+def test_form_edit_of_site_location_recomputes_all(engine):
+    engine.run_simulation()
+    engine.detect_changes()
+    engine.site.args['tz'].write_data(2)
+    engine.detect_changes()
+    assert 'site' in engine.dirty_stages
+    assert 'dispatch' in engine.dirty_stages
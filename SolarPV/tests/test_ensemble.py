@@ -0,0 +1,32 @@
+""" Weather ensembles follow the module model of a simulation run """
+import numpy as np
+from SPVEnsemble import run_ensemble, summarize_ensemble
+
+
+def test_zero_variance_ensemble_reproduces_simulation(engine):
+    for stat in engine.site.atmospherics.values():
+        stat['STDV'] = 0.0
+    engine.run_simulation()
+    table = run_ensemble(engine, members= 3, seed= 4)
+    pf = engine.power_flow
+    smry = engine.get_service_summary()
+    for mbr, row in table.iterrows():
+        assert np.isclose(row['array_kwh'], pf['ArrayPower'].sum()/1000,
+                          rtol= 1e-12)
+        assert np.isclose(row['delivered_kwh'], pf['PowerOut'].sum()/1000,
+                          rtol= 1e-12)
+        assert np.isclose(row['service'], smry['service'], rtol= 1e-12)
+        assert np.isclose(row['cycles'], smry['cycles'], rtol= 1e-12)
+
+
+def test_blocks_do_not_change_results(engine):
+    whole = run_ensemble(engine, members= 4, seed= 2)
+    split = run_ensemble(engine, members= 4, seed= 2, max_bytes= 1)
+    assert whole.equals(split)
+
+
+def test_weather_spread_reaches_array_output(engine):
+    table = run_ensemble(engine, members= 20, seed= 3)
+    smry = summarize_ensemble(table)
+    assert smry.loc['std', 'array_kwh'] > 1e-3*smry.loc['mean', 'array_kwh']
+    assert smry.loc['P90', 'array_kwh'] < smry.loc['P50', 'array_kwh']
@@ -0,0 +1,21 @@
+""" The engine & batch tools must run where tkinter isn't available """
+import subprocess
+import sys
+
+from conftest import SRCDIR
+
+probe = """
+import sys
+sys.path.insert(0, {0!r})
+import SPVEngine, SPVSweep, SPVEnsemble
+gui = [m for m in ('tkinter', 'matplotlib.backends.backend_tkagg',
+                   'guiFrames', 'FormBuilder', 'PVForms') if m in sys.modules]
+print(','.join(gui))
+"""
+
+
+def test_engine_imports_without_tkinter():
+    out = subprocess.run([sys.executable, '-c', probe.format(SRCDIR)],
+                         stdout= subprocess.PIPE, stderr= subprocess.PIPE,
+                         universal_newlines= True, check= True)
+    assert out.stdout.strip() == ''
@@ -0,0 +1,10 @@
+""" Evaluating the output of one module of an array """
+import copy
+from Parameters import panel_types
+
+
+def test_module_parameters_are_not_consumed(engine):
+    before = copy.deepcopy(panel_types)
+    engine.cache_arrays = False
+    engine.run_simulation()
+    assert panel_types == before
@@ -0,0 +1,65 @@
+""" Concurrent NASA retrievals survive server errors & reuse the cache """
+import numpy as np
+import requests
+from urllib.parse import urlparse, parse_qs
+from NasaData import (LoadNasaSites, formulateRequest, build_atmospherics,
+                      set_base_url)
+from NasaStandIn import NasaStandIn, synthesize_response
+
+Sites = [(-1.29, 36.82), (6.52, 3.38), (-33.92, 18.42), (30.04, 31.24),
+         (-1.29, 36.82), (14.69, -17.45), (9.03, 38.74), (-4.04, 39.67)]
+
+
+def expected_stats(lat, lon):
+    """ The statistics built from the stand in's response for a site """
+    cmd, cols = formulateRequest(lat, lon)
+    query = parse_qs(urlparse(cmd).query)
+    return build_atmospherics(synthesize_response(query), cols)
+
+
+def check_results(sites, rslts, errors):
+    """ Each site has its statistics or an empty result & its error """
+    assert len(rslts) == len(sites)
+    for site, rslt in zip(sites, rslts):
+        if site in errors:
+            assert rslt == dict()
+            assert isinstance(errors[site], requests.exceptions.HTTPError)
+            assert errors[site].response.status_code == 503
+        else:
+            ref = expected_stats(*site).to_arrays()
+            for ky, ary in rslt.to_arrays().items():
+                assert np.array_equal(ary, ref[ky]), (site, ky)
+
+
+def test_sites_load_through_errors_then_from_cache(nasa_cache):
+    with NasaStandIn(error_rate= 0.3, seed= 5) as srv:
+        set_base_url(srv.url)
+        errors = dict()
+        rslts = LoadNasaSites(Sites, max_workers= 4, errors= errors)
+        check_results(Sites, rslts, errors)
+        assert srv.errors > 0
+        # The repeated site is requested once, each request failing at most
+        # RequestRetries times before one succeeds or the site fails
+        uniq = set(Sites)
+        assert srv.requests - srv.errors == len(uniq) - len(errors)
+        # Retrieved sites come from the cache, failed ones are requested
+        # again
+        srv.error_rate = 0.0
+        issued = srv.requests
+        again = dict()
+        rslts = LoadNasaSites(Sites, max_workers= 4, errors= again)
+        assert srv.requests - issued == len(errors)
+        assert again == dict()
+        check_results(Sites, rslts, again)
+
+
+def test_failed_sites_reported(nasa_cache, monkeypatch):
+    import NasaData
+    monkeypatch.setattr(NasaData, 'RequestRetries', 1)
+    with NasaStandIn(error_rate= 1.0) as srv:
+        set_base_url(srv.url)
+        errors = dict()
+        rslts = LoadNasaSites(Sites, max_workers= 4, errors= errors)
+        assert srv.requests == 2*len(set(Sites))
+    assert set(errors) == set(Sites)
+    check_results(Sites, rslts, errors)
@@ -0,0 +1,38 @@
+""" The NASA POWER stand in synthesizes, records & replays responses """
+import requests
+from NasaData import LoadNasaData, formulateRequest, get_daily_stat, set_base_url
+from NasaStandIn import NasaStandIn
+
+
+def test_synthetic_response_loads(nasa_cache):
+    with NasaStandIn() as srv:
+        set_base_url(srv.url)
+        north = LoadNasaData(30.0, 31.2, use_cache= False)
+        south = LoadNasaData(-30.0, 31.2, use_cache= False)
+        assert srv.requests == 2
+    for atmo in [north, south]:
+        assert sorted(atmo.keys()) == sorted(formulateRequest(0, 0)[1])
+        assert len(atmo['T10M']) == 365
+    # Synthetic seasons are reversed in the southern hemisphere
+    jul = slice(181, 212)
+    assert (get_daily_stat(north, 'T10M', 'S-Mean')[jul].mean() >
+            get_daily_stat(south, 'T10M', 'S-Mean')[jul].mean() + 5)
+
+
+def test_recorded_responses_replay(tmp_path):
+    rdir = str(tmp_path / 'recorded')
+    query = formulateRequest(-1.29, 36.82)[0].split('?', 1)[1]
+    with NasaStandIn() as upstream:
+        with NasaStandIn(mode= 'record', record_dir= rdir,
+                         upstream= upstream.url) as rec:
+            recorded = requests.get(rec.url + query)
+        assert upstream.requests == 1
+    assert recorded.status_code == 200
+    with NasaStandIn(mode= 'replay', record_dir= rdir) as rpl:
+        replayed = requests.get(rpl.url + query.replace('user=anonymous',
+                                                        'user=other'))
+        missing = requests.get(rpl.url + query.replace('lat=-1.29',
+                                                       'lat=-1.3'))
+    assert replayed.status_code == 200
+    assert replayed.content == recorded.content
+    assert missing.status_code == 404
@@ -0,0 +1,130 @@
+""" Elevation & time zone are looked up only when the site is moved """
+import threading
+import time
+import pytest
+
+
+class FakeCell:
+    def set_val(self):
+        pass
+
+
+class FakeForm:
+    wdg_dict = {'elev': FakeCell(), 'tz': FakeCell()}
+
+
+class FakeTask:
+    def cancel(self):
+        pass
+
+
+class Lookups(list):
+    """ Records the lookups, holding their callbacks until delivered """
+    def __init__(self):
+        list.__init__(self)
+        self.pending = []
+
+    def run_in_background(self, parent, command, lat, lon, callback= None):
+        self.append((lat, lon))
+        self.pending.append(lambda: callback((15.0*3, 'EAT', 1500.0 + lat),
+                                             None))
+        return FakeTask()
+
+    def deliver(self):
+        while len(self.pending) > 0:
+            self.pending.pop(0)()
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    guiFrames = pytest.importorskip('guiFrames')
+    calls = Lookups()
+    monkeypatch.setattr(guiFrames, 'run_in_background', calls.run_in_background)
+    return calls
+
+
+def test_manual_edits_kept_until_site_moves(engine, lookups):
+    site = engine.site
+    site.form = FakeForm()
+    site.retrieve_elevation('-1.5', '36.8')
+    site.retrieve_elevation('-1.5', '36.8')
+    lookups.deliver()
+    assert lookups == [(-1.5, 36.8)]
+    assert site.read_attrb('elev') == 1498.5
+    site.set_attribute('elev', 1620.0)
+    site.set_attribute('tz', 2)
+    site.retrieve_elevation('-1.5', '36.8')
+    assert len(lookups) == 1
+    assert site.read_attrb('elev') == 1620.0
+    assert site.read_attrb('tz') == 2
+    site.retrieve_elevation('-1.6', '36.8')
+    lookups.deliver()
+    assert len(lookups) == 2
+    assert site.read_attrb('elev') == 1498.4
+    assert site.read_attrb('tz') == 3
+    site.retrieve_elevation('-1.6', '36.8')
+    assert len(lookups) == 2
+
+
+@pytest.fixture
+def tk_root():
+    tkinter = pytest.importorskip('tkinter')
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        pytest.skip('no display available')
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def pump(root, done, timeout= 5.0):
+    """ Process Tk events until done() or timeout seconds have passed """
+    limit = time.time() + timeout
+    while not done() and time.time() < limit:
+        root.update()
+        time.sleep(0.01)
+
+
+def test_task_outlives_its_parent(tk_root):
+    from tkinter import Toplevel
+    from guiFrames import run_in_background
+    results = []
+    top = Toplevel(tk_root)
+    run_in_background(top, lambda x: 2*x, 21,
+                      callback= lambda r, e: results.append((r, e)))
+    top.destroy()
+    pump(tk_root, lambda: len(results) > 0)
+    assert results == [(42, None)]
+
+
+def test_closing_form_abandons_lookup(engine, tk_root, monkeypatch):
+    from tkinter import Toplevel
+    import PVSite
+    release = threading.Event()
+    calls = []
+
+    def lookup(lat, lon):
+        calls.append((lat, lon))
+        release.wait(5)
+        return (15.0*3, 'EAT', 1500.0 + lat)
+
+    monkeypatch.setattr(PVSite, 'getSiteElevation', lookup)
+    site = engine.site
+    start = (site.elev_key, site.read_attrb('elev'))
+    top = Toplevel(tk_root)
+    site.display_input_form(top)
+    site.retrieve_elevation('-1.5', '36.8')
+    top.destroy()
+    assert site.elev_task is None
+    release.set()
+    pump(tk_root, lambda: False, timeout= 0.5)
+    assert (site.elev_key, site.read_attrb('elev')) == start
+    top = Toplevel(tk_root)
+    site.display_input_form(top)
+    site.retrieve_elevation('-1.5', '36.8')
+    pump(tk_root, lambda: site.elev_task is None)
+    assert calls == [(-1.5, 36.8), (-1.5, 36.8)]
+    assert site.elev_key == (-1.5, 36.8)
+    assert site.read_attrb('elev') == 1498.5
+    top.destroy()
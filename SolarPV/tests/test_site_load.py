@@ -0,0 +1,92 @@
+""" The load profile reproduces the hourly row loop it replaced """
+import numpy as np
+import pytest
+from SiteLoad import SiteLoad
+
+# Type, Qty, Use Factor, Hours, Start Hour, Watts, Mode
+Rows = [['Light, LED', 15, 0.30, '', '', 5.0, 'AC'],
+        ['Light, LED', 8, 0.85, 2.5, 6, 5.0, 'AC'],
+        ['Well Pump DC, 1 HP', 1, 0.35, 0.5, 12, 500.0, 'DC'],
+        ['Phone Charger', 10, 0.45, 5.5, 22, 2.0, 'DC'],
+        ['Refrigerator, 18 cf', 2, 0.6, 24, 0, 125.0, 'AC'],
+        ['TV LCD', 3, 0.9, 1, 23, 25.0, 'AC'],
+        ['Fan', 2, 0.5, 30, 20, 40.0, 'AC'],
+        ['Radio', 1, 1.0, 0, 9, 10.0, 'DC'],
+        ['Heater', 1, 0.7, 2.25, '', 800.0, 'AC'],
+        ['Router', 1, 1.0, None, 4, 12.0, 'DC'],
+        ['Laptop', 2, 0.8, 3.75, 21, 60.0, 'DC']]
+
+
+def legacy_load_profile(load):
+    """ The hourly row loop of get_load_profile used before the
+        difference array """
+    ac_rslt = np.zeros(24)
+    dc_rslt = np.zeros(24)
+    for r in range(load.get_row_count()):
+        typ, qty, uf, hpd, st, wts, mode = load.get_row_by_index(r)
+        hr_wts = qty*uf*wts
+        if type(st) is str or st is None:
+            st = 0
+        if type(hpd) is str or hpd is None:
+            hpd = 24
+        et = hpd + st
+        rslt = dc_rslt if mode == 'DC' else ac_rslt
+        for h in range(24):
+            if et < 24:
+                if h >= st and h < et:
+                    rslt[h] += hr_wts
+            elif h >= st or h + 24 < et:
+                rslt[h] += hr_wts
+    return ac_rslt, dc_rslt
+
+
+def check_profile(load):
+    prof = load.get_load_profile()
+    ac, dc = legacy_load_profile(load)
+    for col, old in [('AC', ac), ('DC', dc), ('Total', ac + dc)]:
+        assert np.allclose(prof[col], old, rtol= 1e-12, atol= 0), col
+        assert ((prof[col] == 0) == (old == 0)).all(), col
+    return prof
+
+
+def test_profile_matches_row_loop():
+    load = SiteLoad()
+    load.add_rows(Rows)
+    prof = check_profile(load)
+    assert (prof['AC'] > 0).all()
+    assert prof['DC'].iloc[12] > prof['DC'].iloc[13] > 0
+
+
+def test_random_rows_match_row_loop():
+    rng = np.random.RandomState(7)
+    load = SiteLoad()
+    for r in range(200):
+        hrs = [round(rng.uniform(0, 30), 2), '', None,
+               int(rng.randint(0, 25))][r % 4]
+        st = ['', None, int(rng.randint(0, 24))][min(r % 5, 2)]
+        load.add_new_row(['Load', int(rng.randint(1, 5)), rng.rand(), hrs, st,
+                          rng.uniform(1, 500), ['AC', 'DC'][r % 2]])
+    check_profile(load)
+
+
+@pytest.mark.parametrize('change', ['set_cell_value', 'delete_row',
+                                    'purge_frame'])
+def test_profile_follows_frame_changes(change):
+    load = SiteLoad()
+    load.add_rows(Rows)
+    before = check_profile(load)
+    # The cached profile is returned as a copy
+    load.get_load_profile().loc[:, 'AC'] = -1.0
+    assert load.get_load_profile().equals(before)
+    if change == 'set_cell_value':
+        load.set_cell_value([1, load.get_col_indx('Watts')], 50.0)
+    elif change == 'delete_row':
+        load.delete_row(4)
+    else:
+        load.purge_frame()
+    after = check_profile(load)
+    assert not after.equals(before)
+    if change == 'purge_frame':
+        assert (after.values == 0).all()
+        load.add_rows(Rows[:2])
+        check_profile(load)
@@ -0,0 +1,61 @@
+""" An interrupted sweep resumes with the variants it had not finished """
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import pytest
+import SPVSweep
+
+Grid = {'tilt': [10, 20], 'sip': [2, 3, 4]}
+
+
+@pytest.fixture
+def project(engine, wdir):
+    fn = os.path.join(wdir, 'project.spv')
+    engine.write_file(fn)
+    return fn
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """ The variant indices submitted for evaluation """
+    indices = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            indices.append(args[0])
+            return ProcessPoolExecutor.submit(self, fn, *args, **kwargs)
+
+    monkeypatch.setattr(SPVSweep, 'ProcessPoolExecutor', RecordingExecutor)
+    return indices
+
+
+@pytest.mark.parametrize('cut', ['row', 'mid_row'])
+def test_resume_runs_missing_variants(project, wdir, submitted, cut):
+    whole_fn = os.path.join(wdir, 'whole.csv')
+    whole = SPVSweep.run_sweep(project, Grid, whole_fn, max_workers= 1,
+                               wdir= wdir)
+    assert sorted(submitted) == list(range(6))
+    assert (whole['status'] == 'ok').all()
+    assert whole['array_kwh'].nunique() == 6
+    with open(whole_fn) as fi:
+        lines = fi.readlines()
+    # The header & the first two variants completed, the third was being
+    # written when the sweep stopped
+    prefix = ''.join(lines[:3])
+    if cut == 'mid_row':
+        prefix += lines[3][:len(lines[3])//2]
+    part_fn = os.path.join(wdir, 'part.csv')
+    with open(part_fn, 'w') as fo:
+        fo.write(prefix)
+    del submitted[:]
+    resumed = SPVSweep.run_sweep(project, Grid, part_fn, max_workers= 1,
+                                 wdir= wdir)
+    assert sorted(submitted) == [2, 3, 4, 5]
+    assert resumed.equals(whole)
+    assert resumed['variant'].tolist() == list(range(6))
+    assert pd.read_csv(part_fn).equals(pd.read_csv(whole_fn))
+    del submitted[:]
+    again = SPVSweep.run_sweep(project, Grid, part_fn, max_workers= 1,
+                               wdir= wdir)
+    assert submitted == []
+    assert again.equals(whole)
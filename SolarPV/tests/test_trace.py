@@ -0,0 +1,62 @@
+""" Trace files read back as the power flows of the simulation run """
+import numpy as np
+import pytest
+from PVTrace import TraceWriter, read_trace, trace_columns
+
+# Trace columns & the power_flow columns holding the same values
+flow_columns = {'PO': 'PowerOut', 'PS': 'Service', 'DE': 'DelvrEff',
+                'BS': 'BatSoc', 'BD': 'BatDrain', 'BP': 'BatPwr',
+                'acLd': 'AC_Load', 'dcLd': 'DC_Load'}
+
+# Absolute tolerance of the values written by each format
+tolerance = {'text': 0.006, 'csv': 0.0, 'binary': 0.0}
+
+
+@pytest.mark.parametrize('fmt, sample', [('text', 1), ('csv', 1),
+                                         ('binary', 1), ('binary', 5)])
+def test_trace_matches_power_flow(engine, monkeypatch, fmt, sample):
+    traced = dict()
+    write_trace = engine.write_trace
+
+    def keep_trace(cols):
+        traced.update(cols)
+        write_trace(cols)
+
+    monkeypatch.setattr(engine, 'write_trace', keep_trace)
+    engine.perf_rept = True
+    engine.trace_format = fmt
+    engine.trace_sample = sample
+    engine.run_simulation()
+    trc = read_trace(engine.outfile)
+    pf = engine.power_flow.iloc[::sample]
+    # A full year spans many of the 24*31 hour blocks written at once
+    assert len(engine.power_flow) > 24*31*2
+    assert np.array_equal(trc['Indx'], np.arange(0, len(engine.power_flow),
+                                                 sample))
+    cols = dict(flow_columns, ArP= 'ArrayPower')
+    for tc, fc in cols.items():
+        assert np.allclose(trc[tc], pf[fc], rtol= 1e-5 if fmt == 'csv' else 0,
+                           atol= tolerance[fmt]), tc
+    assert np.allclose(trc['SL'], traced['SL'][::sample],
+                       rtol= 1e-5 if fmt == 'csv' else 0, atol= tolerance[fmt])
+    assert np.allclose(trc['ttLd'], pf['AC_Load'] + pf['DC_Load'],
+                       rtol= 1e-5, atol= tolerance[fmt])
+    if fmt == 'binary':
+        assert list(trc.columns) == [c for c in trace_columns if c != 'EM']
+    else:
+        assert list(trc.columns) == trace_columns
+        assert trc['EM'].tolist() == list(traced['EM'][::sample])
+
+
+def test_writer_selects_columns(tmp_path):
+    fn = str(tmp_path / 'trace.csv')
+    block = {'ArP': np.array([1.5, 2.5, 3.5]), 'dcLd': np.zeros(3),
+             'acLd': np.ones(3), 'EM': np.array(['', 'a, "b"', ''])}
+    with TraceWriter(fn, 'csv', ['EM', 'Indx', 'ArP']) as trc:
+        trc.write_block(0, block)
+        trc.write_block(3, block)
+    df = read_trace(fn)
+    assert list(df.columns) == ['Indx', 'ArP', 'EM']
+    assert df['Indx'].tolist() == list(range(6))
+    assert df['ArP'].tolist() == [1.5, 2.5, 3.5]*2
+    assert df['EM'].tolist() == ['', 'a, "b"', '']*2